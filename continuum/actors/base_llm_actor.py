@@ -1,6 +1,8 @@
 # continuum/actors/base_llm_actor.py
 from continuum.core.logger import log_debug, log_error
-import os
+from continuum.actors.prompt_repository import prompt_repository
+from continuum.core.tracing import current_span
+from continuum.llm.prompt_budget import context_window_for, prompt_builder
 
 
 class BaseLLMActor:
@@ -23,18 +25,18 @@ class BaseLLMActor:
         self.controller = controller
 
     # ---------------------------------------------------------
-    # Load persona prompt from /actors/prompts/
+    # Persona prompt from /actors/prompts/ (cached, hot-reloaded)
     # ---------------------------------------------------------
     def load_persona_prompt(self):
-        base = os.path.join(os.path.dirname(__file__), "prompts")
-        path = os.path.join(base, self.prompt_file)
-
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception as e:
+            return prompt_repository.text(self.prompt_file)
+        except KeyError as e:
             return f"[ERROR: could not load persona prompt {self.prompt_file}: {e}]"
 
+    def persona_prompt_hash(self) -> str:
+        """Content hash of this actor's persona prompt (cache key)."""
+        return prompt_repository.content_hash(self.prompt_file)
+
     # ---------------------------------------------------------
     # Modernized LLM execution (Router-driven)
     # ---------------------------------------------------------
@@ -112,41 +114,48 @@ class BaseLLMActor:
         persona_prompt = self.load_persona_prompt()
 
         # ---------------------------------------------------------
-        # 3. Build final prompt
+        # 3. Build final prompt within the model's context window
+        #    (system + persona + memory + as much recent history as fits)
         # ---------------------------------------------------------
-        prompt = (
-            f"{self.system_prompt}\n\n"
-            f"{persona_prompt}\n\n"
-            f"User: {message}"
+        built = prompt_builder.build(
+            system_prompt=self.system_prompt,
+            persona_prompt=persona_prompt,
+            message=message,
+            history=getattr(context, "messages", None),
+            memory=(
+                context.get_memory_summary()
+                if hasattr(context, "get_memory_summary")
+                else None
+            ),
+            context_window=context_window_for(
+                getattr(controller, "registry", None), model_name
+            ),
+            max_output_tokens=max_tokens,
+        )
+        prompt = built.text
+        current_span().set(
+            prompt_tokens=built.tokens,
+            prompt_budget=built.budget,
+            history_messages=built.history_messages,
         )
 
         # ---------------------------------------------------------
-        # 4. Override LLMClient endpoint
+        # 4. Execute LLM call (the endpoint is passed per call: the
+        #    client is shared by every session in the process)
         # ---------------------------------------------------------
-        original_endpoint = controller.llm_client.endpoint
-        controller.llm_client.endpoint = endpoint
-
         log_debug(
             f"[ACTOR EXECUTION] {self.name} using model={model_name} endpoint={endpoint}",
             phase="actors"
         )
 
-        # ---------------------------------------------------------
-        # 5. Execute LLM call
-        # ---------------------------------------------------------
-        try:
-            response = controller.llm_client.generate(
-                prompt=prompt,
-                model=model_name,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                endpoint=endpoint,   # ⭐ ADD THIS
-            )
-        finally:
-            # Restore original endpoint
-            controller.llm_client.endpoint = original_endpoint
-
-        return response
+        return controller.llm_client.generate(
+            prompt=prompt,
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            endpoint=endpoint,
+            node_id=node.get("id"),
+        )
 
     # ---------------------------------------------------------
     # respond() used by Fusion
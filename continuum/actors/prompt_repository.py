@@ -0,0 +1,183 @@
+# continuum/actors/prompt_repository.py
+
+"""
+In-memory repository of the prompt templates in actors/prompts/.
+
+All templates are read once and kept with their content hash and token
+count. Lookups cost a dict access; at most every `check_interval`
+seconds a lookup also stats the directory and reloads any file whose
+mtime changed (edits, new files, deletions). reload() forces a full
+reload, e.g. from an admin action.
+
+Names resolve loosely: "analyst", "analyst.txt" and "analyst_prompt.txt"
+all refer to actors/prompts/analyst_prompt.txt.
+
+The per-template sha256 (and the combined content_hash()) change only
+when prompt text changes, so downstream caches - and the prompt prefix
+handed to the model server - can key on them.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from continuum.core.logger import log_error, log_info
+from continuum.llm.prompt_budget import token_counter
+from continuum.monitoring.metrics import CACHE_RELOADS_TOTAL, CACHE_REQUESTS_TOTAL
+
+PROMPT_DIR = os.path.join(os.path.dirname(__file__), "prompts")
+PROMPT_SUFFIX = "_prompt.txt"
+CHECK_INTERVAL = 2.0
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str          # canonical name: "analyst"
+    path: str
+    text: str
+    sha256: str
+    mtime_ns: int
+    tokens: int
+
+
+def _canonical(name: str) -> str:
+    base = os.path.basename(name)
+    if base.endswith(PROMPT_SUFFIX):
+        return base[: -len(PROMPT_SUFFIX)]
+    if base.endswith(".txt"):
+        return base[:-4]
+    return base
+
+
+class PromptRepository:
+    def __init__(
+        self, directory: str = PROMPT_DIR, check_interval: float = CHECK_INTERVAL
+    ):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self.reload()
+
+    # -----------------------------------------------------
+    # Loading
+    # -----------------------------------------------------
+    def _load_file(self, path: str, mtime_ns: int) -> PromptTemplate:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read().strip()
+        return PromptTemplate(
+            name=_canonical(path),
+            path=path,
+            text=text,
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            mtime_ns=mtime_ns,
+            tokens=token_counter.count(text),
+        )
+
+    def _scan(self) -> Dict[str, int]:
+        """path -> mtime_ns for every template file in the directory."""
+        found = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".txt"):
+                        found[entry.path] = entry.stat().st_mtime_ns
+        except OSError as e:
+            log_error(
+                "[PROMPTS] Cannot scan %s: %s", self.directory, e, phase="prompts"
+            )
+        return found
+
+    def _refresh(self, force: bool) -> List[str]:
+        """Reload changed/new files and drop deleted ones (caller holds the lock)."""
+        current = {t.path: t for t in self._templates.values()}
+        updated: Dict[str, PromptTemplate] = {}
+        changed: List[str] = []
+
+        for path, mtime_ns in self._scan().items():
+            old = current.get(path)
+            if old is not None and old.mtime_ns == mtime_ns and not force:
+                updated[old.name] = old
+                continue
+            try:
+                template = self._load_file(path, mtime_ns)
+            except OSError as e:
+                log_error(
+                    "[PROMPTS] Failed to load %s: %s", path, e, phase="prompts"
+                )
+                if old is not None:
+                    updated[old.name] = old
+                continue
+            updated[template.name] = template
+            if old is None or old.sha256 != template.sha256:
+                changed.append(template.name)
+
+        removed = set(t.name for t in self._templates.values()) - set(updated)
+        changed.extend(sorted(removed))
+
+        self._templates = updated
+        self._last_check = time.monotonic()
+        return changed
+
+    def reload(self) -> List[str]:
+        """Force a full reload; returns the names whose content changed."""
+        with self._lock:
+            changed = self._refresh(force=True)
+        CACHE_RELOADS_TOTAL.labels(cache="prompts").inc()
+        log_info(
+            "[PROMPTS] Loaded %d templates from %s (changed: %s)",
+            len(self._templates),
+            self.directory,
+            ", ".join(changed) or "none",
+            phase="prompts",
+        )
+        return changed
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_check < self.check_interval:
+                return
+            changed = self._refresh(force=False)
+        if changed:
+            CACHE_RELOADS_TOTAL.labels(cache="prompts").inc()
+            log_info("[PROMPTS] Hot-reloaded: %s", ", ".join(changed), phase="prompts")
+
+    # -----------------------------------------------------
+    # Lookups
+    # -----------------------------------------------------
+    def get(self, name: str) -> PromptTemplate:
+        """Template by (loose) name; raises KeyError if there is none."""
+        self._maybe_refresh()
+        template = self._templates.get(_canonical(name))
+        if template is None:
+            CACHE_REQUESTS_TOTAL.labels(cache="prompts", result="miss").inc()
+            raise KeyError(f"No prompt template '{name}' in {self.directory}")
+        CACHE_REQUESTS_TOTAL.labels(cache="prompts", result="hit").inc()
+        return template
+
+    def text(self, name: str) -> str:
+        return self.get(name).text
+
+    def names(self) -> List[str]:
+        self._maybe_refresh()
+        return sorted(self._templates)
+
+    def content_hash(self, name: Optional[str] = None) -> str:
+        """sha256 of one template, or a combined hash over all of them."""
+        if name is not None:
+            return self.get(name).sha256
+        self._maybe_refresh()
+        combined = hashlib.sha256()
+        for key in sorted(self._templates):
+            combined.update(key.encode("utf-8"))
+            combined.update(self._templates[key].sha256.encode("ascii"))
+        return combined.hexdigest()
+
+
+prompt_repository = PromptRepository()
@@ -1,6 +1,8 @@
 # aira/polish.py
 
 from continuum.core.logger import log_debug, log_error
+from continuum.core.tracing import traced
+from continuum.monitoring.metrics import AIRA_POLISH_TOTAL
 
 
 def build_polish_prompt(text: str) -> str:
@@ -27,6 +29,7 @@ Polish the following text:
 """
 
 
+@traced("aira.micro_polish")
 def micro_polish(
     llm_client,
     model: str,
@@ -45,6 +48,7 @@ def micro_polish(
 
     if not isinstance(text, str) or not text.strip():
         log_error("[AIRA] micro_polish received empty text")
+        AIRA_POLISH_TOTAL.labels(outcome="skipped").inc()
         return text
 
     prompt = build_polish_prompt(text)
@@ -64,11 +68,13 @@ def micro_polish(
 
         if not rewritten:
             log_error("[AIRA] micro_polish returned empty output, keeping original")
+            AIRA_POLISH_TOTAL.labels(outcome="error").inc()
             return text
 
         polished = rewritten.strip()
         if not polished:
             log_error("[AIRA] micro_polish returned whitespace, keeping original")
+            AIRA_POLISH_TOTAL.labels(outcome="error").inc()
             return text
 
         log_debug(
@@ -76,8 +82,10 @@ def micro_polish(
             f"original_len={len(text)}, polished_len={len(polished)}"
         )
 
+        AIRA_POLISH_TOTAL.labels(outcome="ok").inc()
         return polished
 
     except Exception as e:
         log_error(f"[AIRA] Error during micro‑polish: {e}")
+        AIRA_POLISH_TOTAL.labels(outcome="error").inc()
         return text
\ No newline at end of file
@@ -1,6 +1,13 @@
 # continuum/aira/rewrite_loop.py
 
+import time
+
 from continuum.core.logger import log_debug, log_error
+from continuum.core.tracing import span, traced
+from continuum.monitoring.metrics import (
+    AIRA_REWRITE_DURATION,
+    AIRA_REWRITE_PASSES_TOTAL,
+)
 
 from continuum.aira.rewrite_pass import rewrite_pass
 from continuum.aira.diff import compute_diff, should_stop_early
@@ -10,6 +17,7 @@ from continuum.aira.safety import (
 )
 
 
+@traced("aira.rewrite_loop")
 def rewrite_loop(
     llm_client,
     model: str,
@@ -43,24 +51,27 @@ def rewrite_loop(
     )
 
     current_text = base_text
+    start = time.perf_counter()
 
     for pass_index in range(max_rewrite_depth):
         log_debug(f"[AIRA] ---- Rewrite pass {pass_index} ----")
 
-        rewritten = rewrite_pass(
-            llm_client=llm_client,
-            model=model,
-            endpoint=endpoint,
-            text_to_rewrite=current_text,
-            memory_summary=memory_summary,
-            emotion_label=emotion_label,
-            base_temperature=base_temperature,
-            max_tokens=max_tokens,
-            pass_index=pass_index,
-        )
+        with span("aira.rewrite_pass", pass_index=pass_index, model=model):
+            rewritten = rewrite_pass(
+                llm_client=llm_client,
+                model=model,
+                endpoint=endpoint,
+                text_to_rewrite=current_text,
+                memory_summary=memory_summary,
+                emotion_label=emotion_label,
+                base_temperature=base_temperature,
+                max_tokens=max_tokens,
+                pass_index=pass_index,
+            )
 
         if not rewritten:
             log_error(f"[AIRA] Rewrite pass {pass_index} returned None, stopping early")
+            AIRA_REWRITE_PASSES_TOTAL.labels(outcome="empty").inc()
             break
 
         # Safety: clamp runaway length
@@ -75,11 +86,15 @@ def rewrite_loop(
         # Early stop if rewrite changed very little
         if should_stop_early(current_text, rewritten, threshold=early_stop_threshold):
             log_debug(f"[AIRA] Early stop triggered at pass {pass_index}")
+            AIRA_REWRITE_PASSES_TOTAL.labels(outcome="early_stop").inc()
             current_text = rewritten
             break
 
+        AIRA_REWRITE_PASSES_TOTAL.labels(outcome="ok").inc()
         current_text = rewritten
 
+    AIRA_REWRITE_DURATION.observe(time.perf_counter() - start)
+
     log_debug(
         f"[AIRA] Rewrite loop complete. Final length={len(current_text)}, "
         f"original_length={len(base_text)}"
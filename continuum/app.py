@@ -8,14 +8,8 @@ from continuum.actors.base_actor import BaseActor
 from continuum.config.personas import ACTOR_PROFILES
 import uuid
 
-# 1. Create backend
-backend = MySQLMemoryBackend(
-    host="localhost",
-    port=3306,
-    user="hal",
-    password="Hal@2025!",
-    database="continuum",
-)
+# 1. Create backend (shared pooled engine; configure via CONTINUUM_DB_* env vars)
+backend = MySQLMemoryBackend()
 backend.ensure_schema()
 
 # 2. Create memory layers
@@ -0,0 +1,5 @@
+# continuum/bench/__init__.py
+"""
+Offline benchmarks for The Continuum.
+Each module is runnable with `python -m continuum.bench.<name>`.
+"""
@@ -0,0 +1,130 @@
+# continuum/bench/bench_embedding_store.py
+"""
+Open/search cost of a memory-mapped EmbeddingStore vs. embeddings kept
+as JSON lists.
+
+For each size N (dim 384, float16 by default) the bench writes N
+vectors to a fresh store in a temporary directory, closes it, and then
+times:
+  - append throughput (vectors/s)
+  - reopening the store (files are in the page cache, so this is the
+    sidecar parse plus mmap, not disk reads)
+  - exact and IVF search through VectorIndex on the reopened store
+    (the first IVF search includes training)
+  - loading the same vectors from a JSON file of lists, for reference
+    (--json-max caps the size this is attempted at)
+
+Usage:
+    python -m continuum.bench.bench_embedding_store
+    python -m continuum.bench.bench_embedding_store \
+        --sizes 100000,1000000 --dtype float32
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1e3
+
+
+def bench_size(n: int, args, workdir: str) -> None:
+    from continuum.memory.embedding_store import EmbeddingStore
+    from continuum.memory.vector_index import VectorIndex
+
+    rng = np.random.default_rng(args.seed)
+    path = os.path.join(workdir, f"store_{n}")
+    store = EmbeddingStore(path, dim=args.dim, dtype=args.dtype)
+
+    t0 = time.perf_counter()
+    for start in range(0, n, args.batch):
+        count = min(args.batch, n - start)
+        vectors = rng.standard_normal((count, args.dim)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        store.append([f"episode:{i}" for i in range(start, start + count)], vectors)
+    store.close()
+    append_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = VectorIndex(
+        dim=args.dim, ivf_threshold=args.ivf_threshold, store=EmbeddingStore(path)
+    )
+    open_ms = _ms(t0)
+
+    queries = [
+        np.asarray(index._data[i], dtype=np.float32)
+        for i in rng.integers(0, n, size=args.queries)
+    ]
+    exact = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q, 10, exact=True)
+        exact.append(_ms(t0))
+
+    t0 = time.perf_counter()
+    index.search(queries[0], 10)
+    first_ms = _ms(t0)
+    ivf = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q, 10)
+        ivf.append(_ms(t0))
+
+    disk_mib = store.nbytes_on_disk / 2**20
+    print(f"\nN = {n:,} x {args.dim} {args.dtype}  ({disk_mib:,.0f} MiB on disk)")
+    print(f"  append            {n / append_s:12,.0f} vectors/s")
+    print(f"  open              {open_ms:12.1f} ms")
+    print(f"  search exact      {statistics.median(exact):12.2f} ms median")
+    print(
+        f"  search {index.mode:<10} {statistics.median(ivf):12.2f} ms median "
+        f"(first, with training: {first_ms:,.0f} ms)"
+    )
+
+    if n <= args.json_max:
+        json_path = os.path.join(workdir, f"vectors_{n}.json")
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    key: index._data[row].astype(float).tolist()
+                    for key, row in index._rows.items()
+                },
+                f,
+            )
+        t0 = time.perf_counter()
+        with open(json_path) as f:
+            loaded = json.load(f)
+        VectorIndex(dim=args.dim, ivf_threshold=n + 1, initial_capacity=n).add_many(
+            list(loaded), np.asarray(list(loaded.values()), dtype=np.float32)
+        )
+        print(f"  JSON load + index {_ms(t0):12.1f} ms")
+        os.remove(json_path)
+
+    index._store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dtype", default="float16", choices=["float16", "float32"])
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--ivf-threshold", type=int, default=50_000)
+    parser.add_argument("--json-max", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in (int(s) for s in args.sizes.split(",") if s.strip()):
+            bench_size(n, args, workdir)
+
+
+if __name__ == "__main__":
+    main()
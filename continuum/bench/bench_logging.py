@@ -0,0 +1,139 @@
+# continuum/bench/bench_logging.py
+"""
+Benchmark caller-side logging overhead for one simulated turn.
+
+A turn is modelled on the Senate/Jury/controller call pattern:
+trace banners, per-actor proposal dumps, ranked-list dumps and the
+final proposal. Two call styles are timed:
+
+  eager  - f-string messages, banners at ERROR (the pre-queue style)
+  lazy   - %-args, debug_enabled() guards, banners at DEBUG
+
+Logs are written to a temporary directory, stderr is discarded.
+
+Usage:
+    python -m continuum.bench.bench_logging --turns 200 --level DEBUG
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def _make_proposals(n_actors: int, size: int):
+    return [
+        {
+            "actor": f"actor_{i}",
+            "content": "lorem ipsum " * (size // 12),
+            "confidence": 0.5 + i / 100,
+            "metadata": {"model": "llama3.2:latest", "tokens": size // 4},
+        }
+        for i in range(n_actors)
+    ]
+
+
+def _turn_eager(log, proposals):
+    log.log_error(
+        "🔥 ENTERED controller_process.process_message() 🔥", phase="controller"
+    )
+    log.log_error("🔥🔥🔥 ENTERED gather_proposals() 🔥🔥🔥", phase="senate")
+    for p in proposals:
+        log.log_debug(f"[SENATE] Raw proposal from {p['actor']}: {p}", phase="senate")
+        log.log_error(
+            f"[FORENSICS] Senate received proposal type={type(p)} value={repr(p)}",
+            phase="senate",
+        )
+    log.log_error(
+        f"🔥🔥🔥 gather_proposals() COMPLETE — {len(proposals)} proposals 🔥🔥🔥",
+        phase="senate",
+    )
+    log.log_debug(f"[SENATE] Ranked proposals (top first): {proposals}", phase="senate")
+    log.log_debug(f"[SENATE] Final ranked list: {proposals}", phase="senate")
+    log.log_debug(f"[DELIB] Ranked proposals dump: {proposals}", phase="senate")
+    log.log_error("🔥🔥🔥 CALLING JURY.adjudicate() 🔥🔥🔥", phase="jury")
+    log.log_debug(f"[DELIB] Jury final proposal: {proposals[0]}", phase="jury")
+    log.log_error("🔥 CALLING FUSION RUN 🔥", phase="fusion")
+    log.log_error("🔥 CALLING META‑PERSONA REWRITE 🔥", phase="meta")
+
+
+def _turn_lazy(log, proposals):
+    log.log_debug(
+        "🔥 ENTERED controller_process.process_message() 🔥", phase="controller"
+    )
+    log.log_debug("🔥🔥🔥 ENTERED gather_proposals() 🔥🔥🔥", phase="senate")
+    for p in proposals:
+        log.log_debug(
+            "[SENATE] Raw proposal from %s: %r", p["actor"], p, phase="senate"
+        )
+    log.log_debug(
+        "🔥🔥🔥 gather_proposals() COMPLETE — %d proposals 🔥🔥🔥",
+        len(proposals),
+        phase="senate",
+    )
+    if log.debug_enabled():
+        log.log_debug(
+            "[SENATE] Ranked proposals (top first): %r", proposals, phase="senate"
+        )
+        log.log_debug("[SENATE] Final ranked list: %r", proposals, phase="senate")
+        log.log_debug("[DELIB] Ranked proposals dump: %r", proposals, phase="senate")
+    log.log_debug("🔥🔥🔥 CALLING JURY.adjudicate() 🔥🔥🔥", phase="jury")
+    log.log_debug("[DELIB] Jury final proposal: %r", proposals[0], phase="jury")
+    log.log_debug("🔥 CALLING FUSION RUN 🔥", phase="fusion")
+    log.log_debug("🔥 CALLING META‑PERSONA REWRITE 🔥", phase="meta")
+
+
+def _time(turn, log, proposals, turns):
+    samples = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        turn(log, proposals)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<8} mean={statistics.mean(samples):7.3f} ms  "
+        f"p50={statistics.median(samples):7.3f} ms  p95={p95:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--actors", type=int, default=5)
+    parser.add_argument("--proposal-bytes", type=int, default=2000)
+    parser.add_argument("--level", default="DEBUG")
+    args = parser.parse_args()
+
+    # The logger picks its paths and level up at import time
+    os.chdir(tempfile.mkdtemp(prefix="continuum-bench-log-"))
+    os.environ["CONTINUUM_LOG_LEVEL"] = args.level
+    sys.stderr = open(os.devnull, "w", encoding="utf-8")
+
+    from continuum.core import logger as log
+
+    proposals = _make_proposals(args.actors, args.proposal_bytes)
+    _time(_turn_eager, log, proposals, 10)  # warm up
+
+    print(
+        f"turns={args.turns} actors={args.actors} level={args.level} "
+        "(caller-side time per turn)"
+    )
+    _report("eager", _time(_turn_eager, log, proposals, args.turns))
+    _report("lazy", _time(_turn_lazy, log, proposals, args.turns))
+
+    start = time.perf_counter()
+    if hasattr(log, "flush_logs"):
+        log.flush_logs()
+    drain_ms = (time.perf_counter() - start) * 1000
+    print(f"drain    {drain_ms:.1f} ms to write queued records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# continuum/bench/bench_memory_backend.py
+"""
+Episode write throughput: buffered MySQLMemoryBackend vs. one INSERT
+(and one transaction) per episode, the way add_episode used to write.
+
+Runs against CONTINUUM_DB_URL when set (point it at a scratch MySQL
+database), otherwise against a temporary SQLite file. Both tables are
+dropped and recreated before each run.
+
+Reports episodes/s for each writer and the latency of
+recent_episodes() on the filled table.
+
+Usage:
+    python -m continuum.bench.bench_memory_backend
+    python -m continuum.bench.bench_memory_backend --episodes 20000 --flush-size 200
+    CONTINUUM_DB_URL=mysql+pymysql://user:pw@host/scratch \
+        python -m continuum.bench.bench_memory_backend
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+
+def _episode(i: int):
+    return {
+        "content": (
+            f"episode {i}: the user talked about their morning walk "
+            "and a project deadline"
+        ),
+        "metadata": {"turn": i, "source": "bench", "emotion": "calm"},
+    }
+
+
+def _reset(engine) -> None:
+    from continuum.memory.mysql_backend import metadata
+
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+
+def bench_legacy(engine, n: int) -> float:
+    from continuum.memory.mysql_backend import episodic_memory
+
+    _reset(engine)
+    t0 = time.perf_counter()
+    for i in range(n):
+        with engine.begin() as conn:
+            conn.execute(episodic_memory.insert().values(**_episode(i)))
+    return n / (time.perf_counter() - t0)
+
+
+def bench_buffered(engine, n: int, flush_size: int) -> float:
+    from continuum.memory.mysql_backend import MySQLMemoryBackend
+
+    _reset(engine)
+    backend = MySQLMemoryBackend(engine=engine, flush_size=flush_size, flush_interval=0)
+    t0 = time.perf_counter()
+    for i in range(n):
+        backend.add_episode(_episode(i))
+    backend.flush()
+    return n / (time.perf_counter() - t0)
+
+
+def bench_recent(engine, repeat: int = 200):
+    from continuum.memory.mysql_backend import MySQLMemoryBackend
+
+    backend = MySQLMemoryBackend(engine=engine, flush_interval=0)
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        backend.recent_episodes(5)
+        samples.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--episodes", type=int, default=5000)
+    parser.add_argument("--flush-size", type=int, default=100)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    tmpdir = None
+    if not os.getenv("CONTINUUM_DB_URL"):
+        tmpdir = tempfile.TemporaryDirectory()
+        os.environ["CONTINUUM_DB_URL"] = (
+            f"sqlite:///{os.path.join(tmpdir.name, 'bench_memory.db')}"
+        )
+
+    from continuum.db.sqlalchemy_connection import get_engine
+
+    engine = get_engine()
+    url = engine.url.render_as_string(hide_password=True)
+    print(f"\n{url}, {args.episodes:,} episodes")
+
+    legacy = bench_legacy(engine, args.episodes)
+    print(f"  {'per-episode INSERT':<28}{legacy:12,.0f} episodes/s")
+
+    buffered = bench_buffered(engine, args.episodes, args.flush_size)
+    label = f"buffered (flush_size={args.flush_size})"
+    print(
+        f"  {label:<28}{buffered:12,.0f} episodes/s   ({buffered / legacy:.1f}x)"
+    )
+
+    median, worst = bench_recent(engine)
+    print(f"  {'recent_episodes(5)':<28}{median:12.2f} ms median, {worst:.2f} ms max")
+
+    engine.dispose()
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# continuum/bench/bench_memory_search.py
+"""
+ContinuumMemory.search at scale: inverted index vs. the linear scan it
+replaced.
+
+Fills a ContinuumMemory with N synthetic memories (keys like
+"note:1234", values of 8–40 words drawn from a Zipf distribution), then
+times per query:
+  - single term, rare and common
+  - multi-term AND
+  - prefix ("search-as-you-type" fragments)
+  - the old substring scan over every record, for reference
+
+Also reports add throughput, overwrite cost and the index footprint.
+
+Usage:
+    python -m continuum.bench.bench_memory_search
+    python -m continuum.bench.bench_memory_search --records 10000,100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+_WORDS = (
+    "tea coffee morning evening walk dog cat garden music piano guitar book "
+    "novel poem project deadline meeting family sister brother mother father "
+    "travel paris tokyo lisbon mountain river ocean rain snow summer winter "
+    "recipe bread pasta curry running cycling swimming sleep dream anxiety "
+    "calm focus goal habit journal gratitude friend birthday anniversary"
+).split()
+
+
+def _vocabulary(rng: random.Random, size: int = 20_000):
+    """Common words plus a long tail of synthetic ones (names, places, jargon)."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    tail = {
+        "".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+        for _ in range(size)
+    }
+    words = _WORDS + sorted(tail)
+    # Zipf (s = 1): the i-th word is drawn with weight 1 / (i + 1)
+    cum_weights, total = [], 0.0
+    for i in range(len(words)):
+        total += 1.0 / (i + 1)
+        cum_weights.append(total)
+    return words, cum_weights
+
+
+def _make_value(rng: random.Random, vocab) -> str:
+    words, cum_weights = vocab
+    return " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(8, 40)))
+
+
+def _time(fn, queries, repeat: int = 1):
+    samples = []
+    for q in queries:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(q)
+            samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples), max(samples)
+
+
+def _linear_scan(store, query: str):
+    query_lower = query.lower()
+    return [
+        record
+        for record in store.values()
+        if query_lower in record.key.lower() or query_lower in str(record.value).lower()
+    ]
+
+
+def bench(n: int, args) -> None:
+    from continuum.memory.continuum_memory import ContinuumMemory
+
+    rng = random.Random(args.seed)
+    vocab = _vocabulary(rng)
+    memory = ContinuumMemory()
+
+    t0 = time.perf_counter()
+    for i in range(n):
+        memory.add(f"note:{i}", _make_value(rng, vocab), source="bench")
+    add_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(0, n, max(1, n // 1000)):
+        memory.add(f"note:{i}", _make_value(rng, vocab), source="bench")
+    overwrite_us = (
+        (time.perf_counter() - t0) / len(range(0, n, max(1, n // 1000))) * 1e6
+    )
+
+    words = vocab[0]
+    rare = [words[rng.randrange(len(_WORDS), len(words))] for _ in range(50)]
+    cases = {
+        "term (rare)": rare,
+        "term (common)": ["tea", "morning", "dog", "project", "sleep"],
+        "AND (2 terms)": [
+            "tea morning",
+            "dog walk",
+            "project deadline",
+            "family travel",
+        ],
+        "AND (3 terms)": ["tea morning garden", "sleep dream calm"],
+        "prefix": ["mor", "gard", "proj", "birth", "swim"],
+    }
+
+    stats = memory.index_stats()
+    print(f"\nN = {n:,}")
+    print(f"  add           {n / add_s:12,.0f} records/s")
+    print(f"  overwrite     {overwrite_us:12.1f} µs per record")
+    print(
+        f"  index         {stats['terms']:,} terms, {stats['postings']:,} postings, "
+        f"~{stats['bytes'] / 2**20:.1f} MiB"
+    )
+    print(f"  {'query':<16}{'median µs':>12}{'max µs':>12}{'hits':>9}")
+    for name, queries in cases.items():
+        median, worst = _time(
+            lambda q: memory.search(q, limit=args.limit), queries, repeat=args.repeat
+        )
+        hits = statistics.mean(len(memory.search(q)) for q in queries)
+        print(f"  {name:<16}{median:12.1f}{worst:12.1f}{hits:9.0f}")
+
+    if not args.skip_scan:
+        median, worst = _time(lambda q: _linear_scan(memory._store, q), ["tea", "mor"])
+        print(f"  {'linear scan':<16}{median:12.1f}{worst:12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", default="10000,100000")
+    parser.add_argument(
+        "--limit", type=int, default=10, help="results per query (ranked top-k)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--skip-scan", action="store_true", help="skip the linear-scan reference"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    for n in (int(s) for s in args.records.split(",") if s.strip()):
+        bench(n, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# continuum/bench/bench_node_health.py
+"""
+Benchmark node_health query latency on a year of synthetic data.
+
+Measures the HealthScoringMixin "last 5 records for a node" query:
+  1. raw table, no composite index
+  2. raw table, with ix_node_health_node_ts
+  3. after HealthRetentionJob rollup + pruning
+
+Usage:
+    python -m continuum.bench.bench_node_health --days 365 --interval 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from continuum.db.models.base import Base
+from continuum.db.models.models import Model  # noqa: F401  (mapper registry)
+from continuum.db.models.model_nodes import ModelNode  # noqa: F401
+from continuum.db.models.nodes import Node, NodeType
+from continuum.db.models.node_health import NodeHealth, HealthStatus
+from continuum.db.models.node_health_rollups import NodeHealthRollup
+from continuum.db.health_retention import HealthRetentionJob
+
+
+def _generate(engine, node_ids, start, end, interval, batch=50_000):
+    table = NodeHealth.__table__
+    statuses = [HealthStatus.online] * 18 + [
+        HealthStatus.degraded,
+        HealthStatus.offline,
+    ]
+    total = 0
+
+    with engine.begin() as conn:
+        for node_id in node_ids:
+            ts = start
+            rows = []
+            while ts < end:
+                status = random.choice(statuses)
+                rows.append(
+                    {
+                        "node_id": node_id,
+                        "timestamp": ts,
+                        "latency_ms": (
+                            None
+                            if status == HealthStatus.offline
+                            else random.randint(20, 1500)
+                        ),
+                        "status": status,
+                    }
+                )
+                if len(rows) >= batch:
+                    conn.execute(table.insert(), rows)
+                    total += len(rows)
+                    rows = []
+                ts += timedelta(seconds=interval)
+            if rows:
+                conn.execute(table.insert(), rows)
+                total += len(rows)
+    return total
+
+
+def _time_latest_query(session, node_ids, iterations):
+    samples = []
+    for _ in range(iterations):
+        node_id = random.choice(node_ids)
+        t0 = time.perf_counter()
+        (
+            session.query(NodeHealth)
+            .filter(NodeHealth.node_id == node_id)
+            .order_by(NodeHealth.timestamp.desc())
+            .limit(5)
+            .all()
+        )
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "max_ms": samples[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=1)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument(
+        "--interval", type=int, default=5, help="seconds between samples"
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--db", default=None, help="SQLite path (default: temp file)")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "node_health_bench.sqlite")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(
+        engine,
+        tables=[Node.__table__, NodeHealth.__table__, NodeHealthRollup.__table__],
+    )
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    node_ids = []
+    for i in range(args.nodes):
+        node = Node(name=f"bench-{i}", type=NodeType.ollama, host="localhost")
+        session.add(node)
+        session.flush()
+        node_ids.append(node.id)
+    session.commit()
+
+    end = datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=args.days)
+
+    t0 = time.perf_counter()
+    rows = _generate(engine, node_ids, start, end, args.interval)
+    elapsed = time.perf_counter() - t0
+    print(f"Generated {rows:,} node_health rows in {elapsed:.1f}s ({path})")
+
+    # 1. Without the composite index
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_node_health_node_ts"))
+    print("no index         :", _time_latest_query(session, node_ids, args.queries))
+
+    # 2. With the composite index
+    t0 = time.perf_counter()
+    next(
+        ix for ix in NodeHealth.__table__.indexes if ix.name == "ix_node_health_node_ts"
+    ).create(engine)
+    print(f"index build      : {time.perf_counter() - t0:.1f}s")
+    print("(node_id, ts) idx:", _time_latest_query(session, node_ids, args.queries))
+
+    # 3. After rollup + retention
+    t0 = time.perf_counter()
+    stats = HealthRetentionJob(session).run_once(now=end, node_ids=node_ids)
+    print(f"retention cycle  : {time.perf_counter() - t0:.1f}s {stats}")
+    print("after retention  :", _time_latest_query(session, node_ids, args.queries))
+
+    remaining = session.query(NodeHealth).count()
+    print(f"raw rows remaining: {remaining:,}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
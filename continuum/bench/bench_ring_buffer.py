@@ -0,0 +1,125 @@
+# continuum/bench/bench_ring_buffer.py
+"""
+Memory and append cost of the episodic/emotional ring buffers vs. the
+lists they replaced.
+
+Per 10k records (--events), measured with tracemalloc:
+  - episodes: list of {"content", "metadata"} dicts vs. RingBuffer of
+    EpisodeRecord (__slots__)
+  - emotional events: list of EmotionalEvent as a regular dataclass vs.
+    RingBuffer of the __slots__ EmotionalEvent
+The content strings and raw_state dicts are shared by both sides, so
+the numbers are the container + record overhead only.
+
+Append at capacity (--capacity) compares list.append + list.pop(0)
+with RingBuffer.append, and "last 5" compares a list slice with a
+RingBuffer view.
+
+Usage:
+    python -m continuum.bench.bench_ring_buffer
+    python -m continuum.bench.bench_ring_buffer --events 100000 --capacity 10000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class _LegacyEmotionalEvent:
+    """EmotionalEvent as it was before __slots__."""
+    timestamp: str
+    raw_state: Dict[str, float]
+    dominant_emotion: str
+    metadata: Optional[Dict[str, Any]] = None
+
+
+def _allocated(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def _per_call_ns(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e9
+
+
+def main():
+    from continuum.memory.ring_buffer import EpisodeRecord, RingBuffer
+    from continuum.persona.emotional_memory import EmotionalEvent
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--appends", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.events
+
+    texts = [
+        f"episode {i}: walked the dog, then worked on the project" for i in range(n)
+    ]
+    state = {"joy": 0.4, "calm": 0.3, "tension": 0.1}
+    stamp = "2026-01-01T12:00:00"
+
+    def episodes_list():
+        return [{"content": t, "metadata": {}} for t in texts]
+
+    def episodes_ring():
+        ring = RingBuffer(n)
+        for t in texts:
+            ring.append(EpisodeRecord(content=t, ts=0.0))
+        return ring
+
+    def events_list():
+        return [_LegacyEmotionalEvent(stamp, state, "joy", {}) for _ in range(n)]
+
+    def events_ring():
+        ring = RingBuffer(n)
+        for _ in range(n):
+            ring.append(EmotionalEvent(stamp, state, "joy", {}))
+        return ring
+
+    print(f"\nMemory per {n:,} records (container + records, shared payloads excluded)")
+    for name, old, new in (
+        ("episodes", episodes_list, episodes_ring),
+        ("emotional events", events_list, events_ring),
+    ):
+        before, after = _allocated(old), _allocated(new)
+        print(
+            f"  {name:<18} list {before / 1024:9,.0f} KiB   "
+            f"ring {after / 1024:9,.0f} KiB   "
+            f"saved {(before - after) / 1024:8,.0f} KiB ({1 - after / before:.0%})"
+        )
+
+    cap = args.capacity
+    full_list = list(range(cap))
+    ring = RingBuffer(cap)
+    ring.extend(range(cap))
+
+    def list_append():
+        full_list.append(0)
+        full_list.pop(0)
+
+    print(f"\nAt capacity {cap:,}")
+    for label, call in (
+        ("list append+pop(0)", list_append),
+        ("RingBuffer.append", lambda: ring.append(0)),
+        ("list[-5:]", lambda: full_list[-5:]),
+        ("RingBuffer.last(5)", lambda: ring.last(5)),
+    ):
+        print(f"  {label:<22}{_per_call_ns(call, args.appends):10,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# continuum/bench/bench_sessions.py
+"""
+Per-session cost of controllers that share one ResourceHub.
+
+Uses the same throwaway SQLite database as bench_turns (no network
+needed: no turns are run). Measures, with tracemalloc:
+  - building the ResourceHub once (time, memory)
+  - --sessions controllers sharing it (time and memory per session)
+  - --standalone controllers that each build their own hub, as every
+    controller did before the hub existed
+  - parking every session (snapshot + drop) and restoring one
+
+Usage:
+    python -m continuum.bench.bench_sessions
+    python -m continuum.bench.bench_sessions --sessions 5000 --standalone 3
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    kept = build()
+    elapsed = time.perf_counter() - t0
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, elapsed, after - before
+
+
+def main():
+    from continuum.bench.bench_turns import _prepare_environment, _seed_database
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--standalone", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="continuum-bench-")
+    _prepare_environment(workdir)
+    os.environ["CONTINUUM_TURN_DIR"] = os.path.join(workdir, "turns")
+
+    from continuum.orchestrator.resource_hub import ResourceHub, SessionManager
+    from continuum.orchestrator.continuum_controller import ContinuumController
+
+    try:
+        _seed_database("http://127.0.0.1:9")
+
+        hub, hub_s, hub_bytes = _measure(ResourceHub)
+        hub_mib = hub_bytes / 2**20
+        print(f"\nResourceHub        {hub_s * 1e3:10.1f} ms   {hub_mib:10.2f} MiB")
+
+        manager = SessionManager(
+            hub=hub,
+            max_sessions=args.sessions,
+            snapshot_dir=os.path.join(workdir, "snapshots"),
+        )
+        ids = [f"session-{i}" for i in range(args.sessions)]
+        _, sessions_s, sessions_bytes = _measure(lambda: [manager.get(i) for i in ids])
+        n = args.sessions
+        print(
+            f"{n:,} sessions    {sessions_s * 1e3 / n:10.2f} ms   "
+            f"{sessions_bytes / n / 1024:10.1f} KiB per session (shared hub)"
+        )
+
+        if args.standalone:
+            def standalone():
+                return [
+                    ContinuumController(hub=ResourceHub(workers=4))
+                    for _ in range(args.standalone)
+                ]
+
+            controllers, alone_s, alone_bytes = _measure(standalone)
+            m = args.standalone
+            print(
+                f"{m:,} standalone    {alone_s * 1e3 / m:10.2f} ms   "
+                f"{alone_bytes / m / 1024:10.1f} KiB per controller (own hub)"
+            )
+            for controller in controllers:
+                controller.hub.shutdown()
+
+        t0 = time.perf_counter()
+        manager.park_idle(now=time.monotonic() + manager.idle_seconds)
+        park_ms = (time.perf_counter() - t0) * 1e3
+        t0 = time.perf_counter()
+        manager.get(ids[0])
+        restore_ms = (time.perf_counter() - t0) * 1e3
+        print(f"park all           {park_ms / n:10.2f} ms per session")
+        print(f"restore one        {restore_ms:10.2f} ms")
+        print(f"sessions           {manager.stats()}")
+        hub.shutdown()
+    finally:
+        os.chdir(tempfile.gettempdir())
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
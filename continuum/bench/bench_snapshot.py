@@ -0,0 +1,161 @@
+# continuum/bench/bench_snapshot.py
+"""
+Size and speed of conversation snapshots (core.snapshot).
+
+Builds a conversation with full windows (--turns turns: message window,
+emotional events, arc history, turn store) and --memories key-value
+memories on a stand-in controller, then times:
+  - a full save, and the delta save after one more turn
+  - restoring into a fresh controller (read + decode + replay + restore)
+    from a log of one full frame plus --deltas deltas
+for each codec available (JSON always, msgpack if installed).
+
+Usage:
+    python -m continuum.bench.bench_snapshot
+    python -m continuum.bench.bench_snapshot --turns 1000 --memories 20000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1e3
+
+
+def _controller(conversation_id: str, args, workdir: str):
+    from continuum.core.context import ContinuumContext
+    from continuum.core.turn_store import TurnStore
+    from continuum.emotion.emotional_arc_engine import EmotionalArcEngine
+    from continuum.emotion.state_machine import EmotionalState
+    from continuum.orchestrator.fusion_smoothing import FusionSmoother
+    from continuum.persona.emotional_memory import EmotionalMemory
+
+    return SimpleNamespace(
+        context=ContinuumContext(conversation_id=conversation_id),
+        emotional_state=EmotionalState(),
+        emotional_memory=EmotionalMemory(),
+        emotional_arc_engine=EmotionalArcEngine(),
+        fusion_smoother=FusionSmoother(),
+        turn_store=TurnStore(conversation_id, directory=os.path.join(workdir, "turns")),
+    )
+
+
+def _turn(controller, i: int) -> None:
+    from continuum.core.turn_store import TurnRecord
+
+    user = (
+        f"turn {i}: could you help me plan the week around the project deadline? " * 3
+    )
+    reply = (
+        f"reply {i}: here is a plan that leaves room for the deadline and for rest. "
+        * 6
+    )
+    controller.context.add("user", user)
+    controller.context.add("assistant", reply, actor="storyweaver", confidence=0.8)
+    controller.emotional_memory.add_event(
+        {"joy": 0.4, "calm": 0.3, "tension": 0.1 + (i % 5) / 10}, "joy"
+    )
+    controller.emotional_state.tension = (i % 5) / 10
+    controller.emotional_arc_engine.record_snapshot(
+        controller.emotional_state, "joy", {"architect": 0.6}
+    )
+    controller.fusion_smoother.smooth({"architect": 0.6, "storyweaver": 0.4})
+    controller.turn_store.append(
+        TurnRecord(
+            turn_id=f"turn-{i}",
+            user=user,
+            assistant=reply,
+            emotion="joy",
+            intensity=0.4,
+            winner="storyweaver",
+            confidence=0.8,
+            intent="conversation",
+            model="llama3",
+            node="local",
+            proposals=(("architect", 0.7), ("storyweaver", 0.8)),
+        )
+    )
+
+
+def bench_codec(codec: int, args, workdir: str) -> None:
+    from continuum.core import snapshot
+
+    name = "msgpack" if codec == snapshot.CODEC_MSGPACK else "json"
+    directory = os.path.join(workdir, name)
+
+    controller = _controller("bench", args, workdir)
+    for i in range(args.memories):
+        controller.context.memory.add(
+            f"fact-{i}", f"the user mentioned detail number {i}", importance=0.5
+        )
+    for i in range(args.turns):
+        _turn(controller, i)
+
+    snapshotter = snapshot.ConversationSnapshotter(
+        controller, directory=directory, full_every=args.deltas + 2, codec=codec
+    )
+    t0 = time.perf_counter()
+    full_bytes = snapshotter.save(full=True)
+    full_ms = _ms(t0)
+
+    delta_bytes, delta_ms = [], []
+    for i in range(args.turns, args.turns + args.deltas):
+        _turn(controller, i)
+        t0 = time.perf_counter()
+        delta_bytes.append(snapshotter.save())
+        delta_ms.append(_ms(t0))
+
+    restore_ms = []
+    for _ in range(args.repeat):
+        fresh = _controller("fresh", args, workdir)
+        t0 = time.perf_counter()
+        snapshot.ConversationSnapshotter(fresh, directory=directory).restore("bench")
+        restore_ms.append(_ms(t0))
+    assert (
+        snapshot.capture(fresh)["messages"] == snapshot.capture(controller)["messages"]
+    )
+
+    log_bytes = os.path.getsize(snapshotter.path_for("bench"))
+    print(f"\n{name}")
+    print(f"  full save         {full_ms:10.1f} ms   {full_bytes / 1024:10,.1f} KiB")
+    delta_kib = statistics.median(delta_bytes) / 1024
+    print(
+        f"  delta save        {statistics.median(delta_ms):10.1f} ms   "
+        f"{delta_kib:10,.1f} KiB (median per turn)"
+    )
+    print(
+        f"  restore           {statistics.median(restore_ms):10.1f} ms   "
+        f"from {log_bytes / 1024:,.1f} KiB (full + {args.deltas} deltas)"
+    )
+
+
+def main():
+    from continuum.core import snapshot
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--memories", type=int, default=2_000)
+    parser.add_argument("--deltas", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    codecs = [snapshot.CODEC_JSON]
+    if snapshot.msgpack is not None:
+        codecs.append(snapshot.CODEC_MSGPACK)
+    else:
+        print("msgpack is not installed; JSON only")
+
+    print(f"{args.turns:,} turns, {args.memories:,} memories")
+    with tempfile.TemporaryDirectory() as workdir:
+        for codec in codecs:
+            bench_codec(codec, args, workdir)
+
+
+if __name__ == "__main__":
+    main()
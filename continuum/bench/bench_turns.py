@@ -0,0 +1,307 @@
+# continuum/bench/bench_turns.py
+"""
+End-to-end turn benchmark, fully offline.
+
+Starts a fake Ollama node (bench.fake_ollama), points a throwaway SQLite
+database at it, and drives ContinuumController.process_message from N
+worker threads (one controller per worker, as in the UI) for each
+concurrency level. The emotion and sentence-embedding models are
+replaced by bench.offline_models, so nothing is downloaded and
+sentence-transformers is not needed.
+
+Reports per level:
+  - turns/sec, p50/p95/max turn latency
+  - per-stage breakdown from the turn traces (core.tracing):
+    mean ms per turn and share of turn time for each span name
+
+Usage:
+    python -m continuum.bench.bench_turns --turns 20 --concurrency 1,2,4
+    python -m continuum.bench.bench_turns --ttft-ms 300 --tokens-per-sec 25 --tokens 128
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from continuum.bench import offline_models
+from continuum.bench.fake_ollama import FakeOllamaConfig, FakeOllamaServer
+
+BENCH_MODEL = "bench-model:latest"
+
+_MESSAGES = [
+    "How should I structure a small research project?",
+    "Tell me a short story about a lighthouse keeper.",
+    "What are the trade-offs between SQLite and MySQL?",
+    "Summarize why sleep matters for memory.",
+]
+
+
+# ---------------------------------------------------------
+# Environment + database
+# ---------------------------------------------------------
+def _prepare_environment(workdir: str) -> None:
+    """
+    Must run before any continuum module that reads its settings at
+    import time (logger, tracing, DB engine) is imported.
+    """
+    os.environ["CONTINUUM_DB_URL"] = (
+        f"sqlite:///{os.path.join(workdir, 'bench.sqlite')}"
+    )
+    os.environ["CONTINUUM_TRACE_DIR"] = os.path.join(workdir, "traces")
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    os.environ.pop("CONTINUUM_METRICS_PORT", None)
+    # No background DB writers while timing
+    os.environ.setdefault("CONTINUUM_HEALTH_INTERVAL", "0")
+    os.environ.setdefault("CONTINUUM_HEALTH_RETENTION_INTERVAL", "0")
+    os.chdir(workdir)
+
+
+def _seed_database(node_url: str) -> None:
+    from sqlalchemy import text
+
+    from continuum.db.sqlalchemy_connection import get_engine, session_scope
+    from continuum.db.models.base import Base
+    # Tables read by ModelRegistry / routing during controller init and turns
+    from continuum.db.models import (  # noqa: F401  (mapper registry)
+        actor_profiles,
+        model_latency_histograms,
+        model_stats,
+        node_health,
+        node_health_rollups,
+    )
+    from continuum.db.models.models import Model
+    from continuum.db.models.model_nodes import ModelNode
+    from continuum.db.models.nodes import Node, NodeStatus, NodeType
+
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+
+    # Tables that only exist as raw SQL in the production schema
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS rewrite_config ("
+            " id INTEGER PRIMARY KEY, pinned_model VARCHAR(255), forbidden_models TEXT)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS actor_model_preferences ("
+            " actor_name VARCHAR(100), model_name VARCHAR(255),"
+            " preference_weight FLOAT)"
+        ))
+        conn.execute(
+            text(
+                "INSERT INTO rewrite_config (pinned_model, forbidden_models)"
+                " VALUES (:m, '')"
+            ),
+            {"m": BENCH_MODEL},
+        )
+
+    with session_scope() as session:
+        node = Node(
+            name="fake-ollama",
+            type=NodeType.ollama,
+            host=node_url,
+            enabled=True,
+            status=NodeStatus.online,
+        )
+        session.add(node)
+        session.add(Model(name=BENCH_MODEL, provider="ollama", context_window=8192))
+        session.flush()
+        session.add(ModelNode(model_name=BENCH_MODEL, node_id=node.id))
+
+
+# ---------------------------------------------------------
+# Trace aggregation
+# ---------------------------------------------------------
+def _read_traces(path: str, offset: int):
+    """Traces appended to `path` after byte `offset`."""
+    if not os.path.exists(path):
+        return [], offset
+    with open(path, encoding="utf-8") as f:
+        f.seek(offset)
+        data = f.read()
+        end = f.tell()
+    traces = []
+    for line in data.splitlines():
+        try:
+            traces.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return traces, end
+
+
+def stage_breakdown(traces):
+    """{span name: (mean ms per turn, share of total turn time)}."""
+    totals = defaultdict(float)
+    turn_total = 0.0
+    for t in traces:
+        turn_total += t.get("duration_ms") or 0.0
+        for s in t.get("spans") or []:
+            if s["parent"] is not None:
+                totals[s["name"]] += s["duration_ms"]
+    n = max(1, len(traces))
+    return {
+        name: (total / n, total / turn_total if turn_total else 0.0)
+        for name, total in sorted(totals.items(), key=lambda kv: -kv[1])
+    }
+
+
+# ---------------------------------------------------------
+# Turn driver
+# ---------------------------------------------------------
+def _build_controller(node_url: str):
+    from continuum.orchestrator.continuum_controller import ContinuumController
+
+    controller = ContinuumController()
+    # AIRA micro-polish calls the client's default endpoint
+    controller.llm_client.default_endpoint = f"{node_url}/api/generate"
+    controller.llm_client.endpoint = controller.llm_client.default_endpoint
+    return controller
+
+
+def run_level(controllers, turns: int):
+    """Run `turns` turns spread over len(controllers) threads."""
+    from continuum.monitoring.latency_histogram import LatencyHistogram
+
+    hist = LatencyHistogram()
+    lock = threading.Lock()
+    errors = []
+    remaining = [turns]
+
+    def worker(controller, idx):
+        i = 0
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            message = _MESSAGES[(idx + i) % len(_MESSAGES)]
+            i += 1
+            t0 = time.perf_counter()
+            try:
+                controller.process_message(message)
+            except Exception as e:
+                with lock:
+                    errors.append(f"{type(e).__name__}: {e}")
+                continue
+            elapsed = (time.perf_counter() - t0) * 1000.0
+            with lock:
+                hist.record(elapsed)
+
+    threads = [
+        threading.Thread(
+            target=worker, args=(c, i), name=f"bench-worker-{i}", daemon=True
+        )
+        for i, c in enumerate(controllers)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return hist, time.perf_counter() - start, errors
+
+
+def _fmt(ms):
+    return "-" if ms is None else f"{ms:8.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--turns", type=int, default=20, help="turns per concurrency level"
+    )
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--concurrency", default="1,2,4")
+    parser.add_argument("--ttft-ms", type=float, default=120.0)
+    parser.add_argument("--tokens-per-sec", type=float, default=60.0)
+    parser.add_argument("--tokens", type=int, default=48)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--top-stages", type=int, default=12)
+    parser.add_argument("--workdir", default=None, help="default: temp dir")
+    args = parser.parse_args()
+
+    levels = [int(x) for x in args.concurrency.split(",") if x.strip()]
+    workdir = os.path.abspath(
+        args.workdir or tempfile.mkdtemp(prefix="continuum-bench-")
+    )
+    os.makedirs(workdir, exist_ok=True)
+    _prepare_environment(workdir)
+
+    server = FakeOllamaServer(FakeOllamaConfig(
+        ttft_ms=args.ttft_ms,
+        tokens_per_sec=args.tokens_per_sec,
+        tokens=args.tokens,
+        jitter=args.jitter,
+    ))
+    server.start()
+
+    from continuum.core.logger import flush_logs
+    from continuum.core.tracing import trace_writer
+    from continuum.db.sqlalchemy_connection import get_pool_status
+    from continuum.orchestrator.resource_hub import get_resource_hub
+
+    _seed_database(server.url)
+    offline_models.install(get_resource_hub())
+
+    print(f"workdir: {workdir}")
+    print(
+        f"fake node: {server.url}  ttft={args.ttft_ms:.0f}ms  "
+        f"rate={args.tokens_per_sec:.0f} tok/s  tokens={args.tokens}"
+    )
+
+    controllers = []
+    trace_offset = 0
+    try:
+        for level in levels:
+            while len(controllers) < level:
+                controllers.append(_build_controller(server.url))
+            active = controllers[:level]
+
+            if args.warmup:
+                run_level(active, args.warmup)
+            _, trace_offset = _read_traces(trace_writer.path, trace_offset)
+
+            llm_before = server.stats["requests"]
+            hist, wall, errors = run_level(active, args.turns)
+            traces, trace_offset = _read_traces(trace_writer.path, trace_offset)
+            done = hist.count
+
+            print(f"\n=== concurrency {level} ===")
+            print(
+                f"turns: {done}/{args.turns}  errors: {len(errors)}  "
+                f"wall: {wall:.2f}s  "
+                f"throughput: {done / wall if wall else 0:.2f} turns/s"
+            )
+            print(
+                f"turn latency ms  p50 {_fmt(hist.percentile(50))}  "
+                f"p95 {_fmt(hist.percentile(95))}  max {_fmt(hist.max)}"
+            )
+            calls = (server.stats["requests"] - llm_before) / max(1, done)
+            print(
+                f"llm calls/turn: {calls:.1f}  "
+                f"node max in-flight: {server.stats['max_inflight']}"
+            )
+            for err in sorted(set(errors))[:3]:
+                print(f"  error: {err}")
+
+            breakdown = stage_breakdown(traces)
+            if breakdown:
+                print(f"{'stage':<28}{'ms/turn':>10}{'share':>8}")
+                for name, (mean_ms, share) in list(breakdown.items())[
+                   :args.top_stages
+                ]:
+                    print(f"{name:<28}{mean_ms:10.1f}{share * 100:7.1f}%")
+                print("(stages nest and Senate actors overlap; shares can exceed 100%)")
+
+        print(f"\npool: {get_pool_status()}")
+    finally:
+        flush_logs()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
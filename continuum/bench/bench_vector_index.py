@@ -0,0 +1,141 @@
+# continuum/bench/bench_vector_index.py
+"""
+Add/search latency of memory.vector_index.VectorIndex.
+
+For each index size N (default 10k, 100k, 1M; dim 384 as produced by
+all-MiniLM-L6-v2) the index is filled with clustered synthetic
+embeddings, then:
+  - bulk add: vectors/sec for add_many in batches of --batch
+  - single add: µs per add() into the full index
+  - search: p50/p95 µs per top-k query, exact scan and (above the IVF
+    threshold) IVF, plus IVF recall@k against the exact result
+
+1M x 384 float32 is ~1.5 GB of vectors; pass --sizes to stay smaller.
+
+Usage:
+    python -m continuum.bench.bench_vector_index
+    python -m continuum.bench.bench_vector_index --sizes 10000,100000 --nprobe 16
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import numpy as np
+
+CLUSTERS = 512          # topics in the synthetic data
+NOISE = 0.35            # spread of memories around their topic
+
+
+def _make_vectors(rng: np.random.Generator, centers: np.ndarray, n: int) -> np.ndarray:
+    picks = rng.integers(0, len(centers), size=n)
+    return (centers[picks] + NOISE * rng.standard_normal((n, centers.shape[1]))).astype(
+        np.float32
+    )
+
+
+def _percentile(samples, p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def _p50_p95(samples) -> str:
+    return (
+        f"p50 {statistics.median(samples):9.1f} µs   "
+        f"p95 {_percentile(samples, 95):9.1f} µs"
+    )
+
+
+def _time_searches(index, queries, k: int, **kwargs):
+    timings, results = [], []
+    for q in queries:
+        t0 = time.perf_counter()
+        hits = index.search(q, k, **kwargs)
+        timings.append((time.perf_counter() - t0) * 1e6)
+        results.append({item_id for item_id, _ in hits})
+    return timings, results
+
+
+def bench_size(n: int, args) -> None:
+    from continuum.memory.vector_index import VectorIndex
+
+    rng = np.random.default_rng(args.seed)
+    centers = rng.standard_normal((CLUSTERS, args.dim)).astype(np.float32)
+    index = VectorIndex(
+        dim=args.dim,
+        ivf_threshold=args.ivf_threshold,
+        nprobe=args.nprobe,
+        initial_capacity=n + args.single_adds,
+    )
+
+    # Bulk add (includes IVF training once the threshold is crossed)
+    t0 = time.perf_counter()
+    for start in range(0, n, args.batch):
+        count = min(args.batch, n - start)
+        ids = [f"m{i}" for i in range(start, start + count)]
+        index.add_many(ids, _make_vectors(rng, centers, count))
+    bulk_s = time.perf_counter() - t0
+
+    # Single adds into the full index
+    singles = _make_vectors(rng, centers, args.single_adds)
+    add_us = []
+    for i, vector in enumerate(singles):
+        t0 = time.perf_counter()
+        index.add(f"s{i}", vector)
+        add_us.append((time.perf_counter() - t0) * 1e6)
+
+    queries = _make_vectors(rng, centers, args.queries)
+    exact_us, exact_hits = _time_searches(index, queries, args.k, exact=True)
+
+    print(f"\nN = {len(index):,}  ({index.mode}, {index.nbytes / 2**20:.0f} MiB)")
+    print(f"  bulk add      {n / bulk_s:12,.0f} vectors/s   ({bulk_s:.2f} s)")
+    print(f"  single add    {_p50_p95(add_us)}")
+    print(f"  search exact  {_p50_p95(exact_us)}")
+
+    if index.mode == "ivf":
+        ivf_us, ivf_hits = _time_searches(index, queries, args.k)
+        recall = statistics.mean(
+            len(a & b) / args.k for a, b in zip(exact_hits, ivf_hits)
+        )
+        print(
+            f"  search ivf    {_p50_p95(ivf_us)}"
+            f"   recall@{args.k} {recall:.3f} (nprobe {args.nprobe})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--single-adds", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument(
+        "--ivf-threshold",
+        type=int,
+        default=None,
+        help="default: CONTINUUM_VECTOR_IVF_THRESHOLD",
+    )
+    parser.add_argument(
+        "--nprobe", type=int, default=None, help="default: CONTINUUM_VECTOR_NPROBE"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CONTINUUM_LOG_LEVEL", "WARNING")
+    from continuum.memory import vector_index
+
+    if args.ivf_threshold is None:
+        args.ivf_threshold = vector_index.IVF_THRESHOLD
+    if args.nprobe is None:
+        args.nprobe = vector_index.NPROBE
+
+    print(f"dim {args.dim}, k {args.k}, IVF from {args.ivf_threshold:,} vectors")
+    for n in (int(s) for s in args.sizes.split(",") if s.strip()):
+        bench_size(n, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# continuum/bench/fake_ollama.py
+"""
+Local stand-in for an Ollama node, for offline benchmarks.
+
+Implements just enough of the API for The Continuum:
+  POST /api/generate   NDJSON stream of {"response": ...} chunks, then a
+                       final {"done": true, "eval_count", "eval_duration"}
+  GET  /api/version    health check used by HealthMonitor
+  GET  /api/tags       lists the fake model
+
+Latency is shaped by three knobs: time to first token, token rate and
+number of tokens (capped by the request's num_predict). Optional
+jitter makes the distribution less artificial.
+
+Usage:
+    python -m continuum.bench.fake_ollama --port 11435 --ttft-ms 150 --tokens-per-sec 40
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = (
+    "the continuum weighs each proposal against memory and emotion before "
+    "a single voice emerges from the senate deliberation with care"
+).split()
+
+
+@dataclass
+class FakeOllamaConfig:
+    ttft_ms: float = 150.0
+    tokens_per_sec: float = 40.0
+    tokens: int = 64
+    jitter: float = 0.1          # ± fraction applied to ttft and token rate
+    chunk_tokens: int = 1        # tokens per streamed NDJSON line
+    seed: int = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: FakeOllamaConfig = FakeOllamaConfig()
+    stats: dict = None
+    rng: random.Random = None
+
+    def log_message(self, format, *args):
+        return
+
+    def _json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/api/version":
+            self._json(200, {"version": "0.0.0-fake"})
+        elif self.path == "/api/tags":
+            self._json(200, {"models": [{"name": "bench-model:latest"}]})
+        else:
+            self._json(404, {"error": "not found"})
+
+    def _jittered(self, value: float) -> float:
+        j = self.config.jitter
+        return value * (1.0 + self.rng.uniform(-j, j)) if j else value
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            req = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._json(400, {"error": "invalid json"})
+            return
+
+        cfg = self.config
+        num_predict = (req.get("options") or {}).get("num_predict") or cfg.tokens
+        n_tokens = max(1, min(cfg.tokens, int(num_predict)))
+        ttft = self._jittered(cfg.ttft_ms) / 1000.0
+        per_token = 1.0 / max(1e-6, self._jittered(cfg.tokens_per_sec))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def emit(obj):
+            data = (json.dumps(obj) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        with self.stats["lock"]:
+            self.stats["requests"] += 1
+            self.stats["inflight"] += 1
+            self.stats["max_inflight"] = max(
+                self.stats["max_inflight"], self.stats["inflight"]
+            )
+
+        try:
+            time.sleep(ttft)
+            decode_start = time.perf_counter()
+            sent = 0
+            while sent < n_tokens:
+                batch = min(cfg.chunk_tokens, n_tokens - sent)
+                words = " ".join(_WORDS[(sent + i) % len(_WORDS)] for i in range(batch))
+                emit(
+                    {"model": req.get("model"), "response": words + " ", "done": False}
+                )
+                sent += batch
+                # Sleep to the schedule rather than per chunk, so overhead
+                # doesn't accumulate
+                target = decode_start + sent * per_token
+                delay = target - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            emit({
+                "model": req.get("model"),
+                "response": "",
+                "done": True,
+                "eval_count": n_tokens,
+                "eval_duration": int((time.perf_counter() - decode_start) * 1e9),
+            })
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self.stats["lock"]:
+                self.stats["inflight"] -= 1
+
+
+class FakeOllamaServer(threading.Thread):
+    """Runs the fake node in a daemon thread; port=0 picks a free port."""
+
+    def __init__(
+        self, config: FakeOllamaConfig = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        super().__init__(daemon=True)
+        self.config = config or FakeOllamaConfig()
+        self.stats = {
+            "lock": threading.Lock(),
+            "requests": 0,
+            "inflight": 0,
+            "max_inflight": 0,
+        }
+        handler = type(
+            "FakeOllamaHandler",
+            (_Handler,),
+            {
+                "config": self.config,
+                "stats": self.stats,
+                "rng": random.Random(self.config.seed),
+            },
+        )
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.running = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def run(self):
+        self.httpd.serve_forever(poll_interval=0.1)
+
+    def stop(self):
+        self.running = False
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Ollama /api/generate server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--ttft-ms", type=float, default=150.0)
+    parser.add_argument("--tokens-per-sec", type=float, default=40.0)
+    parser.add_argument("--tokens", type=int, default=64)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        FakeOllamaConfig(
+            ttft_ms=args.ttft_ms,
+            tokens_per_sec=args.tokens_per_sec,
+            tokens=args.tokens,
+            jitter=args.jitter,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    server.start()
+    print(f"Fake Ollama listening on {server.url} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
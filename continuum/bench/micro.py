@@ -0,0 +1,385 @@
+# continuum/bench/micro.py
+"""
+Micro-benchmarks for the CPU-bound pieces that run on every turn.
+
+Cases (each at proposal sizes of 500, 2000 and 4000 chars):
+  rubric.score_proposal           Jury scoring of one proposal vs. four
+                                  (bench.offline_models embedder in place
+                                  of the sentence-transformers model)
+  senate.similarity_matrix        TF-IDF similarity over four proposals
+  fusion.weighted_blend           FusionEngine._weighted_blend
+  meta_persona.render             MetaPersona.render (LLM hook disabled)
+  validators.validate_output      voiceprint validation
+  emotional_memory.add_event      EmotionalMemory.add_event (size = events held)
+  aira.diff_magnitude             SequenceMatcher ratio of a light rewrite
+
+Timings are per call, in microseconds: the loop count is calibrated so
+each sample runs for at least --min-time seconds. Results are compared
+against a stored baseline (bench/baselines/micro.json). Logging runs
+at WARNING unless --log-level says otherwise. Cases whose
+dependencies are not installed are reported as skipped.
+
+Usage:
+    python -m continuum.bench.micro                  # run + compare
+    python -m continuum.bench.micro --save           # record a new baseline
+    python -m continuum.bench.micro --check          # exit 1 on regression
+    python -m continuum.bench.micro -k fusion -k diff
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "micro.json")
+SIZES = (500, 2000, 4000)
+ACTORS = ("Architect", "Analyst", "Storyweaver", "Synthesizer")
+
+_VOCAB = (
+    "system memory emotion context proposal structure pattern signal tension "
+    "balance model layer bridge framework insight clarity rhythm voice arc "
+    "because therefore however together gently carefully quietly deeply"
+).split()
+
+
+# ---------------------------------------------------------
+# Realistic inputs
+# ---------------------------------------------------------
+def make_text(size: int, seed: int = 0) -> str:
+    """Deterministic prose of ~`size` chars: 8–22 word sentences, some paragraphs."""
+    rng = random.Random(seed * 7919 + size)
+    out: List[str] = []
+    length = 0
+    while length < size:
+        words = [rng.choice(_VOCAB) for _ in range(rng.randint(8, 22))]
+        sentence = " ".join(words).capitalize() + rng.choice([".", ".", ".", "?", "!"])
+        if rng.random() < 0.15:
+            sentence += "\n\n"
+        out.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(out)[:size]
+
+
+def make_proposals(size: int) -> List[Dict]:
+    return [
+        {
+            "actor": actor,
+            "content": make_text(size, seed=i),
+            "confidence": 0.6 + i / 20,
+            "metadata": {
+                "model": "llama3.2:latest",
+                "prompt_used": make_text(300, seed=99),
+            },
+        }
+        for i, actor in enumerate(ACTORS)
+    ]
+
+
+def _light_rewrite(text: str, seed: int = 1) -> str:
+    """Swap ~10% of words, as an AIRA pass typically does."""
+    rng = random.Random(seed)
+    words = text.split(" ")
+    for i in range(0, len(words), 10):
+        words[rng.randrange(i, min(i + 10, len(words)))] = rng.choice(_VOCAB)
+    return " ".join(words)
+
+
+# ---------------------------------------------------------
+# Cases: setup(size) -> zero-arg callable
+# ---------------------------------------------------------
+def _case_score_proposal(size: int) -> Callable[[], object]:
+    from continuum.bench.offline_models import embed
+    from continuum.emotion.state_machine import EmotionalState
+    from continuum.orchestrator.jury_rubric import score_proposal
+
+    proposals = make_proposals(size)
+    contents = [p["content"] for p in proposals]
+    message = make_text(200, seed=42)
+    emotion = EmotionalState()
+    memory_summary = make_text(400, seed=43)
+    target = proposals[0]
+
+    return lambda: score_proposal(
+        message=message,
+        proposal=target["content"],
+        reasoning_steps=[],
+        llm_prompt=target["metadata"]["prompt_used"],
+        model_name=target["metadata"]["model"],
+        user_emotion=emotion,
+        memory_summary=memory_summary,
+        all_proposals=contents,
+        actor_name=target["actor"],
+        embed_fn=embed,
+    )
+
+
+def _case_similarity_matrix(size: int):
+    from continuum.orchestrator.senate import Senate
+
+    senate = Senate([])
+    proposals = make_proposals(size)
+    return lambda: senate.compute_similarity_matrix(proposals)
+
+
+def _case_weighted_blend(size: int):
+    from continuum.orchestrator.fusion_engine import FusionEngine
+
+    engine = FusionEngine(controller=None)
+    texts = [
+        (p["actor"], p["content"], 1.0 + i / 10)
+        for i, p in enumerate(make_proposals(size))
+    ]
+    return lambda: engine._weighted_blend(texts)
+
+
+class _BenchContext:
+    debug_flags: Dict[str, bool] = {}
+
+
+class _BenchController:
+    flags = {"enable_meta_llm": False}
+    meta_rewrite_llm = None
+    last_final_proposal = {"actor": "Architect"}
+    context = _BenchContext()
+
+
+def _case_meta_persona_render(size: int):
+    from continuum.emotion.state_machine import EmotionalState
+    from continuum.persona.emotional_memory import EmotionalMemory
+    from continuum.persona.meta_persona import MetaPersona
+
+    persona = MetaPersona(name="The Continuum", voice="Warm, precise", traits={})
+    state = EmotionalState(joy=0.6, calm=0.4, focus=0.7, tension=0.3, curiosity=0.6)
+    memory = EmotionalMemory()
+    for i in range(20):
+        memory.add_event({"joy": 0.4 + i / 50, "tension": 0.3}, "joy")
+    controller = _BenchController()
+    text = make_text(size)
+
+    def run():
+        random.seed(0)  # stochastic variation stays comparable between runs
+        return persona.render(text, controller, controller.context, state, memory)
+
+    return run
+
+
+def _case_validate_output(size: int):
+    from continuum.persona.voiceprint_loader import voiceprint_loader
+    from continuum.validators.voiceprint_validator import validate_output
+
+    text = make_text(size)
+    emotion = {"joy": 0.5, "calm": 0.5, "focus": 0.6}
+    return lambda: validate_output(text, emotion, voiceprint_loader.voiceprint)
+
+
+def _case_add_event(size: int):
+    """`size` here is the number of events already held (max_events = size)."""
+    from continuum.persona.emotional_memory import EmotionalMemory
+
+    memory = EmotionalMemory(max_events=size)
+    rng = random.Random(size)
+    states = [
+        {
+            k: rng.random()
+            for k in ("joy", "calm", "focus", "tension", "curiosity", "fatigue")
+        }
+        for _ in range(64)
+    ]
+    for i in range(size):
+        memory.add_event(states[i % 64], "joy")
+    idx = [0]
+
+    def run():
+        idx[0] = (idx[0] + 1) % 64
+        memory.add_event(states[idx[0]], "calm")
+
+    return run
+
+
+def _case_diff_magnitude(size: int):
+    from continuum.aira.diff import diff_magnitude
+
+    before = make_text(size)
+    after = _light_rewrite(before)
+    return lambda: diff_magnitude(before, after)
+
+
+CASES: Dict[str, Callable[[int], Callable[[], object]]] = {
+    "rubric.score_proposal": _case_score_proposal,
+    "senate.similarity_matrix": _case_similarity_matrix,
+    "fusion.weighted_blend": _case_weighted_blend,
+    "meta_persona.render": _case_meta_persona_render,
+    "validators.validate_output": _case_validate_output,
+    "emotional_memory.add_event": _case_add_event,
+    "aira.diff_magnitude": _case_diff_magnitude,
+}
+
+
+# ---------------------------------------------------------
+# Runner
+# ---------------------------------------------------------
+@dataclass
+class Result:
+    key: str
+    median_us: float
+    min_us: float
+    stdev_us: float
+    loops: int
+
+
+def _calibrate(fn: Callable[[], object], min_time: float) -> int:
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t0 >= min_time or loops >= 1_000_000:
+            return loops
+        loops *= 2 if time.perf_counter() - t0 > min_time / 10 else 10
+
+
+def measure(key: str, fn: Callable[[], object], min_time: float, repeat: int) -> Result:
+    fn()  # warm caches, lazy imports, regex compilation
+    loops = _calibrate(fn, min_time)
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - t0) / loops * 1e6)
+    return Result(
+        key=key,
+        median_us=statistics.median(samples),
+        min_us=min(samples),
+        stdev_us=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        loops=loops,
+    )
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(results: List[Result], path: str = BASELINE_PATH) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": {
+            r.key: {"median_us": round(r.median_us, 3), "min_us": round(r.min_us, 3)}
+            for r in results
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def run(selected: Optional[List[str]], sizes, min_time: float, repeat: int):
+    results: List[Result] = []
+    skipped: Dict[str, str] = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, setup in CASES.items():
+            if selected and not any(s in name for s in selected):
+                continue
+            for size in sizes:
+                key = f"{name}[{size}]"
+                try:
+                    # measure() warms up first, so lazy imports fail here too
+                    results.append(measure(key, setup(size), min_time, repeat))
+                except ImportError as e:
+                    skipped[name] = f"missing dependency: {e.name or e}"
+                    break
+    return results, skipped
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Per-turn hot path micro-benchmarks")
+    parser.add_argument(
+        "-k", dest="selected", action="append", help="substring filter (repeatable)"
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="seconds per sample"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = +25%%)"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="write results as the new baseline"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 if any case regressed"
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="CONTINUUM_LOG_LEVEL while measuring"
+    )
+    args = parser.parse_args(argv)
+
+    # Logging cost is covered by bench_logging; keep it out of these numbers.
+    # Must be set before the cases import continuum.core.logger.
+    os.environ["CONTINUUM_LOG_LEVEL"] = args.log_level
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results, skipped = run(args.selected, sizes, args.min_time, args.repeat)
+    baseline = load_baseline(args.baseline)
+
+    regressions = []
+    print(f"{'case':<42}{'median µs':>12}{'± stdev':>10}{'baseline':>12}{'change':>9}")
+    for r in results:
+        base = baseline.get(r.key, {}).get("median_us")
+        if base:
+            change = r.median_us / base - 1.0
+            flag = " !" if change > args.tolerance else ""
+            if flag:
+                regressions.append(r.key)
+            cmp = f"{base:12.1f}{change * 100:+8.1f}%{flag}"
+        else:
+            cmp = f"{'-':>12}{'':>9}"
+        print(f"{r.key:<42}{r.median_us:12.1f}{r.stdev_us:10.1f}{cmp}")
+
+    for name, reason in skipped.items():
+        print(f"{name:<42}{'skipped':>12}  ({reason})")
+
+    if args.save:
+        # Keep baselines of cases that were skipped or filtered out this run
+        merged = {k: v for k, v in baseline.items()}
+        merged.update(
+            {r.key: {"median_us": r.median_us, "min_us": r.min_us} for r in results}
+        )
+        save_baseline(
+            [
+                Result(k, v["median_us"], v["min_us"], 0.0, 0)
+                for k, v in sorted(merged.items())
+            ],
+            args.baseline,
+        )
+        print(f"\nBaseline written to {args.baseline}")
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) slower than baseline "
+            f"by more than {args.tolerance:.0%}:"
+        )
+        for key in regressions:
+            print(f"  {key}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
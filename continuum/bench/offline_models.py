@@ -0,0 +1,56 @@
+# continuum/bench/offline_models.py
+"""
+Cheap, deterministic stand-ins for the models the turn path loads, so
+benchmarks run offline and measure Continuum's own code:
+
+  embed / HashingEmbedder   bag-of-words hashing in place of the
+                            sentence-transformers model (memory.semantic)
+  emotion_model             fixed scores in place of the transformers
+                            emotion pipeline (EmotionDetector.model)
+
+install(hub) swaps both into a ResourceHub before any turn runs.
+"""
+
+import re
+import zlib
+from typing import List
+
+EMBEDDING_DIM = 384
+
+_WORD = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """Same encode() interface as SentenceTransformer, for one text."""
+
+    dim = EMBEDDING_DIM
+
+    def encode(self, text: str):
+        import numpy as np
+
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for word in _WORD.findall(text.lower()):
+            vec[zlib.crc32(word.encode()) % self.dim] += 1.0
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+
+_embedder = HashingEmbedder()
+
+
+def embed(text: str) -> List[float]:
+    """Drop-in for memory.semantic.embed."""
+    return _embedder.encode(text).tolist()
+
+
+def emotion_model(text: str):
+    # Same shape as the text-classification pipeline with top_k=None
+    return [[{"label": "neutral", "score": 0.7}, {"label": "curiosity", "score": 0.3}]]
+
+
+def install(hub) -> None:
+    """Use the stand-ins for every controller that shares `hub`."""
+    from continuum.memory import semantic
+
+    semantic._model = _embedder
+    hub.emotion_detector.model = emotion_model
@@ -4,12 +4,14 @@ Provides a simple interactive loop for testing the orchestrator.
 """
 
 from __future__ import annotations
+import os
 import uuid
 
 from continuum.core.context import ContinuumContext
 from continuum.orchestrator.continuum_controller import ContinuumController
 from continuum.actors.base_actor import BaseActor
 from continuum.config.personas import ACTOR_PROFILES
+from continuum.monitoring.metrics import dump_metrics
 
 
 def build_default_controller() -> ContinuumController:
@@ -37,6 +39,11 @@ def main() -> None:
         result = controller.process_message(user_input)
         print(f"\nContinuum: {result}\n")
 
+    # Offline runs: keep a snapshot of the metrics (CONTINUUM_METRICS_FILE)
+    metrics_file = os.getenv("CONTINUUM_METRICS_FILE")
+    if metrics_file:
+        dump_metrics(metrics_file)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Tiny viewer for per-turn traces written by continuum.core.tracing.
+
+Prints the span tree of a turn and its critical path: the chain of
+spans that actually determined how long the turn took (for parallel
+Senate actors, only the slowest one is on it).
+
+Usage:
+    python -m continuum.cli.trace_viewer                 # last turn
+    python -m continuum.cli.trace_viewer --trace <id>    # specific turn
+    python -m continuum.cli.trace_viewer --list 20       # recent turns
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from continuum.core.tracing import TRACE_DIR, TRACE_FILE
+
+_EPS_MS = 0.001
+
+
+def load_traces(path: str) -> List[dict]:
+    traces = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                traces.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return traces
+
+
+def _children(spans: List[dict]) -> Dict[Optional[int], List[dict]]:
+    by_parent: Dict[Optional[int], List[dict]] = {}
+    for s in spans:
+        by_parent.setdefault(s["parent"], []).append(s)
+    for kids in by_parent.values():
+        kids.sort(key=lambda s: s["start_ms"])
+    return by_parent
+
+
+def _end(s: dict) -> float:
+    return s["start_ms"] + s["duration_ms"]
+
+
+def critical_path(root: dict, by_parent: Dict[Optional[int], List[dict]]) -> List[dict]:
+    """
+    Walk backwards from the end of `root`: the child that finished last
+    gated it; before that child started, the child that finished last
+    gated that; and so on. Recurse into each gating child.
+    """
+    kids = by_parent.get(root["id"], [])
+    chain = []
+    t = _end(root)
+    while True:
+        candidates = [k for k in kids if _end(k) <= t + _EPS_MS and k not in chain]
+        if not candidates:
+            break
+        gate = max(candidates, key=_end)
+        chain.append(gate)
+        t = gate["start_ms"]
+
+    path = [root]
+    for child in reversed(chain):
+        path.extend(critical_path(child, by_parent))
+    return path
+
+
+def self_time(s: dict, by_parent: Dict[Optional[int], List[dict]]) -> float:
+    """Duration not covered by any child span (children may overlap)."""
+    intervals = sorted((k["start_ms"], _end(k)) for k in by_parent.get(s["id"], []))
+    covered, cur_start, cur_end = 0.0, None, None
+    for a, b in intervals:
+        if cur_end is None or a > cur_end:
+            if cur_end is not None:
+                covered += cur_end - cur_start
+            cur_start, cur_end = a, b
+        else:
+            cur_end = max(cur_end, b)
+    if cur_end is not None:
+        covered += cur_end - cur_start
+    return max(0.0, s["duration_ms"] - covered)
+
+
+def _fmt_attrs(s: dict) -> str:
+    attrs = s.get("attrs") or {}
+    parts = [f"{k}={v}" for k, v in attrs.items()]
+    if s.get("error"):
+        parts.append(f"error={s['error']}")
+    return f"  [{', '.join(parts)}]" if parts else ""
+
+
+def print_trace(trace: dict, out=sys.stdout) -> None:
+    spans = trace.get("spans") or []
+    if not spans:
+        print(f"trace {trace.get('trace_id')} has no spans", file=out)
+        return
+
+    by_parent = _children(spans)
+    root = by_parent[None][0]
+    critical = {s["id"] for s in critical_path(root, by_parent)}
+
+    print(
+        f"trace {trace['trace_id']}  {trace.get('name')}  "
+        f"{trace['duration_ms']:.1f} ms  ({len(spans)} spans"
+        + (f", {trace['dropped_spans']} dropped" if trace.get("dropped_spans") else "")
+        + ")",
+        file=out,
+    )
+    print("", file=out)
+
+    def walk(s: dict, depth: int):
+        mark = "*" if s["id"] in critical else " "
+        print(
+            f"{mark} {s['start_ms']:9.1f} {s['duration_ms']:9.1f} ms  "
+            f"{'  ' * depth}{s['name']}{_fmt_attrs(s)}",
+            file=out,
+        )
+        for k in by_parent.get(s["id"], []):
+            walk(k, depth + 1)
+
+    print("    start_ms   duration   span   (* = critical path)", file=out)
+    walk(root, 0)
+
+    print("\ncritical path (self time):", file=out)
+    for s in critical_path(root, by_parent):
+        print(
+            f"  {self_time(s, by_parent):9.1f} ms  {s['name']}{_fmt_attrs(s)}", file=out
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Show the critical path of a Continuum turn."
+    )
+    parser.add_argument("--file", default=os.path.join(TRACE_DIR, TRACE_FILE))
+    parser.add_argument("--trace", help="trace id (prefix) to show; default: last turn")
+    parser.add_argument(
+        "--list", type=int, metavar="N", help="list the N most recent turns"
+    )
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.file):
+        print(f"No trace file at {args.file}", file=sys.stderr)
+        return 1
+
+    traces = load_traces(args.file)
+    if not traces:
+        print("Trace file is empty", file=sys.stderr)
+        return 1
+
+    if args.list:
+        for t in traces[-args.list:]:
+            spans = len(t.get("spans", []))
+            print(f"{t['trace_id']}  {t['duration_ms']:9.1f} ms  {spans} spans")
+        return 0
+
+    if args.trace:
+        matches = [t for t in traces if t["trace_id"].startswith(args.trace)]
+        if not matches:
+            print(f"No trace matching {args.trace}", file=sys.stderr)
+            return 1
+        trace = matches[-1]
+    else:
+        trace = traces[-1]
+
+    print_trace(trace)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,32 @@
 
 """
 Conversation context for The Continuum.
-Tracks messages, memory snapshots, and user profile data.
+Tracks recent messages (a bounded window), memory snapshots,
+and user profile data.
 """
 
 from __future__ import annotations
-import inspect
-import traceback
 
+import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .types import Message
 from continuum.memory.continuum_memory import ContinuumMemory
 
+# ---------------------------------------------------------
+# Context events
+# ---------------------------------------------------------
+# Observers are called as observer(context, message). Nothing runs (no
+# frame inspection, no I/O) unless an observer has been subscribed.
+MESSAGE_ADDED = "message_added"
+
+# Messages kept in the live window; the full history is in the turn store
+MAX_MESSAGES = int(os.getenv("CONTINUUM_MAX_MESSAGES", 200))
+
+ContextObserver = Callable[["ContinuumContext", Message], None]
+
+
 @dataclass
 class ContinuumContext:
     conversation_id: str
@@ -24,43 +37,62 @@ class ContinuumContext:
     user_profile: Dict[str, Any] = field(default_factory=dict)
     debug_flags: Dict[str, bool] = field(default_factory=dict)
     memory: ContinuumMemory = field(default_factory=ContinuumMemory)
+    # Embedding-indexed facts (memory.semantic.SemanticMemory); optional
+    semantic_memory: Any = None
+    # Hybrid episodic + semantic recall (memory.retrieval.MemoryRetriever); optional
+    memory_retriever: Any = None
+    # Rolling summary of all episodes (memory.summarizer.MemorySummarizer); optional
+    memory_summarizer: Any = None
 
     # Phase‑4 emotional fields
     emotional_state: Any = None
     emotional_memory: Any = None
 
+    max_messages: int = MAX_MESSAGES
+
+    # event name -> observers
+    observers: Dict[str, List[ContextObserver]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # ---------------------------------------------------------
+    # Observers
+    # ---------------------------------------------------------
+    def subscribe(self, event: str, observer: ContextObserver) -> Callable[[], None]:
+        """Register an observer; returns a function that unsubscribes it."""
+        self.observers.setdefault(event, []).append(observer)
+        return lambda: self.unsubscribe(event, observer)
+
+    def unsubscribe(self, event: str, observer: ContextObserver) -> None:
+        observers = self.observers.get(event)
+        if observers and observer in observers:
+            observers.remove(observer)
+            if not observers:
+                del self.observers[event]
+
+    def _emit(self, event: str, message: Message) -> None:
+        for observer in tuple(self.observers.get(event, ())):
+            observer(self, message)
+
+    # ---------------------------------------------------------
+    # Messages
+    # ---------------------------------------------------------
     def add(self, role: str, content: str, **meta: Any) -> None:
         """Append a new message to the conversation."""
-        self.messages.append(Message(role=role, content=content, metadata=meta))
+        message = Message(role=role, content=content, metadata=meta)
+        self.messages.append(message)
+        overflow = len(self.messages) - self.max_messages
+        if self.max_messages > 0 and overflow > 0:
+            del self.messages[:overflow]
+        if self.observers:
+            self._emit(MESSAGE_ADDED, message)
 
     def add_user_message(self, content: str) -> None:
         self.add("user", content)
 
-    #def add_assistant_message(self, content: str) -> None:
-        #self.add("assistant", content)
-        #print("ADD_ASSISTANT_MESSAGE CALLED:", content[:50])
-
     def add_assistant_message(self, content: str) -> None:
         self.add("assistant", content)
 
-        print("\n================ ASSISTANT MESSAGE DEBUG ================")
-        print("CONTENT PREVIEW:", repr(content[:200]))
-        print("TYPE:", type(content))
-
-        # Who called this function?
-        stack = traceback.extract_stack(limit=5)
-        print("CALL STACK:")
-        for frame in stack:
-            print(f"  - {frame.filename}:{frame.lineno} in {frame.name}")
-
-        # Which module invoked it?
-        caller = inspect.stack()[1]
-        print("CALLER MODULE:", caller.frame.f_globals.get("__name__"))
-
-        print("=========================================================\n")
-
-
-
     def last_user_message(self) -> Optional[Message]:
         for msg in reversed(self.messages):
             if msg.role == "user":
@@ -70,15 +102,60 @@ class ContinuumContext:
     def history(self) -> List[Message]:
         return self.messages
 
-    def get_text_window(self, n: int = 8) -> str:
-        """Return the last n messages as plain text for prompt templates."""
-        return "\n".join([m.content for m in self.messages[-n:]])
+    def get_text_window(self, n: int = 8, max_tokens: Optional[int] = None) -> str:
+        """
+        Return up to the last n messages as plain text for prompt templates.
+        With max_tokens, older messages are dropped until the window fits.
+        """
+        window = [m.content for m in self.messages[-n:]]
+        if max_tokens is None:
+            return "\n".join(window)
+
+        from continuum.llm.prompt_budget import token_counter
+
+        kept, used = [], 0
+        for content in reversed(window):
+            n_tokens = token_counter.count(content)
+            if used + n_tokens > max_tokens:
+                break
+            kept.append(content)
+            used += n_tokens
+        return "\n".join(reversed(kept))
+
+    def get_memory_summary(self, query: Optional[str] = None, k: int = 5) -> str:
+        """
+        Return the rolling memory summary (if there is a memory_summarizer)
+        followed by the k memories most relevant to `query` (default: the
+        last user message), or an empty string if there are none. Both
+        parts are cached: the summary until memory changes, recall for the
+        current turn.
+        """
+        rolling = (
+            self.memory_summarizer.summary()
+            if self.memory_summarizer is not None
+            else ""
+        )
+        recalled = self._recall(query, k)
+        return "\n".join(part for part in (rolling, recalled) if part)
+
+    def _recall(self, query: Optional[str], k: int) -> str:
+        if query is None:
+            last = self.last_user_message()
+            query = last.content if last else ""
+
+        retriever = self.memory_retriever
+        if retriever is not None and len(retriever):
+            from continuum.core.tracing import current_trace_id
+
+            return retriever.summary(query, k, turn_id=current_trace_id())
+
+        semantic = self.semantic_memory
+        if semantic is not None and len(semantic):
+            hits = semantic.search(query, k)
+            if hits:
+                return "\n".join(f"- {key}: {value}" for key, value, _ in hits)
 
-    def get_memory_summary(self) -> str:
-        """Return a compact summary of semantic memory, or empty string."""
-        if not hasattr(self, "memory") or not self.memory:
-            return ""
         if hasattr(self.memory, "semantic") and self.memory.semantic:
             keys = list(self.memory.semantic.keys())
-            return "Semantic memory keys: " + ", ".join(keys[:5])
-        return ""
\ No newline at end of file
+            return "Semantic memory keys: " + ", ".join(keys[:k])
+        return ""
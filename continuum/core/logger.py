@@ -1,7 +1,9 @@
 # continuum/core/logger.py
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from uuid import uuid4
 
 logging.getLogger().handlers.clear()
@@ -13,6 +15,11 @@ sys.stdout.reconfigure(encoding='utf-8')
 # Generate session ID once per run
 SESSION_ID = os.getenv("CONTINUUM_SESSION_ID", f"session-{uuid4().hex[:8]}")
 
+# Minimum level emitted by every logger, third-party ones included (DEBUG, INFO, ...)
+LOG_LEVEL = getattr(
+    logging, os.getenv("CONTINUUM_LOG_LEVEL", "DEBUG").upper(), logging.DEBUG
+)
+
 # Ensure log directory exists
 BASE_LOG_DIR = os.path.join(os.getcwd(), "logs", "sessions")
 os.makedirs(BASE_LOG_DIR, exist_ok=True)
@@ -24,19 +31,53 @@ SESSION_LOG_PATH = os.path.join(BASE_LOG_DIR, f"{SESSION_ID}.log")
 ERROR_LOG_PATH = os.path.join(os.getcwd(), "logs", "errors.log")
 DEBUG_LOG_PATH = os.path.join(os.getcwd(), "logs", "debug.log")
 
-# Configure root logger with UTF‑8 encoding
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] [%(message)s",
-    handlers=[
+LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(message)s"
+ERROR_LOG_FORMAT = "%(asctime)s [%(session)s] [%(phase)s] %(message)s"
+
+
+# ---------------------------------------------------------
+# Handlers (run on the listener thread, not the caller's)
+# ---------------------------------------------------------
+def _build_handlers():
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    handlers = [
         logging.FileHandler(SESSION_LOG_PATH, encoding="utf-8"),
         logging.FileHandler(DEBUG_LOG_PATH, encoding="utf-8"),
-        logging.StreamHandler()
+        logging.StreamHandler(),
     ]
+    for h in handlers:
+        h.setFormatter(formatter)
+
+    # errors.log stays open for the whole run instead of being
+    # reopened on every log_error call
+    error_handler = logging.FileHandler(ERROR_LOG_PATH, encoding="utf-8")
+    error_handler.setLevel(logging.ERROR)
+    # Records from other loggers (sqlalchemy, urllib3, ...) carry no
+    # session/phase; the defaults keep them formattable
+    error_handler.setFormatter(logging.Formatter(
+        ERROR_LOG_FORMAT, defaults={"session": SESSION_ID, "phase": "-"}
+    ))
+    handlers.append(error_handler)
+
+    return handlers
+
+
+# Callers only enqueue records; one listener thread formats and writes them
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener = logging.handlers.QueueListener(
+    _log_queue, *_build_handlers(), respect_handler_level=True
 )
+_listener.start()
+atexit.register(_listener.stop)
+
+root = logging.getLogger()
+root.setLevel(LOG_LEVEL)
+root.addHandler(logging.handlers.QueueHandler(_log_queue))
 
 # Create named loggers
 logger = logging.getLogger("continuum")
+logger.setLevel(LOG_LEVEL)
 
 # Inject session + phase into log records
 class ContextFilter(logging.Filter):
@@ -48,14 +89,30 @@ class ContextFilter(logging.Filter):
 
 logger.addFilter(ContextFilter())
 
-def log_error(message, phase="error"):
-    logger.error(message, extra={"phase": phase})
-    # Write UTF‑8 here too
-    with open(ERROR_LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(f"{datetime.now()} [{SESSION_ID}] [{phase}] {message}\n")
 
-def log_debug(message, phase="debug"):
-    logger.debug(message, extra={"phase": phase})
+def debug_enabled() -> bool:
+    """
+    Guard for expensive debug output (large repr()s, dumps):
+
+        if debug_enabled():
+            log_debug("[SENATE] Ranked: %r", ranked, phase="senate")
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+# Messages may use %-style args; they are only formatted if the record
+# is actually emitted.
+def log_error(message, *args, phase="error"):
+    logger.error(message, *args, extra={"phase": phase})
+
+def log_debug(message, *args, phase="debug"):
+    logger.debug(message, *args, extra={"phase": phase})
+
+def log_info(message, *args, phase="info"):
+    logger.info(message, *args, extra={"phase": phase})
+
 
-def log_info(message, phase="info"):
-    logger.info(message, extra={"phase": phase})
\ No newline at end of file
+def flush_logs() -> None:
+    """Block until every queued record is written (tests, benchmarks, shutdown)."""
+    _listener.stop()
+    _listener.start()
@@ -0,0 +1,542 @@
+# continuum/core/snapshot.py
+
+"""
+Versioned binary snapshots of per-conversation state.
+
+    snapshotter = ConversationSnapshotter(controller)
+    snapshotter.save()                      # after a turn: full or delta frame
+    snapshotter.restore(conversation_id)    # on another worker / after restart
+
+What is captured (each part only if the controller has it):
+    context            conversation id, message window, profile, flags
+                       (minus the per-turn TRANSIENT_DEBUG_FLAGS)
+    memory             ContinuumMemory records (key, value, metadata, ts)
+    emotional_state    EmotionalState fields
+    emotional_memory   smoothed state, trend/volatility, events
+    arc_history        EmotionalArcEngine.history
+    fusion             FusionSmoother.prev_weights
+    turns              TurnStore index and in-memory turns (the spill log
+                       stays on disk; see TurnStore.export_state)
+    memory_store       MemoryStore episodes and semantic facts
+    summary            MemorySummarizer text, checkpoint and fold state
+
+Embeddings are not stored. On restore the MemoryRetriever and the
+SemanticMemory index are rebuilt from the restored episodes and facts.
+Each one is re-embedded, except episodes whose vector an on-disk index
+(CONTINUUM_EMBEDDING_DIR) still holds.
+
+File layout: <CONTINUUM_SNAPSHOT_DIR>/<conversation_id>.snap, with the
+id percent-encoded, is a log of frames, each a fixed header followed by
+the encoded payload:
+
+    magic b"CSNP" | schema u16 | codec u8 | kind u8 | seq u64 | base u64 | length u32
+
+The first frame is a full snapshot; the following ones are deltas
+against the frame before them. Every CONTINUUM_SNAPSHOT_FULL_EVERY saves
+the file is rewritten (atomically) with one full frame. A torn last frame
+is ignored on load.
+
+A delta is computed against the previously saved state, key by key:
+unchanged values are omitted, dicts are patched recursively, and lists
+that only gained items at the end (and lost some at the front, as the
+bounded message/event windows do) are sent as a splice of the new tail.
+A turn therefore writes roughly one message pair, one event and one turn
+record instead of the whole conversation.
+
+Payloads are msgpack when it is installed, JSON otherwise; the codec is
+recorded per frame, so either can read what the other wrote (given the
+library). Frames from a newer schema are rejected with SnapshotError.
+
+Restore is dominated by re-indexing ContinuumMemory and the episodic
+and semantic memories for search (indexes are rebuilt, not stored); see
+bench/bench_snapshot.py.
+
+Environment:
+    CONTINUUM_SNAPSHOT_DIR         snapshot directory (unset disables autosave)
+    CONTINUUM_SNAPSHOT_FULL_EVERY  saves between full frames (default 50)
+"""
+
+import json
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from continuum.core.logger import log_debug, log_error
+from continuum.core.tracing import span
+from continuum.core.types import Message
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+SCHEMA_VERSION = 1
+
+SNAPSHOT_DIR = os.getenv("CONTINUUM_SNAPSHOT_DIR")
+FULL_EVERY = int(os.getenv("CONTINUUM_SNAPSHOT_FULL_EVERY", 50))
+
+MAGIC = b"CSNP"
+HEADER = struct.Struct("<4sHBBQQI")
+
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+KIND_FULL = 0
+KIND_DELTA = 1
+
+# debug_flags the Senate overwrites on every turn (for the UI panels);
+# not conversation state, and large enough to swamp every delta
+TRANSIENT_DEBUG_FLAGS = frozenset({
+    "raw_proposals",
+    "filtered_proposals",
+    "topic",
+    "topic_weights",
+    "similarity_matrix",
+})
+
+# Front items a bounded list may have lost between two saves for the
+# change to still be sent as a splice rather than the whole list
+MAX_SPLICE_DROP = 64
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------
+# Codec
+# ---------------------------------------------------------
+def default_codec() -> int:
+    return CODEC_MSGPACK if msgpack is not None else CODEC_JSON
+
+
+def encode_payload(payload: Any, codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise SnapshotError("msgpack is not installed")
+        return msgpack.packb(payload, use_bin_type=True, default=str)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def decode_payload(data: bytes, codec: int) -> Any:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise SnapshotError(
+                "snapshot frame is msgpack but msgpack is not installed"
+            )
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if codec == CODEC_JSON:
+        return json.loads(data)
+    raise SnapshotError(f"unknown snapshot codec {codec}")
+
+
+@dataclass(frozen=True)
+class Frame:
+    kind: int
+    seq: int
+    base: int  # seq of the frame a delta applies to (== seq for full frames)
+    payload: Any
+
+
+def encode_frame(
+    kind: int, seq: int, base: int, payload: Any, codec: Optional[int] = None
+) -> bytes:
+    codec = default_codec() if codec is None else codec
+    body = encode_payload(payload, codec)
+    return HEADER.pack(MAGIC, SCHEMA_VERSION, codec, kind, seq, base, len(body)) + body
+
+
+def iter_frames(data: bytes) -> Iterator[Frame]:
+    """Frames in a snapshot log; stops quietly at a torn last frame."""
+    view = memoryview(data)
+    pos = 0
+    while pos + HEADER.size <= len(view):
+        magic, schema, codec, kind, seq, base, length = HEADER.unpack_from(view, pos)
+        if magic != MAGIC:
+            raise SnapshotError(f"bad snapshot frame at byte {pos}")
+        if schema > SCHEMA_VERSION:
+            raise SnapshotError(
+                f"snapshot schema {schema} is newer than supported ({SCHEMA_VERSION})"
+            )
+        start = pos + HEADER.size
+        if start + length > len(view):
+            log_error(f"[SNAPSHOT] Ignoring torn frame at byte {pos}", phase="snapshot")
+            return
+        yield Frame(
+            kind, seq, base, decode_payload(bytes(view[start:start + length]), codec)
+        )
+        pos = start + length
+
+
+# ---------------------------------------------------------
+# Deltas
+# ---------------------------------------------------------
+# Ops: ["s", value]         set
+#      ["p", {key: op}, [deleted keys]]   patch a dict
+#      ["a", drop, tail]    drop `drop` items from the front, append tail
+def diff(old: Any, new: Any) -> Optional[list]:
+    """Op turning old into new, or None if they are equal."""
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        put = {}
+        for key, value in new.items():
+            if key not in old:
+                put[key] = ["s", value]
+            else:
+                op = diff(old[key], value)
+                if op is not None:
+                    put[key] = op
+        deleted = [key for key in old if key not in new]
+        return ["p", put, deleted]
+    if isinstance(old, list) and isinstance(new, list) and old:
+        for drop in range(min(len(old), MAX_SPLICE_DROP) + 1):
+            kept = len(old) - drop
+            if kept <= len(new) and new[:kept] == old[drop:]:
+                if kept == 0:
+                    break
+                return ["a", drop, new[kept:]]
+    return ["s", new]
+
+
+def apply(value: Any, op: list) -> Any:
+    """Apply a diff() op; dicts and lists are updated in place where possible."""
+    kind = op[0]
+    if kind == "s":
+        return op[1]
+    if kind == "p":
+        for key, sub in op[1].items():
+            value[key] = apply(value.get(key), sub)
+        for key in op[2]:
+            value.pop(key, None)
+        return value
+    if kind == "a":
+        del value[:op[1]]
+        value.extend(op[2])
+        return value
+    raise SnapshotError(f"unknown delta op {kind!r}")
+
+
+# ---------------------------------------------------------
+# Capture / restore
+# ---------------------------------------------------------
+def _copy(mapping: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return None if mapping is None else dict(mapping)
+
+
+_CONTAINERS = (dict, list, tuple)
+
+
+def _detach(value: Any) -> Any:
+    """Deep copy of nested dicts/lists/tuples (tuples become lists)."""
+    if isinstance(value, dict):
+        return {
+            key: _detach(item) if isinstance(item, _CONTAINERS) else item
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [
+            _detach(item) if isinstance(item, _CONTAINERS) else item
+            for item in value
+        ]
+    return value
+
+
+def capture(controller) -> Dict[str, Any]:
+    """
+    Per-conversation state of a controller as plain lists/dicts/scalars.
+
+    Nothing in it is shared with the controller (metadata dicts and the
+    like are deep-copied), so it can serve as the base of the next delta
+    and a later in-place edit still shows up in that delta.
+    """
+    context = controller.context
+    state: Dict[str, Any] = {
+        "context": {
+            "conversation_id": context.conversation_id,
+            "memory_snapshot": _detach(context.memory_snapshot),
+            "user_profile": _detach(context.user_profile),
+            "debug_flags": {
+                k: _detach(v)
+                for k, v in context.debug_flags.items()
+                if k not in TRANSIENT_DEBUG_FLAGS
+            },
+            "max_messages": context.max_messages,
+        },
+        "messages": [
+            [m.role, m.content, _detach(m.metadata)] for m in context.messages
+        ],
+        "memory": {
+            r.key: [_detach(r.value), _detach(r.metadata), r.ts]
+            for r in context.memory.records()
+        },
+    }
+
+    emotional_state = getattr(controller, "emotional_state", None)
+    if emotional_state is not None:
+        state["emotional_state"] = emotional_state.as_dict()
+
+    emotional_memory = getattr(controller, "emotional_memory", None)
+    if emotional_memory is not None:
+        state["emotional_memory"] = {
+            "smoothing_factor": emotional_memory.smoothing_factor,
+            "max_events": emotional_memory.max_events,
+            "smoothed_state": dict(emotional_memory.smoothed_state),
+            "previous_smoothed_state": _copy(emotional_memory.previous_smoothed_state),
+            "short_term_emotion": emotional_memory.short_term_emotion,
+            "long_term_emotion": emotional_memory.long_term_emotion,
+            "volatility": emotional_memory.volatility,
+            "confidence": emotional_memory.confidence,
+            "last_update_ts": emotional_memory.last_update_ts,
+        }
+        state["emotional_events"] = [
+            [e.timestamp, _detach(e.raw_state), e.dominant_emotion, _detach(e.metadata)]
+            for e in emotional_memory.events
+        ]
+
+    arc_engine = getattr(controller, "emotional_arc_engine", None)
+    if arc_engine is not None:
+        state["arc_history"] = _detach(arc_engine.history)
+
+    smoother = getattr(controller, "fusion_smoother", None)
+    if smoother is not None:
+        state["fusion"] = {"prev_weights": _copy(smoother.prev_weights)}
+
+    turn_store = getattr(controller, "turn_store", None)
+    if turn_store is not None:
+        state["turns"] = turn_store.export_state()
+
+    memory_store = getattr(controller, "memory_store", None)
+    if memory_store is not None:
+        state["memory_store"] = _detach(memory_store.export_state())
+
+    summarizer = getattr(context, "memory_summarizer", None)
+    if summarizer is not None:
+        state["summary"] = summarizer.export_state()
+
+    return state
+
+
+def _reindex_memories(controller, memory_store) -> None:
+    """
+    Rebuild recall over a restored MemoryStore. The lexical index is not
+    saved; an episode's vector is reused when an on-disk vector index
+    still holds it, and vectors for memories the snapshot lacks are dropped.
+    """
+    retriever = getattr(controller, "memory_retriever", None)
+    if retriever is not None:
+        retriever.clear()
+        for episode in memory_store.episodic:
+            if episode.episode_id:
+                retriever.add_episode(
+                    episode.episode_id,
+                    episode.content,
+                    ts=episode.ts,
+                    reuse_vector=True,
+                )
+
+    reindexed = False
+    semantic_memory = getattr(controller.context, "semantic_memory", None)
+    if semantic_memory is not None:
+        try:
+            # Also re-adds the facts to its retriever
+            semantic_memory.reindex()
+            reindexed = True
+        except Exception as e:
+            # No embedding model here: the facts are restored, recall is lexical
+            log_error("[SNAPSHOT] Could not re-embed facts: %s", e, phase="snapshot")
+    if retriever is not None:
+        if not reindexed:
+            for key, value in memory_store.semantic.items():
+                retriever.add_fact(key, value)
+        retriever.prune_vectors()
+
+
+def restore(controller, state: Dict[str, Any]) -> None:
+    """Load captured state into an initialized controller, in place."""
+    from continuum.memory.memory_record import MemoryRecord
+    from continuum.memory.ring_buffer import RingBuffer
+    from continuum.persona.emotional_memory import EmotionalEvent
+
+    context = controller.context
+    fields = state["context"]
+    context.conversation_id = fields["conversation_id"]
+    context.memory_snapshot = fields["memory_snapshot"]
+    context.user_profile = fields["user_profile"]
+    context.debug_flags = fields["debug_flags"]
+    context.max_messages = fields["max_messages"]
+    context.messages = [
+        Message(role=r, content=c, metadata=m) for r, c, m in state["messages"]
+    ]
+
+    # Cleared in place: the controller and the compactor hold this object
+    context.memory.clear()
+    for key, (value, metadata, ts) in state["memory"].items():
+        context.memory.put(MemoryRecord(key=key, value=value, metadata=metadata, ts=ts))
+
+    emotional_state = getattr(controller, "emotional_state", None)
+    if emotional_state is not None and "emotional_state" in state:
+        for name, value in state["emotional_state"].items():
+            setattr(emotional_state, name, value)
+
+    emotional_memory = getattr(controller, "emotional_memory", None)
+    if emotional_memory is not None and "emotional_memory" in state:
+        for name, value in state["emotional_memory"].items():
+            setattr(emotional_memory, name, value)
+        emotional_memory.events = RingBuffer(emotional_memory.max_events)
+        emotional_memory.events.extend(
+            EmotionalEvent(*e) for e in state["emotional_events"]
+        )
+
+    arc_engine = getattr(controller, "emotional_arc_engine", None)
+    if arc_engine is not None and "arc_history" in state:
+        arc_engine.history[:] = state["arc_history"]
+
+    smoother = getattr(controller, "fusion_smoother", None)
+    if smoother is not None and "fusion" in state:
+        smoother.prev_weights = state["fusion"]["prev_weights"]
+
+    turn_store = getattr(controller, "turn_store", None)
+    if turn_store is not None and "turns" in state:
+        turn_store.load_state(state["turns"])
+
+    memory_store = getattr(controller, "memory_store", None)
+    if memory_store is not None and "memory_store" in state:
+        memory_store.load_state(state["memory_store"])
+        _reindex_memories(controller, memory_store)
+
+    summarizer = getattr(context, "memory_summarizer", None)
+    if summarizer is not None and "summary" in state:
+        summarizer.load_state(state["summary"])
+
+
+def load_state(data: bytes) -> Tuple[Dict[str, Any], int]:
+    """Replay a snapshot log; returns (state, seq of the last frame applied)."""
+    state: Optional[Dict[str, Any]] = None
+    seq = -1
+    for frame in iter_frames(data):
+        if frame.kind == KIND_FULL:
+            state, seq = frame.payload, frame.seq
+        elif state is None or frame.base != seq:
+            raise SnapshotError(f"delta {frame.seq} does not follow frame {seq}")
+        else:
+            state, seq = apply(state, frame.payload), frame.seq
+    if state is None:
+        raise SnapshotError("snapshot has no full frame")
+    return state, seq
+
+
+# ---------------------------------------------------------
+# Snapshotter
+# ---------------------------------------------------------
+class ConversationSnapshotter:
+    """Saves a controller's conversation as a full frame plus deltas."""
+
+    def __init__(
+        self,
+        controller,
+        directory: Optional[str] = None,
+        full_every: int = FULL_EVERY,
+        codec: Optional[int] = None,
+    ):
+        self.controller = controller
+        self.codec = default_codec() if codec is None else codec
+        self.directory = (
+            directory or SNAPSHOT_DIR or os.path.join(os.getcwd(), "logs", "snapshots")
+        )
+        self.full_every = max(1, full_every)
+        # State as of the last frame written
+        self._base: Optional[Dict[str, Any]] = None
+        self._seq = -1
+        self._deltas = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, conversation_id: str) -> str:
+        # Percent-encoded: ids are caller-chosen and may contain "/"
+        name = quote(conversation_id, safe="")
+        return os.path.join(self.directory, f"{name}.snap")
+
+    def save(self, full: bool = False) -> int:
+        """Write the current state; returns the number of bytes written."""
+        with self._lock:
+            try:
+                return self._save(full)
+            except Exception:
+                # The log may now end mid-chain; start a fresh one next time
+                self._base = None
+                raise
+
+    def _save(self, full: bool) -> int:
+        state = capture(self.controller)
+        path = self.path_for(state["context"]["conversation_id"])
+        base = self._base
+        if (
+            base is not None
+            and base["context"]["conversation_id"]
+            != state["context"]["conversation_id"]
+        ):
+            base = None
+        with span("snapshot.save") as sp:
+            if (
+                full
+                or base is None
+                or self._deltas + 1 >= self.full_every
+                or not os.path.exists(path)
+            ):
+                self._seq += 1
+                frame = encode_frame(KIND_FULL, self._seq, self._seq, state, self.codec)
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = f"{path}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(frame)
+                os.replace(tmp, path)
+                self._deltas = 0
+                kind = "full"
+            else:
+                op = diff(base, state)
+                if op is None:
+                    return 0
+                self._seq += 1
+                frame = encode_frame(
+                    KIND_DELTA, self._seq, self._seq - 1, op, self.codec
+                )
+                with open(path, "ab") as f:
+                    f.write(frame)
+                self._deltas += 1
+                kind = "delta"
+            sp.set(kind=kind, bytes=len(frame))
+        # Captured lists/dicts are fresh copies, so they can serve as the next base
+        self._base = state
+        log_debug(
+            "[SNAPSHOT] Wrote %s frame %d (%d bytes) to %s",
+            kind,
+            self._seq,
+            len(frame),
+            path,
+            phase="snapshot",
+        )
+        return len(frame)
+
+    def restore(self, conversation_id: str) -> bool:
+        """Load a saved conversation into the controller; False if none is saved."""
+        path = self.path_for(conversation_id)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        with self._lock, span("snapshot.restore", bytes=len(data)):
+            state, seq = load_state(data)
+            restore(self.controller, state)
+            # The log may end in a torn frame, so the next save rewrites it in full
+            self._base = None
+            self._seq = seq
+        log_debug(
+            "[SNAPSHOT] Restored %s at frame %d", conversation_id, seq, phase="snapshot"
+        )
+        return True
@@ -0,0 +1,281 @@
+# continuum/core/tracing.py
+
+"""
+Lightweight per-turn tracing.
+
+    with start_trace("turn", message_len=len(message)):
+        with span("router.route") as sp:
+            ...
+            sp.set(model=top_model)
+
+    @traced("jury.score_all")
+    def score_all(...): ...
+
+Spans carry an id, parent id, start offset, duration and a few
+attributes. The active trace/span live in contextvars, so nesting works
+across function calls; code that hands work to other threads must run
+it under contextvars.copy_context() (see Senate.gather_proposals).
+
+When a turn's root trace closes, the whole trace is written as one JSON
+line to a size-rotated file (logs/traces/turns.jsonl by default).
+Outside an active trace, span() is a near-free no-op.
+
+Environment:
+    CONTINUUM_TRACING=0          disable tracing entirely
+    CONTINUUM_TRACE_DIR          directory for turns.jsonl
+    CONTINUUM_TRACE_MAX_BYTES    rotate after this many bytes (default 10 MB)
+    CONTINUUM_TRACE_BACKUPS      rotated files to keep (default 5)
+"""
+
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from continuum.core.logger import SESSION_ID, log_error
+
+TRACING_ENABLED = os.getenv("CONTINUUM_TRACING", "1") not in ("0", "false", "False")
+TRACE_DIR = os.getenv(
+    "CONTINUUM_TRACE_DIR", os.path.join(os.getcwd(), "logs", "traces")
+)
+TRACE_FILE = "turns.jsonl"
+TRACE_MAX_BYTES = int(os.getenv("CONTINUUM_TRACE_MAX_BYTES", 10 * 1024 * 1024))
+TRACE_BACKUPS = int(os.getenv("CONTINUUM_TRACE_BACKUPS", 5))
+
+# Bounds that keep per-turn overhead and line size predictable
+MAX_SPANS_PER_TRACE = 512
+MAX_ATTR_CHARS = 200
+
+
+def _clip(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    value = str(value)
+    return value if len(value) <= MAX_ATTR_CHARS else value[:MAX_ATTR_CHARS] + "…"
+
+
+# ---------------------------------------------------------
+# Spans
+# ---------------------------------------------------------
+class Span:
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "thread",
+        "start",
+        "end",
+        "attrs",
+        "error",
+    )
+
+    def __init__(
+        self, trace: "Trace", span_id: int, parent_id: Optional[int], name: str, attrs
+    ):
+        self.trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.thread = threading.current_thread().name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attrs = {k: _clip(v) for k, v in attrs.items()} if attrs else {}
+        self.error: Optional[str] = None
+
+    def set(self, **attrs) -> "Span":
+        for k, v in attrs.items():
+            self.attrs[k] = _clip(v)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        origin = self.trace.origin
+        end = self.end if self.end is not None else time.perf_counter()
+        data = {
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000.0, 3),
+            "duration_ms": round((end - self.start) * 1000.0, 3),
+            "thread": self.thread,
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _NoopSpan:
+    """Returned when no trace is active; every operation is a no-op."""
+
+    __slots__ = ()
+    span_id = None
+
+    def set(self, **attrs) -> "_NoopSpan":
+        return self
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """All spans of one turn."""
+
+    def __init__(self, name: str):
+        self.trace_id = uuid4().hex
+        self.name = name
+        self.wall_start = time.time()
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    def new_span(self, name: str, parent_id: Optional[int], attrs) -> Optional[Span]:
+        with self._lock:
+            if len(self.spans) >= MAX_SPANS_PER_TRACE:
+                self.dropped += 1
+                return None
+            sp = Span(self, next(self._ids), parent_id, name, attrs)
+            self.spans.append(sp)
+            return sp
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = [s.to_dict() for s in self.spans]
+        root = spans[0] if spans else {"duration_ms": 0.0}
+        return {
+            "trace_id": self.trace_id,
+            "session": SESSION_ID,
+            "name": self.name,
+            "ts": self.wall_start,
+            "duration_ms": root["duration_ms"],
+            "dropped_spans": self.dropped,
+            "spans": spans,
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar(
+    "continuum_trace", default=None
+)
+_current_span: ContextVar[Optional[Span]] = ContextVar("continuum_span", default=None)
+
+
+def current_span():
+    """The active span, or NOOP_SPAN outside a trace."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def current_trace_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Any]:
+    trace = _current_trace.get()
+    if trace is None:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    sp = trace.new_span(name, parent.span_id if parent else None, attrs)
+    if sp is None:
+        yield NOOP_SPAN
+        return
+
+    token = _current_span.set(sp)
+    try:
+        yield sp
+    except BaseException as e:
+        sp.error = _clip(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        sp.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def traced(name: str):
+    """Decorator form of span(); attributes can be added via current_span().set()."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def start_trace(name: str = "turn", **attrs) -> Iterator[Any]:
+    """
+    Open a new trace with a root span. On exit the trace is written to
+    the trace file. Nested calls just open a child span.
+    """
+    if not TRACING_ENABLED:
+        yield NOOP_SPAN
+        return
+
+    if _current_trace.get() is not None:
+        with span(name, **attrs) as sp:
+            yield sp
+        return
+
+    trace = Trace(name)
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, **attrs) as root:
+            yield root
+    finally:
+        _current_trace.reset(trace_token)
+        trace_writer.write(trace)
+
+
+# ---------------------------------------------------------
+# Writer (one JSON line per trace, size-rotated)
+# ---------------------------------------------------------
+class TraceWriter:
+    def __init__(self, directory: str = TRACE_DIR):
+        self.path = os.path.join(directory, TRACE_FILE)
+        self._handler: Optional[logging.handlers.RotatingFileHandler] = None
+        self._lock = threading.Lock()
+
+    def _get_handler(self) -> logging.handlers.RotatingFileHandler:
+        if self._handler is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.path,
+                maxBytes=TRACE_MAX_BYTES,
+                backupCount=TRACE_BACKUPS,
+                encoding="utf-8",
+            )
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+        return self._handler
+
+    def write(self, trace: Trace) -> None:
+        try:
+            line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str)
+            record = logging.makeLogRecord({"msg": line, "levelno": logging.INFO})
+            with self._lock:
+                self._get_handler().emit(record)
+        except Exception as e:
+            log_error(
+                f"[TRACE] Failed to write trace {trace.trace_id}: {e}", phase="trace"
+            )
+
+
+trace_writer = TraceWriter()
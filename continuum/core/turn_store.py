@@ -0,0 +1,319 @@
+# continuum/core/turn_store.py
+
+"""
+Bounded turn history.
+
+The newest `capacity` turns live in memory as compact __slots__ records
+(strings and a few scalars, no proposal/routing dicts). Older turns are
+spilled to an append-only JSONL log, one line per turn; an offset index
+(sequence -> byte offset, turn_id -> sequence) gives random access to
+spilled turns without scanning the file. The log is
+<CONTINUUM_TURN_DIR>/<conversation_id>.jsonl, with the id percent-encoded.
+
+    store = TurnStore(conversation_id)
+    store.append(TurnRecord.from_turn(...))
+    store.get(turn_id)
+    store.page(0, page_size=10)      # newest first
+
+Environment:
+    CONTINUUM_TURN_CAPACITY   in-memory turns (default 200)
+    CONTINUUM_TURN_DIR        spill directory (default logs/turns)
+"""
+
+import json
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from uuid import uuid4
+
+from continuum.core.logger import log_debug, log_error
+
+TURN_CAPACITY = int(os.getenv("CONTINUUM_TURN_CAPACITY", 200))
+TURN_DIR = os.getenv("CONTINUUM_TURN_DIR", os.path.join(os.getcwd(), "logs", "turns"))
+
+# Text fields are clipped so one pathological turn can't bloat the store
+MAX_TEXT_CHARS = 8000
+
+
+def _spill_path(directory: str, conversation_id: str) -> str:
+    # Percent-encoded like snapshot paths: ids may contain "/" or ".."
+    return os.path.join(directory, f"{quote(conversation_id, safe='')}.jsonl")
+
+
+def _clip(text: Any) -> str:
+    text = "" if text is None else str(text)
+    return text if len(text) <= MAX_TEXT_CHARS else text[:MAX_TEXT_CHARS] + "…"
+
+
+# ---------------------------------------------------------
+# Record
+# ---------------------------------------------------------
+class TurnRecord:
+    """One turn, reduced to what the timeline/diagnostics panels show."""
+
+    __slots__ = (
+        "turn_id",
+        "seq",
+        "ts",
+        "user",
+        "assistant",
+        "emotion",
+        "intensity",
+        "winner",
+        "confidence",
+        "intent",
+        "model",
+        "node",
+        "proposals",   # tuple of (actor, confidence)
+    )
+
+    def __init__(
+        self,
+        turn_id: str,
+        user: str,
+        assistant: str,
+        emotion: Optional[str] = None,
+        intensity: float = 0.0,
+        winner: Optional[str] = None,
+        confidence: Optional[float] = None,
+        intent: Optional[str] = None,
+        model: Optional[str] = None,
+        node: Optional[str] = None,
+        proposals: Tuple[Tuple[str, Optional[float]], ...] = (),
+        ts: Optional[float] = None,
+        seq: int = -1,
+    ):
+        self.turn_id = turn_id
+        self.seq = seq
+        self.ts = ts if ts is not None else time.time()
+        self.user = _clip(user)
+        self.assistant = _clip(assistant)
+        self.emotion = emotion
+        self.intensity = float(intensity or 0.0)
+        self.winner = winner
+        self.confidence = confidence
+        self.intent = intent
+        self.model = model
+        self.node = node
+        self.proposals = tuple(proposals)
+
+    @classmethod
+    def from_turn(
+        cls,
+        turn_id: Optional[str],
+        user_message: str,
+        assistant_output: str,
+        dominant_emotion: Optional[str],
+        intensity: float,
+        final_proposal: Optional[Dict[str, Any]],
+        ranked: Optional[List[Dict[str, Any]]],
+        routing: Optional[Dict[str, Any]],
+    ) -> "TurnRecord":
+        """Build a record from the pipeline's full-size turn objects."""
+        final_proposal = final_proposal or {}
+        routing = routing or {}
+
+        candidates = (routing.get("model_selection") or {}).get("candidates") or []
+        node = (routing.get("node_selection") or {}).get("selected_node") or {}
+
+        return cls(
+            turn_id=turn_id or uuid4().hex,
+            user=user_message,
+            assistant=assistant_output,
+            emotion=dominant_emotion,
+            intensity=intensity,
+            winner=final_proposal.get("actor"),
+            confidence=final_proposal.get("confidence"),
+            intent=routing.get("intent"),
+            model=candidates[0].get("model") if candidates else None,
+            node=node.get("name"),
+            proposals=tuple(
+                (p.get("actor", "unknown"), p.get("confidence")) for p in (ranked or [])
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {k: getattr(self, k) for k in self.__slots__}
+        data["proposals"] = [list(p) for p in self.proposals]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TurnRecord":
+        data = dict(data)
+        data["proposals"] = tuple(tuple(p) for p in data.get("proposals") or ())
+        return cls(**data)
+
+    def __repr__(self) -> str:
+        return (
+            f"TurnRecord(seq={self.seq}, turn_id={self.turn_id!r}, "
+            f"winner={self.winner!r})"
+        )
+
+
+# ---------------------------------------------------------
+# Store
+# ---------------------------------------------------------
+class TurnStore:
+    """Ring buffer of recent turns + append-only spill log with an offset index."""
+
+    def __init__(
+        self,
+        conversation_id: str,
+        capacity: int = TURN_CAPACITY,
+        directory: str = TURN_DIR,
+    ):
+        self.conversation_id = conversation_id
+        self.capacity = max(1, capacity)
+        self.path = _spill_path(directory, conversation_id)
+
+        self._recent: Deque[TurnRecord] = deque()
+        self._offsets = array("q")          # seq -> byte offset, for spilled turns
+        self._seq_by_id: Dict[str, int] = {}
+        self._next_seq = 0
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # Writes
+    # -----------------------------------------------------
+    def append(self, record: TurnRecord) -> TurnRecord:
+        with self._lock:
+            record.seq = self._next_seq
+            self._next_seq += 1
+            self._seq_by_id[record.turn_id] = record.seq
+            self._recent.append(record)
+            if len(self._recent) > self.capacity:
+                self._spill(self._recent.popleft())
+        return record
+
+    def _spill(self, record: TurnRecord) -> None:
+        """Append one record to the log. Caller holds the lock."""
+        line = (json.dumps(record.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+        except OSError as e:
+            # Losing an old turn is preferable to failing the current one
+            log_error(
+                f"[TURNS] Failed to spill turn {record.turn_id}: {e}", phase="turns"
+            )
+            offset = -1
+        # Spilled turns are contiguous from seq 0, so seq == position
+        self._offsets.append(offset)
+        log_debug("[TURNS] Spilled turn %d to %s", record.seq, self.path, phase="turns")
+
+    def clear(self) -> None:
+        """Forget all turns (the spill log is kept on disk)."""
+        with self._lock:
+            self._recent.clear()
+            self._offsets = array("q")
+            self._seq_by_id.clear()
+            self._next_seq = 0
+            if os.path.exists(self.path):
+                os.replace(self.path, f"{self.path}.{int(time.time())}")
+
+    # -----------------------------------------------------
+    # Snapshot (core.snapshot)
+    # -----------------------------------------------------
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Everything needed to rebuild the store elsewhere except the spill
+        log itself, which stays on disk (point CONTINUUM_TURN_DIR at shared
+        storage to move conversations between workers).
+        """
+        with self._lock:
+            ids = [""] * self._next_seq
+            for turn_id, seq in self._seq_by_id.items():
+                ids[seq] = turn_id
+            return {
+                "conversation_id": self.conversation_id,
+                "ids": ids,
+                "offsets": self._offsets.tolist(),
+                "recent": [
+                    [getattr(r, k) for k in TurnRecord.__slots__] for r in self._recent
+                ],
+            }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conversation_id = state["conversation_id"]
+            self.path = _spill_path(os.path.dirname(self.path), self.conversation_id)
+            self._offsets = array("q", state["offsets"])
+            self._recent = deque(
+                TurnRecord.from_dict(dict(zip(TurnRecord.__slots__, values)))
+                for values in state["recent"]
+            )
+            ids = state["ids"]
+            self._seq_by_id = {turn_id: seq for seq, turn_id in enumerate(ids)}
+            self._next_seq = len(ids)
+
+    # -----------------------------------------------------
+    # Reads
+    # -----------------------------------------------------
+    def __len__(self) -> int:
+        return self._next_seq
+
+    @property
+    def spilled(self) -> int:
+        return len(self._offsets)
+
+    def _read_spilled(self, seq: int) -> Optional[TurnRecord]:
+        offset = self._offsets[seq]
+        if offset < 0:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return TurnRecord.from_dict(json.loads(f.readline()))
+        except (OSError, ValueError) as e:
+            log_error(f"[TURNS] Failed to read spilled turn {seq}: {e}", phase="turns")
+            return None
+
+    def get_seq(self, seq: int) -> Optional[TurnRecord]:
+        with self._lock:
+            if seq < 0 or seq >= self._next_seq:
+                return None
+            if seq >= len(self._offsets):
+                return self._recent[seq - len(self._offsets)]
+            return self._read_spilled(seq)
+
+    def get(self, turn_id: str) -> Optional[TurnRecord]:
+        seq = self._seq_by_id.get(turn_id)
+        return None if seq is None else self.get_seq(seq)
+
+    def recent(self, n: int = 10) -> List[TurnRecord]:
+        """Up to n newest in-memory turns, oldest first."""
+        with self._lock:
+            return list(self._recent)[-n:] if n > 0 else []
+
+    def page(
+        self, page: int = 0, page_size: int = 10, newest_first: bool = True
+    ) -> List[TurnRecord]:
+        """
+        One page of turns. Pages within the in-memory window cost nothing;
+        pages reaching into spilled turns read only those lines.
+        """
+        total = len(self)
+        if newest_first:
+            hi = total - page * page_size
+            seqs = range(hi - 1, max(0, hi - page_size) - 1, -1)
+        else:
+            lo = page * page_size
+            seqs = range(lo, min(total, lo + page_size))
+        records = (self.get_seq(s) for s in seqs)
+        return [r for r in records if r is not None]
+
+    def page_count(self, page_size: int = 10) -> int:
+        return (len(self) + page_size - 1) // page_size
+
+    def __iter__(self) -> Iterator[TurnRecord]:
+        """All turns, oldest first (reads the spill log sequentially)."""
+        for seq in range(len(self)):
+            record = self.get_seq(seq)
+            if record is not None:
+                yield record
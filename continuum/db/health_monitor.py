@@ -1,14 +1,21 @@
 # continuum/db/health_monitor.py
 
+import os
 import threading
 import time
 import requests
 from datetime import datetime
 from sqlalchemy.orm import Session
 
+from continuum.core.logger import log_error
 from continuum.db.models.nodes import Node, NodeStatus
 from continuum.db.models.node_health import NodeHealth, HealthStatus
 from continuum.db.registry import ModelRegistry
+from continuum.monitoring.latency_histogram import latency_recorder
+from continuum.monitoring.metrics import NODE_PING_LATENCY, NODE_UP
+
+# Seconds between health sweeps; 0 disables the monitor (see ResourceHub)
+HEALTH_INTERVAL = float(os.getenv("CONTINUUM_HEALTH_INTERVAL", 5))
 
 
 class HealthMonitor(threading.Thread):
@@ -19,6 +26,7 @@ class HealthMonitor(threading.Thread):
     - node.last_seen
     - node_health history
     - registry state
+    - model_latency_histograms (flushes the in-process latency recorder)
     """
 
     def __init__(
@@ -94,6 +102,10 @@ class HealthMonitor(threading.Thread):
             status = NodeStatus.online
             health_status = HealthStatus.online
 
+        NODE_UP.labels(node=node.name).set(0 if latency == -1 else 1)
+        if latency != -1:
+            NODE_PING_LATENCY.labels(node=node.name).set(latency / 1000.0)
+
         # Update node record
         node.status = status
         node.last_seen = datetime.utcnow()
@@ -113,13 +125,23 @@ class HealthMonitor(threading.Thread):
     # ---------------------------------------------------------
     def run(self):
         while self.running:
-            # Refresh registry in case nodes/models changed
-            self.registry.refresh()
-
-            for node in self.registry.nodes:
-                if not node.enabled:
-                    continue
-                self.check_node(node)
+            try:
+                # Refresh registry in case nodes/models changed
+                self.registry.refresh()
+
+                for node in self.registry.nodes:
+                    if not node.enabled:
+                        continue
+                    self.check_node(node)
+            except Exception as e:
+                self.db.rollback()
+                log_error("[HEALTH] Health sweep failed: %s", e, phase="db")
+
+            # Persist per-node latency histograms off the request path
+            try:
+                latency_recorder.flush(self.db)
+            except Exception as e:
+                log_error("[HEALTH] Latency histogram flush failed: %s", e, phase="db")
 
             time.sleep(self.interval)
 
@@ -0,0 +1,315 @@
+# continuum/db/health_retention.py
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from continuum.core.logger import log_debug, log_error
+from continuum.db.models.nodes import Node
+from continuum.db.models.node_health import NodeHealth
+from continuum.db.models.node_health_rollups import NodeHealthRollup, RollupResolution
+
+
+# Seconds between retention cycles; 0 disables the job (see ResourceHub)
+RETENTION_INTERVAL = float(os.getenv("CONTINUUM_HEALTH_RETENTION_INTERVAL", 300))
+
+_STEP = {
+    RollupResolution.minute: timedelta(minutes=1),
+    RollupResolution.hour: timedelta(hours=1),
+}
+
+
+def _floor(ts: datetime, resolution: RollupResolution) -> datetime:
+    ts = ts.replace(second=0, microsecond=0)
+    if resolution == RollupResolution.hour:
+        ts = ts.replace(minute=0)
+    return ts
+
+
+class _Bucket:
+    """Running aggregate for a single rollup bucket."""
+
+    __slots__ = (
+        "samples", "online", "degraded", "offline",
+        "latency_samples", "latency_sum", "latency_min", "latency_max",
+    )
+
+    def __init__(self):
+        self.samples = 0
+        self.online = 0
+        self.degraded = 0
+        self.offline = 0
+        self.latency_samples = 0
+        self.latency_sum = 0.0
+        self.latency_min = None
+        self.latency_max = None
+
+    def add_latency(self, count, total, lo, hi):
+        if not count:
+            return
+        self.latency_samples += count
+        self.latency_sum += total
+        self.latency_min = lo if self.latency_min is None else min(self.latency_min, lo)
+        self.latency_max = hi if self.latency_max is None else max(self.latency_max, hi)
+
+    def to_row(self, node_id, resolution, bucket_start) -> NodeHealthRollup:
+        return NodeHealthRollup(
+            node_id=node_id,
+            resolution=resolution,
+            bucket_start=bucket_start,
+            sample_count=self.samples,
+            online_count=self.online,
+            degraded_count=self.degraded,
+            offline_count=self.offline,
+            latency_samples=self.latency_samples,
+            latency_avg_ms=(
+                self.latency_sum / self.latency_samples
+                if self.latency_samples
+                else None
+            ),
+            latency_min_ms=self.latency_min,
+            latency_max_ms=self.latency_max,
+        )
+
+
+class HealthRetentionJob(threading.Thread):
+    """
+    Background thread that keeps node_health bounded.
+
+    Each cycle:
+    - rolls completed minutes of raw node_health rows into minute rollups
+    - rolls completed hours of minute rollups into hour rollups
+    - prunes raw rows older than raw_retention (once rolled up)
+    - prunes minute rollups older than minute_retention (once rolled up)
+
+    Hour rollups are kept indefinitely. Deletes run in small batches so
+    the job never holds long locks against the HealthMonitor's inserts.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        interval_seconds: int = 300,
+        raw_retention: timedelta = timedelta(hours=24),
+        minute_retention: timedelta = timedelta(days=30),
+        batch_size: int = 5000,
+    ):
+        super().__init__(daemon=True)
+        self.db = db_session
+        self.interval = interval_seconds
+        self.raw_retention = raw_retention
+        self.minute_retention = minute_retention
+        self.batch_size = batch_size
+        self.running = True
+
+    # ---------------------------------------------------------
+    # WATERMARKS
+    # ---------------------------------------------------------
+    def _next_bucket(
+        self, node_id: int, resolution: RollupResolution
+    ) -> Optional[datetime]:
+        """First bucket that has not been rolled up yet for this node."""
+        last = (
+            self.db.query(func.max(NodeHealthRollup.bucket_start))
+            .filter(NodeHealthRollup.node_id == node_id)
+            .filter(NodeHealthRollup.resolution == resolution)
+            .scalar()
+        )
+        if last is not None:
+            return last + _STEP[resolution]
+
+        if resolution == RollupResolution.minute:
+            first = (
+                self.db.query(func.min(NodeHealth.timestamp))
+                .filter(NodeHealth.node_id == node_id)
+                .scalar()
+            )
+        else:
+            first = (
+                self.db.query(func.min(NodeHealthRollup.bucket_start))
+                .filter(NodeHealthRollup.node_id == node_id)
+                .filter(NodeHealthRollup.resolution == RollupResolution.minute)
+                .scalar()
+            )
+        return _floor(first, resolution) if first is not None else None
+
+    # ---------------------------------------------------------
+    # ROLLUPS
+    # ---------------------------------------------------------
+    def _rollup_minutes(self, node_id: int, now: datetime) -> int:
+        start = self._next_bucket(node_id, RollupResolution.minute)
+        end = _floor(now, RollupResolution.minute)
+        if start is None or start >= end:
+            return 0
+
+        rows = (
+            self.db.query(
+                NodeHealth.timestamp, NodeHealth.status, NodeHealth.latency_ms
+            )
+            .filter(NodeHealth.node_id == node_id)
+            .filter(NodeHealth.timestamp >= start)
+            .filter(NodeHealth.timestamp < end)
+            .yield_per(self.batch_size)
+        )
+
+        buckets: Dict[datetime, _Bucket] = {}
+        for ts, status, latency in rows:
+            key = _floor(ts, RollupResolution.minute)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+
+            bucket.samples += 1
+            status = getattr(status, "value", status)
+            if status == "online":
+                bucket.online += 1
+            elif status == "degraded":
+                bucket.degraded += 1
+            else:
+                bucket.offline += 1
+
+            if latency is not None:
+                bucket.add_latency(1, latency, latency, latency)
+
+        return self._write(node_id, RollupResolution.minute, buckets)
+
+    def _rollup_hours(self, node_id: int, now: datetime) -> int:
+        start = self._next_bucket(node_id, RollupResolution.hour)
+        end = _floor(now, RollupResolution.hour)
+        if start is None or start >= end:
+            return 0
+
+        minutes = (
+            self.db.query(NodeHealthRollup)
+            .filter(NodeHealthRollup.node_id == node_id)
+            .filter(NodeHealthRollup.resolution == RollupResolution.minute)
+            .filter(NodeHealthRollup.bucket_start >= start)
+            .filter(NodeHealthRollup.bucket_start < end)
+            .yield_per(self.batch_size)
+        )
+
+        buckets: Dict[datetime, _Bucket] = {}
+        for m in minutes:
+            key = _floor(m.bucket_start, RollupResolution.hour)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+
+            bucket.samples += m.sample_count
+            bucket.online += m.online_count
+            bucket.degraded += m.degraded_count
+            bucket.offline += m.offline_count
+            if m.latency_samples:
+                bucket.add_latency(
+                    m.latency_samples,
+                    m.latency_avg_ms * m.latency_samples,
+                    m.latency_min_ms,
+                    m.latency_max_ms,
+                )
+
+        return self._write(node_id, RollupResolution.hour, buckets)
+
+    def _write(self, node_id, resolution, buckets: Dict[datetime, _Bucket]) -> int:
+        if not buckets:
+            return 0
+        self.db.add_all(
+            bucket.to_row(node_id, resolution, start)
+            for start, bucket in sorted(buckets.items())
+        )
+        self.db.commit()
+        return len(buckets)
+
+    # ---------------------------------------------------------
+    # PRUNING (batched)
+    # ---------------------------------------------------------
+    def _delete_in_batches(self, model, id_query) -> int:
+        deleted = 0
+        while True:
+            ids = [row[0] for row in id_query.limit(self.batch_size).all()]
+            if not ids:
+                return deleted
+            self.db.query(model).filter(model.id.in_(ids)).delete(
+                synchronize_session=False
+            )
+            self.db.commit()
+            deleted += len(ids)
+
+    def _prune_raw(self, node_id: int, now: datetime) -> int:
+        # Never prune past the minute watermark: those rows are not rolled up yet
+        watermark = self._next_bucket(node_id, RollupResolution.minute)
+        if watermark is None:
+            return 0
+        cutoff = min(now - self.raw_retention, watermark)
+
+        return self._delete_in_batches(
+            NodeHealth,
+            self.db.query(NodeHealth.id)
+            .filter(NodeHealth.node_id == node_id)
+            .filter(NodeHealth.timestamp < cutoff),
+        )
+
+    def _prune_minutes(self, node_id: int, now: datetime) -> int:
+        watermark = self._next_bucket(node_id, RollupResolution.hour)
+        if watermark is None:
+            return 0
+        cutoff = min(now - self.minute_retention, watermark)
+
+        return self._delete_in_batches(
+            NodeHealthRollup,
+            self.db.query(NodeHealthRollup.id)
+            .filter(NodeHealthRollup.node_id == node_id)
+            .filter(NodeHealthRollup.resolution == RollupResolution.minute)
+            .filter(NodeHealthRollup.bucket_start < cutoff),
+        )
+
+    # ---------------------------------------------------------
+    # ONE CYCLE
+    # ---------------------------------------------------------
+    def run_once(
+        self,
+        now: Optional[datetime] = None,
+        node_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[str, int]:
+        now = now or datetime.utcnow()
+        if node_ids is None:
+            node_ids = [row[0] for row in self.db.query(Node.id).all()]
+
+        stats = {
+            "minute_rollups": 0,
+            "hour_rollups": 0,
+            "raw_pruned": 0,
+            "minute_pruned": 0,
+        }
+
+        for node_id in node_ids:
+            stats["minute_rollups"] += self._rollup_minutes(node_id, now)
+            stats["hour_rollups"] += self._rollup_hours(node_id, now)
+            stats["raw_pruned"] += self._prune_raw(node_id, now)
+            stats["minute_pruned"] += self._prune_minutes(node_id, now)
+
+        log_debug(f"[RETENTION] node_health cycle complete: {stats}", phase="db")
+        return stats
+
+    # ---------------------------------------------------------
+    # MAIN LOOP
+    # ---------------------------------------------------------
+    def run(self):
+        while self.running:
+            try:
+                self.run_once()
+            except Exception as e:
+                self.db.rollback()
+                log_error(f"[RETENTION] node_health cycle failed: {e}", phase="db")
+
+            time.sleep(self.interval)
+
+    # ---------------------------------------------------------
+    # STOP JOB
+    # ---------------------------------------------------------
+    def stop(self):
+        self.running = False
@@ -0,0 +1,73 @@
+# continuum/db/migrations.py
+
+"""
+Idempotent schema migrations for the Continuum database.
+
+Each migration checks the live schema before changing it, so
+apply_migrations() is safe to run at every startup.
+"""
+
+from typing import Callable, List, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from continuum.core.logger import log_info
+from continuum.db.models.model_latency_histograms import ModelLatencyHistogram
+from continuum.db.models.node_health import NodeHealth
+from continuum.db.models.node_health_rollups import NodeHealthRollup
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def _create_table(engine: Engine, table) -> bool:
+    if inspect(engine).has_table(table.name):
+        return False
+    table.create(bind=engine)
+    return True
+
+
+def _ensure_index(engine: Engine, table, index_name: str) -> bool:
+    existing = {ix["name"] for ix in inspect(engine).get_indexes(table.name)}
+    if index_name in existing:
+        return False
+
+    index = next(ix for ix in table.indexes if ix.name == index_name)
+    index.create(bind=engine)
+    return True
+
+
+# ---------------------------------------------------------
+# Migrations (in order)
+# ---------------------------------------------------------
+def _0001_model_latency_histograms(engine: Engine) -> bool:
+    return _create_table(engine, ModelLatencyHistogram.__table__)
+
+
+def _0002_node_health_node_ts_index(engine: Engine) -> bool:
+    return _ensure_index(engine, NodeHealth.__table__, "ix_node_health_node_ts")
+
+
+def _0003_node_health_rollups(engine: Engine) -> bool:
+    return _create_table(engine, NodeHealthRollup.__table__)
+
+
+MIGRATIONS: List[Tuple[str, Callable[[Engine], bool]]] = [
+    ("0001_model_latency_histograms", _0001_model_latency_histograms),
+    ("0002_node_health_node_ts_index", _0002_node_health_node_ts_index),
+    ("0003_node_health_rollups", _0003_node_health_rollups),
+]
+
+
+def apply_migrations(engine: Engine) -> List[str]:
+    """
+    Apply all pending migrations. Returns the names of those that
+    actually changed the schema.
+    """
+    applied = []
+    for name, migrate in MIGRATIONS:
+        if migrate(engine):
+            applied.append(name)
+            log_info(f"[MIGRATIONS] Applied {name}", phase="db")
+    return applied
@@ -0,0 +1,73 @@
+# continuum/db/models/model_latency_histograms.py
+
+from sqlalchemy import (
+    Column, Integer, String, Float, TIMESTAMP, Enum, ForeignKey, LargeBinary,
+    Index, UniqueConstraint,
+)
+from datetime import datetime
+from continuum.db.models.base import Base
+from continuum.monitoring.latency_histogram import LatencyHistogram
+import enum
+
+
+class LatencyMetric(enum.Enum):
+    ttft_ms = "ttft_ms"
+    total_ms = "total_ms"
+    tokens_per_sec = "tokens_per_sec"
+
+
+class ModelLatencyHistogram(Base):
+    """
+    One compact histogram per (model, node, metric, hourly window).
+    Buckets are stored as sparse uint32 [bucket, count] pairs.
+    """
+
+    __tablename__ = "model_latency_histograms"
+    __table_args__ = (
+        UniqueConstraint(
+            "model_name",
+            "node_id",
+            "metric",
+            "window_start",
+            name="uq_latency_hist_window",
+        ),
+        Index(
+            "ix_latency_hist_lookup", "model_name", "node_id", "metric", "window_start"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    model_name = Column(String(255), nullable=False)
+    node_id = Column(Integer, ForeignKey("nodes.id"), nullable=True)
+    metric = Column(Enum(LatencyMetric), nullable=False)
+    window_start = Column(TIMESTAMP, nullable=False)
+
+    sample_count = Column(Integer, default=0, nullable=False)
+    value_sum = Column(Float, default=0.0, nullable=False)
+    value_min = Column(Float)
+    value_max = Column(Float)
+    buckets = Column(LargeBinary)
+
+    last_updated = Column(
+        TIMESTAMP,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    def to_histogram(self) -> LatencyHistogram:
+        return LatencyHistogram.from_parts(
+            self.buckets,
+            self.sample_count,
+            self.value_sum,
+            self.value_min,
+            self.value_max,
+        )
+
+    def update_from_histogram(self, hist: LatencyHistogram) -> None:
+        self.sample_count = hist.count
+        self.value_sum = hist.total
+        self.value_min = hist.min
+        self.value_max = hist.max
+        self.buckets = hist.to_bytes()
+        self.last_updated = datetime.utcnow()
@@ -1,7 +1,7 @@
 # continuum/db/models/node_health.py
 
 from sqlalchemy import (
-    Column, Integer, TIMESTAMP, Enum, ForeignKey
+    Column, Integer, TIMESTAMP, Enum, ForeignKey, Index
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -17,6 +17,10 @@ class HealthStatus(enum.Enum):
 
 class NodeHealth(Base):
     __tablename__ = "node_health"
+    __table_args__ = (
+        # "latest N rows for a node" and retention pruning both walk this index
+        Index("ix_node_health_node_ts", "node_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     node_id = Column(Integer, ForeignKey("nodes.id"), nullable=False)
@@ -0,0 +1,44 @@
+# continuum/db/models/node_health_rollups.py
+
+from sqlalchemy import (
+    Column, Integer, Float, TIMESTAMP, Enum, ForeignKey, Index, UniqueConstraint
+)
+from continuum.db.models.base import Base
+import enum
+
+
+class RollupResolution(enum.Enum):
+    minute = "minute"
+    hour = "hour"
+
+
+class NodeHealthRollup(Base):
+    """
+    Aggregated node_health samples for one node over one minute or hour.
+    Written by HealthRetentionJob; raw rows are pruned once rolled up.
+    """
+
+    __tablename__ = "node_health_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "node_id", "resolution", "bucket_start",
+            name="uq_node_health_rollup_bucket",
+        ),
+        Index("ix_node_health_rollup_lookup", "node_id", "resolution", "bucket_start"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    node_id = Column(Integer, ForeignKey("nodes.id"), nullable=False)
+    resolution = Column(Enum(RollupResolution), nullable=False)
+    bucket_start = Column(TIMESTAMP, nullable=False)
+
+    sample_count = Column(Integer, nullable=False, default=0)
+    online_count = Column(Integer, nullable=False, default=0)
+    degraded_count = Column(Integer, nullable=False, default=0)
+    offline_count = Column(Integer, nullable=False, default=0)
+
+    # Latency over samples that had one (offline samples have NULL latency)
+    latency_samples = Column(Integer, nullable=False, default=0)
+    latency_avg_ms = Column(Float)
+    latency_min_ms = Column(Integer)
+    latency_max_ms = Column(Integer)
@@ -1,69 +1,43 @@
-
 # continuum/db/mysql_connection.py
-import mysql.connector
-from mysql.connector import pooling
 import json
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+
+from continuum.db.sqlalchemy_connection import get_engine
 
 
 class MySQLConfigDB:
     """
     Connection layer for Aira's configuration database.
-    Uses a connection pool for efficiency and thread safety.
+    Runs raw SQL on the process-wide pooled engine, so it shares
+    connections (and pool limits) with the ORM sessions.
     """
 
-    def __init__(self,
-                 host: str,
-                 port: int,
-                 user: str,
-                 password: str,
-                 database: str,
-                 pool_name: str = "aira_pool",
-                 pool_size: int = 5):
-
-        self.pool = pooling.MySQLConnectionPool(
-            pool_name=pool_name,
-            pool_size=pool_size,
-            pool_reset_session=True,
-            host=host,
-            port=port,
-            user=user,
-            password=password,
-            database=database
-        )
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine or get_engine()
 
     def get_conn(self):
-        """Get a pooled connection."""
-        return self.pool.get_connection()
+        """Get a pooled connection (use as a context manager)."""
+        return self.engine.connect()
 
     # -----------------------------
     # Generic helpers
     # -----------------------------
 
     def fetch_all(self, query, params=None):
-        conn = self.get_conn()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, params or ())
-        rows = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return rows
+        with self.get_conn() as conn:
+            result = conn.exec_driver_sql(query, params or ())
+            return [dict(r) for r in result.mappings()]
 
     def fetch_one(self, query, params=None):
-        conn = self.get_conn()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, params or ())
-        row = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return row
+        with self.get_conn() as conn:
+            row = conn.exec_driver_sql(query, params or ()).mappings().first()
+            return dict(row) if row else None
 
     def execute(self, query, params=None):
-        conn = self.get_conn()
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(query, params or ())
 
     def get_nodes(self):
         """
@@ -76,26 +50,23 @@ class MySQLConfigDB:
             status
             last_heartbeat
         """
-        query = """
+        rows = self.fetch_all("""
             SELECT id, hostname, endpoint, models_json, status, last_heartbeat
             FROM nodes
-        """
-
-        conn = self.get_conn()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        """)
 
         # Normalize into Python dicts
         result = []
         for row in rows:
+            models = row["models_json"]
+            if isinstance(models, (str, bytes)):
+                models = json.loads(models)
+
             result.append({
                 "id": row["id"],
                 "name": row["hostname"],
                 "base_url": row["endpoint"],
-                "models": row["models_json"],   # JSON array already parsed by MySQL driver
+                "models": models,
                 "status": row["status"],
                 "last_heartbeat": row["last_heartbeat"],
             })
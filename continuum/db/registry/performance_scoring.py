@@ -1,14 +1,88 @@
 #  continuum/db/registry/performance_scoring.py
 
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from continuum.core.logger import log_debug
 from continuum.db.models.model_stats import ModelStats
+from continuum.db.models.model_latency_histograms import (
+    LatencyMetric,
+    ModelLatencyHistogram,
+)
+from continuum.monitoring.latency_histogram import LatencyHistogram
 
 
 class PerformanceScoringMixin:
     """
     Computes performance score based on model_stats.
-    NOTE: current schema has no node_id, so stats are global per model.
+    NOTE: model_stats has no node_id, so success rate is global per model.
+    Latency prefers the per-node p95 from model_latency_histograms and
+    falls back to the global avg_latency_ms EMA when no histogram exists.
+    Percentiles are cached for latency_cache_seconds so node selection
+    does not hit the histogram table for every candidate node.
     """
 
+    latency_window_hours = 24
+    latency_cache_seconds = 60.0
+
+    def get_latency_percentiles(
+        self,
+        node,
+        model_name,
+        metric: str = "total_ms",
+        window_hours: int = None,
+        percentiles=(50, 95, 99),
+    ):
+        """
+        Merge the hourly histogram rows for (model, node, metric) and return
+        {"p50": ..., "p95": ..., "p99": ..., "count": n, "mean": m},
+        or None when no samples exist in the window (or the table is
+        missing, e.g. before migrations have run).
+        """
+        window_hours = window_hours or self.latency_window_hours
+        node_id = node.id if node is not None else None
+        key = (model_name, node_id, metric, window_hours, tuple(percentiles))
+
+        cache = self.__dict__.setdefault("_latency_cache", {})
+        cached = cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        since = datetime.utcnow() - timedelta(hours=window_hours)
+        try:
+            rows = (
+                self.db.query(ModelLatencyHistogram)
+                .filter(ModelLatencyHistogram.model_name == model_name)
+                .filter(ModelLatencyHistogram.node_id == node_id)
+                .filter(ModelLatencyHistogram.metric == LatencyMetric(metric))
+                .filter(ModelLatencyHistogram.window_start >= since)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            log_debug("[REGISTRY] Latency histograms unavailable: %s", e, phase="db")
+            rows = []
+
+        result = self._merge_percentiles(rows, percentiles)
+        cache[key] = (now + self.latency_cache_seconds, result)
+        return result
+
+    @staticmethod
+    def _merge_percentiles(rows, percentiles):
+        merged = LatencyHistogram()
+        for row in rows:
+            merged.merge(row.to_histogram())
+
+        if not merged.count:
+            return None
+
+        result = merged.percentiles(percentiles)
+        result["count"] = merged.count
+        result["mean"] = merged.mean
+        return result
+
     def evaluate_node_performance(self, node, model_name):
         stats = (
             self.db.query(ModelStats)
@@ -16,22 +90,25 @@ class PerformanceScoringMixin:
             .first()
         )
 
-        if not stats:
+        tail = self.get_latency_percentiles(node, model_name)
+
+        if not stats and not tail:
             return 0.5
 
         score = 1.0
 
         # Success rate
-        if stats.success_rate is not None:
+        if stats and stats.success_rate is not None:
             score *= stats.success_rate
 
-        # Latency
-        if stats.avg_latency_ms:
-            if stats.avg_latency_ms < 500:
+        # Latency (tail latency when available, otherwise the global mean)
+        latency_ms = tail["p95"] if tail else stats.avg_latency_ms
+        if latency_ms:
+            if latency_ms < 500:
                 score *= 1.0
-            elif stats.avg_latency_ms < 1500:
+            elif latency_ms < 1500:
                 score *= 0.7
             else:
                 score *= 0.4
 
-        return max(0.0, min(1.0, score))
\ No newline at end of file
+        return max(0.0, min(1.0, score))
@@ -0,0 +1,265 @@
+# continuum/db/sqlalchemy_connection.py
+
+"""
+Process-wide SQLAlchemy engine, connection pool and session lifecycle.
+
+- One pooled engine per process (get_engine); every DB user shares it,
+  including the raw-SQL helpers (MySQLConfigDB, MySQLMemoryBackend).
+- SessionLocal is a thread-scoped session registry: each thread
+  (controller, Senate executor workers, background jobs) transparently
+  gets its own Session. Call SessionLocal.remove() at the end of each
+  unit of work so the connection goes back to the pool.
+- session_scope() is the preferred way to do short, self-contained work.
+- Pool checkout waits are timed (pool_stats) so pool starvation is visible.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import create_engine, exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from continuum.core.logger import log_debug, log_error
+from continuum.monitoring.latency_histogram import LatencyHistogram
+
+
+# ---------------------------------------------------------
+# Settings
+# ---------------------------------------------------------
+@dataclass
+class DatabaseSettings:
+    """
+    Connection + pool settings. from_env() reads CONTINUUM_DB_* variables.
+    url_override (CONTINUUM_DB_URL) replaces the host/user/... fields,
+    e.g. "sqlite:///bench.db" for offline runs.
+    """
+
+    host: str = "localhost"
+    port: int = 3306
+    user: str = "continuum"
+    password: str = ""
+    name: str = "continuum"
+    driver: str = "mysql+pymysql"
+    url_override: Optional[str] = None
+
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 3600
+    slow_checkout_ms: float = 100.0
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        env = os.getenv
+        return cls(
+            host=env("CONTINUUM_DB_HOST", cls.host),
+            port=int(env("CONTINUUM_DB_PORT", cls.port)),
+            user=env("CONTINUUM_DB_USER", cls.user),
+            password=env("CONTINUUM_DB_PASSWORD", cls.password),
+            name=env("CONTINUUM_DB_NAME", cls.name),
+            driver=env("CONTINUUM_DB_DRIVER", cls.driver),
+            url_override=env("CONTINUUM_DB_URL"),
+            pool_size=int(env("CONTINUUM_DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(env("CONTINUUM_DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_timeout=float(env("CONTINUUM_DB_POOL_TIMEOUT", cls.pool_timeout)),
+            pool_recycle=int(env("CONTINUUM_DB_POOL_RECYCLE", cls.pool_recycle)),
+            slow_checkout_ms=float(
+                env("CONTINUUM_DB_SLOW_CHECKOUT_MS", cls.slow_checkout_ms)
+            ),
+        )
+
+    @property
+    def url(self) -> str:
+        if self.url_override:
+            return self.url_override
+        return f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
+
+# ---------------------------------------------------------
+# Pool instrumentation
+# ---------------------------------------------------------
+class PoolStats:
+    """Thread-safe record of pool checkout waits (ms) and timeouts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waits = LatencyHistogram()
+        self.timeouts = 0
+        self.slow_checkout_ms = DatabaseSettings.slow_checkout_ms
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.waits.record(wait_ms)
+        if wait_ms >= self.slow_checkout_ms:
+            log_debug(f"[DB POOL] Slow checkout: waited {wait_ms:.1f} ms", phase="db")
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+        log_error("[DB POOL] Checkout timed out (pool exhausted)", phase="db")
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            return {
+                "checkouts": self.waits.count,
+                "timeouts": self.timeouts,
+                "wait_mean_ms": self.waits.mean,
+                "wait_max_ms": self.waits.max,
+                **{f"wait_{k}_ms": v for k, v in self.waits.percentiles().items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.waits = LatencyHistogram()
+            self.timeouts = 0
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except sa_exc.TimeoutError:
+            pool_stats.record_timeout()
+            raise
+        pool_stats.record_wait((time.perf_counter() - start) * 1000.0)
+        return conn
+
+
+# ---------------------------------------------------------
+# Engine + session registry
+# ---------------------------------------------------------
+SessionLocal = scoped_session(
+    sessionmaker(autoflush=False, expire_on_commit=False)
+)
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def create_pooled_engine(settings: DatabaseSettings) -> Engine:
+    connect_args = {}
+    if settings.url.startswith("sqlite"):
+        # Pooled SQLite connections are handed between threads
+        connect_args["check_same_thread"] = False
+
+    return create_engine(
+        settings.url,
+        connect_args=connect_args,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
+def init_engine(settings: Optional[DatabaseSettings] = None) -> Engine:
+    """
+    Create (or replace) the process-wide engine and bind SessionLocal to it.
+    Called implicitly by get_engine() with settings from the environment.
+    """
+    global _engine
+    settings = settings or DatabaseSettings.from_env()
+
+    with _engine_lock:
+        if _engine is not None:
+            SessionLocal.remove()
+            _engine.dispose()
+
+        _engine = create_pooled_engine(settings)
+        SessionLocal.configure(bind=_engine)
+        pool_stats.slow_checkout_ms = settings.slow_checkout_ms
+
+    target = f"{settings.host}:{settings.port}/{settings.name}"
+    if settings.url_override:
+        target = make_url(settings.url_override).render_as_string(hide_password=True)
+    log_debug(
+        f"[DB] Engine ready ({target}, "
+        f"pool_size={settings.pool_size}, max_overflow={settings.max_overflow})",
+        phase="db",
+    )
+    return _engine
+
+
+def get_engine() -> Engine:
+    if _engine is None:
+        init_engine()
+    return _engine
+
+
+def get_pool_status() -> Dict[str, object]:
+    """Pool occupancy plus checkout wait statistics."""
+    pool = get_engine().pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool_stats.snapshot(),
+    }
+
+
+# ---------------------------------------------------------
+# Public helpers
+# ---------------------------------------------------------
+def get_scoped_session() -> scoped_session:
+    """
+    Return the thread-scoped session proxy. Safe to share across threads:
+    each thread that uses it operates on its own Session.
+    """
+    get_engine()
+    return SessionLocal
+
+
+def get_db_session() -> Session:
+    """Return a new, independent Session. The caller must close it."""
+    get_engine()
+    return SessionLocal.session_factory()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Short-lived session: commits on success, rolls back on error, always closes."""
+    session = get_db_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def end_unit_of_work() -> None:
+    """Release the calling thread's scoped session (and its connection)."""
+    SessionLocal.remove()
+
+
+def releases_session(fn):
+    """
+    Wrap a callable so the thread's scoped session is released when it
+    returns. Use for work submitted to executor threads.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            SessionLocal.remove()
+
+    return wrapper
@@ -0,0 +1,48 @@
+# continuum/debug/context_observers.py
+
+"""
+Opt-in ContinuumContext observers for debugging.
+
+    from continuum.core.context import MESSAGE_ADDED
+    context.subscribe(MESSAGE_ADDED, log_message_origin)
+
+controller_init registers log_message_origin for assistant messages
+when CONTINUUM_DEBUG_MESSAGES=1; otherwise none of this runs.
+"""
+
+import sys
+
+from continuum.core import context as _context_module
+from continuum.core.logger import debug_enabled, log_debug
+
+_STACK_LIMIT = 5
+
+
+def log_message_origin(context, message, roles=("assistant",)) -> None:
+    """Log a preview of the message and the call chain that added it."""
+    if message.role not in roles or not debug_enabled():
+        return
+
+    # Skip this observer and the ContinuumContext frames (_emit, add, ...)
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == _context_module.__file__:
+        frame = frame.f_back
+    caller = frame
+
+    chain = []
+    while frame is not None and len(chain) < _STACK_LIMIT:
+        code = frame.f_code
+        chain.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+
+    log_debug(
+        "[CONTEXT] %s message added (%d chars): %r\n"
+        "  caller module: %s\n"
+        "  call stack:\n    %s",
+        message.role,
+        len(message.content),
+        message.content[:200],
+        caller.f_globals.get("__name__") if caller else None,
+        "\n    ".join(chain),
+        phase="context",
+    )
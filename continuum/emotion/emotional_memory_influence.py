@@ -7,10 +7,10 @@ from typing import Dict, Any, List
 def _extract_recent_events(emotional_memory, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Safely extract the most recent emotional events from EI‑2.0 emotional memory.
-    Assumes emotional_memory exposes a `.events` list or similar iterable.
+    Assumes emotional_memory exposes a `.events` list or RingBuffer.
     """
-    events = getattr(emotional_memory, "events", []) or []
-    return list(events)[-limit:]
+    events = getattr(emotional_memory, "events", None) or []
+    return list(events[-limit:])
 
 
 def _aggregate_emotions(events: List[Any]) -> Dict[str, float]:
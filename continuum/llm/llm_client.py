@@ -1,8 +1,24 @@
 # continuum/llm/llm_client.py
 # Modernized, Router-aware LLM client
 
+import os
 import requests
 import json
+import time
+from requests.adapters import HTTPAdapter
+
+from continuum.core.tracing import current_span, traced
+from continuum.monitoring.latency_histogram import latency_recorder
+from continuum.monitoring.metrics import (
+    LLM_INFLIGHT,
+    LLM_REQUEST_DURATION,
+    LLM_REQUESTS_TOTAL,
+    LLM_TOKENS_TOTAL,
+    LLM_TTFT,
+)
+
+# Keep-alive connections per node host (one client serves every session)
+HTTP_POOL_SIZE = int(os.getenv("CONTINUUM_HTTP_POOL_SIZE", 32))
 
 
 class LLMClient:
@@ -18,16 +34,26 @@ class LLMClient:
       - temperature
       - max_tokens
 
-    This client simply executes the request.
+    This client simply executes the request, over a pooled keep-alive
+    HTTP session, so it is safe to share between threads and sessions.
     """
 
-    def __init__(self, default_endpoint="http://localhost:11434/api/generate"):
+    def __init__(
+        self,
+        default_endpoint="http://localhost:11434/api/generate",
+        pool_size: int = HTTP_POOL_SIZE,
+    ):
         self.default_endpoint = default_endpoint
         self.endpoint = default_endpoint   # ⭐ ADD THIS
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
     # ---------------------------------------------------------
     # Main LLM call
     # ---------------------------------------------------------
+    @traced("llm.generate")
     def generate(
         self,
         prompt: str,
@@ -35,6 +61,7 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 512,
         endpoint: str = None,
+        node_id: int = None,
     ):
         """
         Execute an LLM request.
@@ -45,6 +72,7 @@ class LLMClient:
             temperature: sampling temperature
             max_tokens: max tokens to generate
             endpoint: node endpoint chosen by Router
+            node_id: node id chosen by Router (for per-node latency stats)
 
         Returns:
             full_text: the streamed LLM output
@@ -61,30 +89,95 @@ class LLMClient:
             },
         }
 
+        start = time.perf_counter()
+
+        LLM_INFLIGHT.inc()
         try:
-            response = requests.post(endpoint, json=payload, stream=True)
+            return self._stream(model, node_id, endpoint, payload, start)
+        finally:
+            LLM_INFLIGHT.dec()
+
+    def _stream(self, model, node_id, endpoint, payload, start):
+        first_token_at = None
+        eval_count = None
+        eval_duration_ns = None
+
+        try:
+            response = self.session.post(endpoint, json=payload, stream=True)
         except Exception as e:
+            LLM_REQUESTS_TOTAL.labels(model=model, status="error").inc()
             return f"[ERROR] LLM request failed: {e}"
 
-        if response.status_code != 200:
-            return f"[ERROR] LLM returned {response.status_code}: {response.text}"
+        # Read to the end of the body: the "done" object is not the last thing
+        # on the wire, and a response closed before the final chunk would
+        # drop the connection instead of returning it to the pool.
+        with response:
+            if response.status_code != 200:
+                LLM_REQUESTS_TOTAL.labels(model=model, status="error").inc()
+                return f"[ERROR] LLM returned {response.status_code}: {response.text}"
+
+            full_text = ""
+
+            # Ollama streams NDJSON — one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
 
-        full_text = ""
+                try:
+                    obj = json.loads(line.decode("utf-8"))
+                except Exception:
+                    continue
 
-        # Ollama streams NDJSON — one JSON object per line
-        for line in response.iter_lines():
-            if not line:
-                continue
+                if "response" in obj:
+                    if first_token_at is None and obj["response"]:
+                        first_token_at = time.perf_counter()
+                    full_text += obj["response"]
 
-            try:
-                obj = json.loads(line.decode("utf-8"))
-            except Exception:
-                continue
+                if obj.get("done"):
+                    eval_count = obj.get("eval_count")
+                    eval_duration_ns = obj.get("eval_duration")
 
-            if "response" in obj:
-                full_text += obj["response"]
+        self._record_latency(
+            model, node_id, start, first_token_at, eval_count, eval_duration_ns
+        )
 
-            if obj.get("done"):
-                break
+        return full_text
 
-        return full_text
\ No newline at end of file
+    # ---------------------------------------------------------
+    # Latency histograms (TTFT, total, tokens/sec)
+    # ---------------------------------------------------------
+    def _record_latency(
+        self, model, node_id, start, first_token_at, eval_count, eval_duration_ns
+    ):
+        end = time.perf_counter()
+        total_ms = (end - start) * 1000.0
+        ttft_ms = (first_token_at - start) * 1000.0 if first_token_at else None
+
+        # Prefer Ollama's own decode timing; fall back to wall clock after TTFT
+        tokens_per_sec = None
+        if eval_count and eval_duration_ns:
+            tokens_per_sec = eval_count / (eval_duration_ns / 1e9)
+        elif eval_count and first_token_at and end > first_token_at:
+            tokens_per_sec = eval_count / (end - first_token_at)
+
+        current_span().set(
+            model=model,
+            node_id=node_id,
+            ttft_ms=round(ttft_ms, 1) if ttft_ms is not None else None,
+            tokens=eval_count,
+        )
+
+        LLM_REQUESTS_TOTAL.labels(model=model, status="ok").inc()
+        LLM_REQUEST_DURATION.labels(model=model).observe(total_ms / 1000.0)
+        if ttft_ms is not None:
+            LLM_TTFT.labels(model=model).observe(ttft_ms / 1000.0)
+        if eval_count:
+            LLM_TOKENS_TOTAL.labels(model=model).inc(eval_count)
+
+        latency_recorder.record_generation(
+            model_name=model,
+            node_id=node_id,
+            ttft_ms=ttft_ms,
+            total_ms=total_ms,
+            tokens_per_sec=tokens_per_sec,
+        )
\ No newline at end of file
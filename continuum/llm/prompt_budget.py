@@ -0,0 +1,289 @@
+# continuum/llm/prompt_budget.py
+
+"""
+Token-budget-aware prompt building.
+
+    builder = PromptBuilder()
+    built = builder.build(
+        system_prompt=..., persona_prompt=..., message=...,
+        history=context.messages, memory=memory_text,
+        context_window=context_window_for(controller.registry, model),
+        max_output_tokens=512,
+    )
+    built.text, built.tokens, built.sections
+
+The system prompt, persona prompt and user message are always included.
+Whatever budget is left (context window - output reserve - safety
+margin) goes to memory (up to memory_share of it) and then to as many
+recent history messages as fit, newest first. Section headers and
+separators are counted too (sections["framing"]). The prompt therefore
+never overflows the model's window and never carries history it has no
+room for.
+
+Token counts come from tiktoken when installed (pip install
+continuum[tokens]); otherwise from a regex approximation of BPE
+(word pieces of <= 4 chars + punctuation), which tracks real tokenizers
+to within ~10-15% on English prose. Counts of long-lived strings
+(persona prompts) are cached.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from continuum.core.logger import log_debug, log_error
+
+DEFAULT_CONTEXT_WINDOW = 4096
+SAFETY_MARGIN = 64           # chat template / special tokens the counter can't see
+DEFAULT_MEMORY_SHARE = 0.35  # of the budget left after the fixed sections
+
+_APPROX_TOKEN_RE = re.compile(r"\w{1,4}|[^\w\s]")
+
+# Prompt framing; counted against the budget like any other section
+SECTION_SEPARATOR = "\n\n"
+MEMORY_HEADER = "[Relevant memory]\n"
+HISTORY_HEADER = "[Conversation so far]\n"
+
+
+# ---------------------------------------------------------
+# Token counting
+# ---------------------------------------------------------
+class TokenCounter:
+    """Fast token counts: tiktoken if available, else a regex approximation."""
+
+    _UNLOADED = object()
+
+    def __init__(self, encoding: str = "cl100k_base", cache_size: int = 256):
+        self.encoding_name = encoding
+        # Loaded on first use: get_encoding may download the BPE ranks
+        self._encoding = self._UNLOADED
+
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def _get_encoding(self):
+        if self._encoding is self._UNLOADED:
+            with self._lock:
+                if self._encoding is self._UNLOADED:
+                    try:
+                        import tiktoken
+
+                        self._encoding = tiktoken.get_encoding(self.encoding_name)
+                    except Exception as e:
+                        # Missing package, or encoding files unavailable offline
+                        log_debug(
+                            "[PROMPT] tiktoken unavailable (%s); approximating counts",
+                            e,
+                            phase="prompt",
+                        )
+                        self._encoding = None
+        return self._encoding
+
+    @property
+    def exact(self) -> bool:
+        return self._get_encoding() is not None
+
+    def count(self, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode_ordinary(text))
+        return len(_APPROX_TOKEN_RE.findall(text))
+
+    def count_cached(self, text: Optional[str]) -> int:
+        """count() with an LRU cache; use for strings that recur every turn."""
+        if not text:
+            return 0
+        with self._lock:
+            n = self._cache.get(text)
+            if n is not None:
+                self._cache.move_to_end(text)
+                return n
+        n = self.count(text)
+        with self._lock:
+            self._cache[text] = n
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return n
+
+    def truncate(self, text: str, max_tokens: int, keep: str = "head") -> str:
+        """Clip text to at most max_tokens, keeping its head or its tail."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        encoding = self._get_encoding()
+        if encoding is not None:
+            ids = encoding.encode_ordinary(text)
+            ids = ids[:max_tokens] if keep == "head" else ids[-max_tokens:]
+            return encoding.decode(ids)
+        pieces = list(_APPROX_TOKEN_RE.finditer(text))
+        if keep == "head":
+            return text[: pieces[max_tokens - 1].end()]
+        return text[pieces[-max_tokens].start():]
+
+
+token_counter = TokenCounter()
+
+
+def context_window_for(
+    registry: Any, model_name: Optional[str], default: int = DEFAULT_CONTEXT_WINDOW
+) -> int:
+    """Context window of a model from the models table (via ModelRegistry)."""
+    models = getattr(registry, "models_by_name", None) or {}
+    model = models.get(model_name) if model_name else None
+    window = getattr(model, "context_window", None)
+    return int(window) if window else default
+
+
+# ---------------------------------------------------------
+# Prompt builder
+# ---------------------------------------------------------
+@dataclass
+class BuiltPrompt:
+    text: str
+    tokens: int
+    budget: int
+    sections: Dict[str, int] = field(default_factory=dict)   # section -> tokens
+    history_messages: int = 0
+    truncated: bool = False
+
+
+class PromptBuilder:
+    def __init__(
+        self,
+        counter: TokenCounter = token_counter,
+        memory_share: float = DEFAULT_MEMORY_SHARE,
+        safety_margin: int = SAFETY_MARGIN,
+    ):
+        self.counter = counter
+        self.memory_share = memory_share
+        self.safety_margin = safety_margin
+
+    @staticmethod
+    def _format_message(msg: Any) -> str:
+        role = getattr(msg, "role", None) or (
+            msg.get("role") if isinstance(msg, dict) else "user"
+        )
+        content = getattr(msg, "content", None)
+        if content is None and isinstance(msg, dict):
+            content = msg.get("content", "")
+        return f"{'User' if role == 'user' else 'Assistant'}: {content}"
+
+    def build(
+        self,
+        system_prompt: str,
+        persona_prompt: str,
+        message: str,
+        history: Optional[Iterable[Any]] = None,
+        memory: Optional[str] = None,
+        context_window: int = DEFAULT_CONTEXT_WINDOW,
+        max_output_tokens: int = 512,
+    ) -> BuiltPrompt:
+        count = self.counter.count
+        cached = self.counter.count_cached
+        budget = max(0, context_window - max_output_tokens - self.safety_margin)
+        separator = cached(SECTION_SEPARATOR)
+
+        # Fixed sections (system/persona prompts recur every turn: cached counts)
+        sections = {
+            "system": cached(system_prompt),
+            "persona": cached(persona_prompt),
+        }
+        user_line = f"User: {message}"
+        sections["message"] = count(user_line)
+        # Separators between the fixed sections
+        sections["framing"] = separator * (
+            sum(1 for p in (system_prompt, persona_prompt, user_line) if p) - 1
+        )
+        truncated = False
+
+        remaining = budget - sum(sections.values())
+        if remaining < 0:
+            # Keep the prompts intact, clip the message (keep its end)
+            allowed = max(0, sections["message"] + remaining - cached("User: "))
+            user_line = "User: " + self.counter.truncate(message, allowed, keep="tail")
+            sections["message"] = count(user_line)
+            remaining = budget - sum(sections.values())
+            truncated = True
+            log_error(
+                "[PROMPT] Fixed sections exceed budget (%d tokens); "
+                "user message clipped",
+                budget,
+                phase="prompt",
+            )
+
+        # Memory: up to memory_share of what's left (after its header)
+        memory_block = ""
+        memory_framing = cached(MEMORY_HEADER) + separator
+        if memory and remaining > memory_framing:
+            memory_budget = int((remaining - memory_framing) * self.memory_share)
+            mem_tokens = count(memory)
+            if mem_tokens > memory_budget:
+                memory = self.counter.truncate(memory, memory_budget, keep="head")
+                mem_tokens = count(memory)
+                truncated = True
+            if memory:
+                memory_block = MEMORY_HEADER + memory
+                sections["memory"] = mem_tokens
+                sections["framing"] += memory_framing
+                remaining -= mem_tokens + memory_framing
+
+        # History: newest first until the budget runs out
+        history_lines: List[str] = []
+        history_tokens = 0
+        history_framing = cached(HISTORY_HEADER) + separator
+        line_break = cached("\n")
+        if history and remaining > history_framing:
+            remaining -= history_framing
+            messages = list(history)
+            # The current user message is usually already in the context
+            last = messages[-1] if messages else None
+            if (
+                last is not None
+                and getattr(last, "role", None) == "user"
+                and getattr(last, "content", None) == message
+            ):
+                messages = messages[:-1]
+            for msg in reversed(messages):
+                line = self._format_message(msg)
+                n = count(line) + (line_break if history_lines else 0)
+                if history_tokens + n > remaining:
+                    truncated = True
+                    break
+                history_lines.append(line)
+                history_tokens += n
+            history_lines.reverse()
+        if history_lines:
+            sections["history"] = history_tokens
+            sections["framing"] += history_framing
+
+        parts = [system_prompt, persona_prompt]
+        if memory_block:
+            parts.append(memory_block)
+        if history_lines:
+            parts.append(HISTORY_HEADER + "\n".join(history_lines))
+        parts.append(user_line)
+        text = SECTION_SEPARATOR.join(p for p in parts if p)
+
+        built = BuiltPrompt(
+            text=text,
+            tokens=count(text),
+            budget=budget,
+            sections=sections,
+            history_messages=len(history_lines),
+            truncated=truncated,
+        )
+        log_debug(
+            "[PROMPT] %d/%d tokens (window %d): %s",
+            built.tokens, budget, context_window, sections,
+            phase="prompt",
+        )
+        return built
+
+
+prompt_builder = PromptBuilder()
@@ -0,0 +1,446 @@
+# continuum/memory/compaction.py
+
+"""
+Background memory compaction.
+
+    compactor = MemoryCompactor([
+        EpisodeTier(memory_store, retriever=memory_retriever),
+        KeyValueTier(context.memory),
+        EmotionalEventTier(emotional_memory),
+        MySQLEpisodeTier(mysql_backend),
+    ])
+    compactor.start()            # or compactor.run_once() from a job
+    compactor.stats()            # per-tier totals: expired / evicted / merged
+
+Each tier has its own CompactionPolicy. A cycle applies the policy's
+rules in this order:
+
+    merge      near-duplicate episodes (cosine >= merge_similarity, or the
+               same normalized text when there are no embeddings) become
+               one record, counted in metadata["merged"]
+    ttl        drop records older than ttl_s
+    max_count  over the limit, drop the least important first, where
+               importance = base * (1 + merged) * 0.5 ** (age / half_life)
+               and base is metadata["importance"] (default 0.5)
+
+Removed episodes are also removed from the MemoryRetriever, so they stop
+being recalled. The rolling summary keeps what it has already folded in.
+
+Everything runs on the compactor thread, never on the request path.
+The MySQL tier deletes in batches of `batch_size` ids and sleeps between
+batches to stay under `max_rows_per_s`. It stops after
+`max_rows_per_cycle` and picks up where it left off next cycle.
+
+Environment:
+    CONTINUUM_COMPACTION_INTERVAL      seconds between cycles
+                                       (default 300; 0 disables)
+    CONTINUUM_EPISODE_TTL_H            episodic TTL in hours (default 720)
+    CONTINUUM_MEMORY_MERGE_SIMILARITY  cosine for merging episodes
+                                       (default 0.95)
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select
+
+from continuum.core.logger import log_debug, log_error, log_info
+from continuum.core.tracing import span
+from continuum.monitoring.metrics import MEMORY_COMPACTED_TOTAL
+
+COMPACTION_INTERVAL = float(os.getenv("CONTINUUM_COMPACTION_INTERVAL", 300))
+EPISODE_TTL_S = float(os.getenv("CONTINUUM_EPISODE_TTL_H", 720)) * 3600.0
+MERGE_SIMILARITY = float(os.getenv("CONTINUUM_MEMORY_MERGE_SIMILARITY", 0.95))
+
+DEFAULT_IMPORTANCE = 0.5
+DAY_S = 86400.0
+
+
+@dataclass
+class CompactionPolicy:
+    ttl_s: Optional[float] = None
+    max_count: Optional[int] = None
+    merge_similarity: Optional[float] = None      # None: never merge
+    half_life_s: float = 7 * DAY_S                # importance decay
+
+
+@dataclass
+class TierStats:
+    examined: int = 0
+    expired: int = 0
+    evicted: int = 0
+    merged: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def removed(self) -> int:
+        return self.expired + self.evicted + self.merged
+
+    def add(self, other: "TierStats") -> None:
+        self.examined += other.examined
+        self.expired += other.expired
+        self.evicted += other.evicted
+        self.merged += other.merged
+        self.duration_ms += other.duration_ms
+
+
+def importance(
+    metadata: Optional[Dict[str, Any]], age_s: float, half_life_s: float
+) -> float:
+    metadata = metadata or {}
+    base = float(metadata.get("importance", DEFAULT_IMPORTANCE))
+    decay = 0.5 ** (max(0.0, age_s) / half_life_s) if half_life_s > 0 else 1.0
+    return base * (1 + int(metadata.get("merged", 0))) * decay
+
+
+def _least_important(
+    items: Sequence[Any], excess: int, score: Callable[[Any], float]
+) -> List[Any]:
+    return sorted(items, key=score)[:excess] if excess > 0 else []
+
+
+# ---------------------------------------------------------
+# Tiers
+# ---------------------------------------------------------
+class CompactionTier(ABC):
+    name = "tier"
+
+    def __init__(self, policy: CompactionPolicy):
+        self.policy = policy
+
+    @abstractmethod
+    def compact(self, now: float) -> TierStats:
+        """Apply the policy once; called from the compactor thread."""
+
+    def _score(self, now: float) -> Callable[[Any], float]:
+        """Importance of a record (with .metadata and .ts) at time `now`."""
+        half_life_s = self.policy.half_life_s
+
+        def score(record) -> float:
+            return importance(record.metadata, now - record.ts, half_life_s)
+
+        return score
+
+
+class EpisodeTier(CompactionTier):
+    """MemoryStore.episodic (+ the retriever's copies of those episodes)."""
+
+    name = "episodes"
+
+    def __init__(
+        self, store, retriever=None, policy: Optional[CompactionPolicy] = None
+    ):
+        super().__init__(
+            policy
+            or CompactionPolicy(ttl_s=EPISODE_TTL_S, merge_similarity=MERGE_SIMILARITY)
+        )
+        self.store = store
+        self.retriever = retriever
+        self._merged_through = 0      # episodes_added already checked for duplicates
+
+    def _merge_targets(self, episodes) -> Dict[int, Tuple[Any, Any]]:
+        """id(duplicate) -> (duplicate, newer episode it folds into), oldest first."""
+        added = self.store.episodes_added
+        unchecked = min(len(episodes), added - self._merged_through)
+        new = episodes[len(episodes) - unchecked:]
+        self._merged_through = added
+        if not new:
+            return {}
+
+        by_id = {e.episode_id: e for e in episodes if e.episode_id}
+        vectors = getattr(self.retriever, "vectors", None)
+        targets: Dict[int, Tuple[Any, Any]] = {}
+
+        if vectors is not None and len(vectors):
+            for episode in new:
+                if id(episode) in targets or not episode.episode_id:
+                    continue
+                vector = vectors.vector(f"episode:{episode.episode_id}")
+                if vector is None:
+                    continue
+                for doc_id, similarity in vectors.search(vector, 4):
+                    if not doc_id.startswith("episode:"):
+                        continue
+                    older = by_id.get(doc_id[len("episode:"):])
+                    if (
+                        older is not None and older is not episode
+                        and similarity >= self.policy.merge_similarity
+                        and older.ts <= episode.ts and id(older) not in targets
+                    ):
+                        targets[id(older)] = (older, episode)
+        else:
+            new_ids = {id(e) for e in new}
+            seen = {
+                " ".join(e.content.lower().split()): e
+                for e in episodes
+                if id(e) not in new_ids
+            }
+            for episode in new:
+                key = " ".join(episode.content.lower().split())
+                older = seen.get(key)
+                if older is not None and id(older) not in targets:
+                    targets[id(older)] = (older, episode)
+                seen[key] = episode
+        return targets
+
+    def compact(self, now: float) -> TierStats:
+        policy = self.policy
+        episodes = list(self.store.episodic)
+        stats = TierStats(examined=len(episodes))
+        drop: Dict[int, str] = {}
+
+        if policy.merge_similarity is not None:
+            for dup_id, (dup, keeper) in self._merge_targets(episodes).items():
+                drop[dup_id] = "merged"
+                merged = (
+                    int((keeper.metadata or {}).get("merged", 0))
+                    + int((dup.metadata or {}).get("merged", 0))
+                    + 1
+                )
+                keeper.metadata = {**(keeper.metadata or {}), "merged": merged}
+
+        if policy.ttl_s is not None:
+            cutoff = now - policy.ttl_s
+            for e in episodes:
+                if e.ts < cutoff:
+                    drop.setdefault(id(e), "expired")
+
+        if policy.max_count is not None:
+            alive = [e for e in episodes if id(e) not in drop]
+            excess = len(alive) - policy.max_count
+            for e in _least_important(alive, excess, self._score(now)):
+                drop[id(e)] = "evicted"
+
+        if drop:
+            removed = self.store.remove_episodes(lambda e: id(e) not in drop)
+            for e in removed:
+                setattr(stats, drop[id(e)], getattr(stats, drop[id(e)]) + 1)
+                if self.retriever is not None and e.episode_id:
+                    self.retriever.remove(f"episode:{e.episode_id}")
+        return stats
+
+
+class KeyValueTier(CompactionTier):
+    """ContinuumMemory records (TTL + importance-scored max_count)."""
+
+    name = "key_value"
+
+    def __init__(self, memory, policy: Optional[CompactionPolicy] = None):
+        super().__init__(policy or CompactionPolicy(max_count=50_000))
+        self.memory = memory
+
+    def compact(self, now: float) -> TierStats:
+        policy = self.policy
+        records = self.memory.records()
+        stats = TierStats(examined=len(records))
+
+        expired = []
+        if policy.ttl_s is not None:
+            expired = [r for r in records if r.ts < now - policy.ttl_s]
+        evicted = []
+        if policy.max_count is not None:
+            expired_keys = {r.key for r in expired}
+            alive = [r for r in records if r.key not in expired_keys]
+            excess = len(alive) - policy.max_count
+            evicted = _least_important(alive, excess, self._score(now))
+
+        stats.expired = sum(self.memory.remove(r.key) for r in expired)
+        stats.evicted = sum(self.memory.remove(r.key) for r in evicted)
+        return stats
+
+
+class EmotionalEventTier(CompactionTier):
+    """EmotionalMemory.events (TTL; the ring already caps the count)."""
+
+    name = "emotional_events"
+
+    def __init__(self, memory, policy: Optional[CompactionPolicy] = None):
+        super().__init__(policy or CompactionPolicy(ttl_s=7 * DAY_S))
+        self.memory = memory
+
+    def compact(self, now: float) -> TierStats:
+        stats = TierStats(examined=len(self.memory.events))
+        if self.policy.ttl_s is None:
+            return stats
+        cutoff = datetime.utcfromtimestamp(now - self.policy.ttl_s).isoformat()
+        # ISO-8601 timestamps from the same clock sort as strings
+        dropped = self.memory.events.retain(lambda e: e.timestamp >= cutoff)
+        stats.expired = len(dropped)
+        return stats
+
+
+class MySQLEpisodeTier(CompactionTier):
+    """
+    The MySQL episodic_memory table (TTL + max_count), deleted oldest
+    first in rate-limited batches.
+    """
+
+    name = "mysql_episodes"
+
+    def __init__(
+        self,
+        backend,
+        policy: Optional[CompactionPolicy] = None,
+        batch_size: int = 1000,
+        max_rows_per_s: float = 5000.0,
+        max_rows_per_cycle: int = 100_000,
+    ):
+        super().__init__(policy or CompactionPolicy(ttl_s=EPISODE_TTL_S))
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_rows_per_s = max_rows_per_s
+        self.max_rows_per_cycle = max_rows_per_cycle
+
+    def _delete_oldest(self, engine, table, limit: int, where=None) -> int:
+        """Delete up to `limit` oldest rows (optionally matching `where`) in batches."""
+        deleted = 0
+        while deleted < limit:
+            query = select(table.c.id).order_by(table.c.timestamp, table.c.id)
+            if where is not None:
+                query = query.where(where)
+            with engine.begin() as conn:
+                batch = min(self.batch_size, limit - deleted)
+                ids = conn.execute(query.limit(batch)).scalars().all()
+                if not ids:
+                    break
+                conn.execute(delete(table).where(table.c.id.in_(ids)))
+            deleted += len(ids)
+            if self.max_rows_per_s > 0:
+                time.sleep(len(ids) / self.max_rows_per_s)
+        return deleted
+
+    def compact(self, now: float) -> TierStats:
+        from continuum.memory.mysql_backend import episodic_memory
+
+        engine = self.backend.connect()
+        stats = TierStats()
+        if engine is None:
+            return stats
+        self.backend.flush()
+
+        with engine.connect() as conn:
+            stats.examined = conn.execute(
+                select(func.count()).select_from(episodic_memory)
+            ).scalar_one()
+
+        budget = self.max_rows_per_cycle
+        if self.policy.ttl_s is not None:
+            ttl = timedelta(seconds=self.policy.ttl_s)
+            cutoff = datetime.utcfromtimestamp(now) - ttl
+            stats.expired = self._delete_oldest(
+                engine,
+                episodic_memory,
+                budget,
+                where=episodic_memory.c.timestamp < cutoff,
+            )
+            budget -= stats.expired
+
+        excess = stats.examined - stats.expired - (self.policy.max_count or 0)
+        if self.policy.max_count is not None and excess > 0 and budget > 0:
+            stats.evicted = self._delete_oldest(
+                engine, episodic_memory, min(excess, budget)
+            )
+        return stats
+
+
+# ---------------------------------------------------------
+# Service
+# ---------------------------------------------------------
+class MemoryCompactor(threading.Thread):
+    """
+    Background thread that compacts each tier every interval_seconds.
+    A tier that fails is logged and retried next cycle; the others still run.
+    Tiers can be added and removed while it runs (one compactor serves
+    every session in the process); stats are summed per tier name.
+    """
+
+    def __init__(
+        self,
+        tiers: Iterable[CompactionTier],
+        interval_seconds: float = COMPACTION_INTERVAL,
+    ):
+        super().__init__(daemon=True, name="memory-compactor")
+        self.tiers = list(tiers)
+        self.interval = interval_seconds
+        self.running = True
+        self.cycles = 0
+        self.last_run: Optional[float] = None
+        self._totals: Dict[str, TierStats] = {
+            tier.name: TierStats() for tier in self.tiers
+        }
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def add_tiers(self, tiers: Iterable[CompactionTier]) -> None:
+        with self._lock:
+            for tier in tiers:
+                self.tiers.append(tier)
+                self._totals.setdefault(tier.name, TierStats())
+
+    def remove_tiers(self, tiers: Iterable[CompactionTier]) -> None:
+        drop = {id(tier) for tier in tiers}
+        with self._lock:
+            self.tiers = [tier for tier in self.tiers if id(tier) not in drop]
+
+    def run_once(self, now: Optional[float] = None) -> Dict[str, TierStats]:
+        now = time.time() if now is None else now
+        results: Dict[str, TierStats] = {}
+        with self._lock:
+            tiers = list(self.tiers)
+
+        with span("memory.compaction", tiers=len(tiers)) as sp:
+            for tier in tiers:
+                started = time.perf_counter()
+                try:
+                    stats = tier.compact(now)
+                except Exception as e:
+                    log_error(
+                        "[COMPACTION] Tier %s failed: %s", tier.name, e, phase="memory"
+                    )
+                    continue
+                stats.duration_ms = (time.perf_counter() - started) * 1000.0
+                results.setdefault(tier.name, TierStats()).add(stats)
+
+                for action in ("expired", "evicted", "merged"):
+                    count = getattr(stats, action)
+                    if count:
+                        MEMORY_COMPACTED_TOTAL.labels(
+                            tier=tier.name, action=action
+                        ).inc(count)
+            sp.set(removed=sum(s.removed for s in results.values()))
+
+        with self._lock:
+            for name, stats in results.items():
+                self._totals.setdefault(name, TierStats()).add(stats)
+            self.cycles += 1
+            self.last_run = now
+
+        removed = {name: s.removed for name, s in results.items() if s.removed}
+        if removed:
+            log_info("[COMPACTION] Removed %s", removed, phase="memory")
+        log_debug("[COMPACTION] Cycle %d: %s", self.cycles, results, phase="memory")
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Cumulative per-tier counts since the compactor was created."""
+        with self._lock:
+            return {
+                "cycles": self.cycles,
+                "last_run": self.last_run,
+                "tiers": {name: asdict(s) for name, s in self._totals.items()},
+            }
+
+    def run(self):
+        while self.running:
+            self._wake.wait(self.interval)
+            if self.running:
+                self.run_once()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
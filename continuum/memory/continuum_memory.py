@@ -1,5 +1,7 @@
 from __future__ import annotations
+import threading
 from typing import Any, Dict, List, Optional
+from .inverted_index import InvertedIndex, tokenize
 from .memory_record import MemoryRecord
 
 
@@ -9,22 +11,41 @@ class ContinuumMemory:
     Supports:
       - adding memories
       - retrieving by key
-      - searching by substring
+      - ranked search (inverted index, BM25, prefix + AND terms)
       - snapshotting for context
+
+    Thread-safe: the memory compactor removes records from its own thread
+    while turns add and search, so the dict and the index change together
+    under one lock.
     """
 
     def __init__(self):
         self._store: Dict[str, MemoryRecord] = {}
+        self._index = InvertedIndex()
+        self._lock = threading.RLock()
 
     # ---------------------------------------------------------
     # ADD / UPDATE
     # ---------------------------------------------------------
     def add(self, key: str, value: Any, **metadata: Any) -> None:
-        self._store[key] = MemoryRecord(
-            key=key,
-            value=value,
-            metadata=metadata,
-        )
+        self.put(MemoryRecord(key=key, value=value, metadata=metadata))
+
+    def put(self, record: MemoryRecord) -> None:
+        """Store a prebuilt record as-is (keeps its ts; used on restore)."""
+        with self._lock:
+            self._store[record.key] = record
+            # Re-indexing an existing key replaces its postings
+            self._index.add(record.key, f"{record.key} {record.value}")
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            self._index.remove(key)
+            return self._store.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._index = InvertedIndex()
 
     # ---------------------------------------------------------
     # RETRIEVE
@@ -33,20 +54,42 @@ class ContinuumMemory:
         record = self._store.get(key)
         return record.value if record else None
 
+    def records(self) -> List[MemoryRecord]:
+        """Every stored record (a snapshot list)."""
+        with self._lock:
+            return list(self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
     # ---------------------------------------------------------
     # SEARCH
     # ---------------------------------------------------------
-    def search(self, query: str) -> List[MemoryRecord]:
-        query_lower = query.lower()
-        return [
-            record
-            for record in self._store.values()
-            if query_lower in record.key.lower()
-            or query_lower in str(record.value).lower()
-        ]
+    def search(self, query: str, limit: Optional[int] = None) -> List[MemoryRecord]:
+        """
+        Records whose key/value contain every query word (each as a word
+        prefix), best BM25 match first.
+        """
+        if not tokenize(query):
+            # Punctuation-only query: nothing to look up, fall back to a scan
+            query_lower = query.lower()
+            return [
+                record
+                for record in self.records()
+                if query_lower in record.key.lower()
+                or query_lower in str(record.value).lower()
+            ][:limit]
+        with self._lock:
+            hits = self._index.search(query, limit=limit)
+            return [self._store[key] for key, _ in hits if key in self._store]
+
+    def index_stats(self) -> Dict[str, int]:
+        """Footprint of the search index (documents, terms, postings, bytes)."""
+        return self._index.stats()
 
     # ---------------------------------------------------------
     # SNAPSHOT
     # ---------------------------------------------------------
     def snapshot(self) -> Dict[str, Any]:
-        return {key: record.value for key, record in self._store.items()}
\ No newline at end of file
+        with self._lock:
+            return {key: record.value for key, record in self._store.items()}
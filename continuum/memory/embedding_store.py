@@ -0,0 +1,297 @@
+# continuum/memory/embedding_store.py
+
+"""
+On-disk, memory-mapped embedding store.
+
+    store = EmbeddingStore("data/recall", dim=384)           # float16 by default
+    store.append(["episode:42"], vectors)                     # -> [row]
+    store.matrix[:store.count]                                 # np.memmap view, no copy
+    store.close()
+
+    index = VectorIndex(dim=384, store=EmbeddingStore("data/recall"))
+
+A store is three files next to each other:
+
+    <path>.vec   64-byte header (magic, dim, dtype), then a fixed-width
+                 float16/float32 row per vector. Mapped with np.memmap.
+    <path>.ids   the id of each row, one per line (row = line number).
+    <path>.del   int64 numbers of dead rows.
+
+All three are append-only. Rows are never rewritten. Overwriting an id
+appends a new row and marks the old row dead. Deleting an id only marks
+its row dead. The .vec file grows by doubling (sparse where the
+filesystem allows), so an append only remaps when capacity runs out.
+
+Opening a store maps the matrix without reading it and reads only the
+two sidecars; the id -> row dict is built on first lookup. A million
+384-d vectors open in about a tenth of a second and fault pages in as
+searches touch them. The row count is the number of
+ids, so a .vec row whose id was never written does not exist: it is
+overwritten by the next append.
+
+Only the ids and the dead-row mask live in RAM. float16 halves the file
+and the page-cache footprint; at 384 dimensions its rounding error is
+far below the score gaps that decide a top-k. It does make exact scans
+slower, since every row is upcast on the way to the dot product.
+"""
+
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from continuum.core.logger import log_debug
+
+MAGIC = b"CEMB"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<4sIII")      # magic, version, dim, itemsize
+
+DTYPES = {"float16": np.float16, "float32": np.float32}
+
+
+class EmbeddingStore:
+    def __init__(
+        self,
+        path: str,
+        dim: Optional[int] = None,
+        dtype: str = "float16",
+        readonly: bool = False,
+        initial_capacity: int = 1024,
+    ):
+        self.path = path
+        self.readonly = readonly
+        self._lock = threading.RLock()
+        self._vec_path = f"{path}.vec"
+
+        if os.path.exists(self._vec_path):
+            self.dim, self.dtype = self._read_header(dim, dtype)
+        else:
+            if readonly:
+                raise FileNotFoundError(self._vec_path)
+            if dim is None:
+                raise ValueError("dim is required to create a new embedding store")
+            if dtype not in DTYPES:
+                raise ValueError(
+                    f"dtype must be one of {sorted(DTYPES)}, got {dtype!r}"
+                )
+            self.dim, self.dtype = dim, np.dtype(DTYPES[dtype])
+            self._create(initial_capacity)
+
+        self._row_bytes = self.dim * self.dtype.itemsize
+        self._map()
+
+        # Sidecars: row -> id, dead rows
+        self.ids: List[str] = self._read_ids()
+        dead = (
+            np.fromfile(f"{path}.del", dtype=np.int64)
+            if os.path.exists(f"{path}.del") else np.empty(0, dtype=np.int64)
+        )
+        self._live = np.ones(self.capacity, dtype=bool)
+        self._live[dead[dead < len(self.ids)]] = False
+        self._dead = len(self.ids) - int(self.live.sum())
+        self._rows: Optional[Dict[str, int]] = None     # built on first use
+
+        self._ids_file = (
+            None if readonly else open(f"{path}.ids", "a", encoding="utf-8")
+        )
+        self._del_file = None if readonly else open(f"{path}.del", "ab")
+
+        log_debug(
+            "[EMBED STORE] Opened %s: %d rows (%d live), dim=%d, %s",
+            path, len(self.ids), len(self), self.dim, self.dtype.name,
+            phase="memory",
+        )
+
+    # -----------------------------------------------------
+    # Files
+    # -----------------------------------------------------
+    def _create(self, capacity: int) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self._vec_path)), exist_ok=True)
+        with open(self._vec_path, "wb") as f:
+            f.write(
+                _HEADER.pack(MAGIC, VERSION, self.dim, self.dtype.itemsize).ljust(
+                    HEADER_SIZE, b"\0"
+                )
+            )
+            f.truncate(HEADER_SIZE + capacity * self.dim * self.dtype.itemsize)
+        for suffix in (".ids", ".del"):
+            open(f"{self.path}{suffix}", "wb").close()
+
+    def _read_header(self, dim: Optional[int], dtype: str):
+        with open(self._vec_path, "rb") as f:
+            magic, version, file_dim, itemsize = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self._vec_path} is not an embedding store (v{VERSION})")
+        if dim is not None and dim != file_dim:
+            raise ValueError(f"{self._vec_path} holds dim {file_dim}, expected {dim}")
+        return file_dim, np.dtype(np.float16 if itemsize == 2 else np.float32)
+
+    def _read_ids(self) -> List[str]:
+        ids_path = f"{self.path}.ids"
+        if not os.path.exists(ids_path):
+            return []
+        with open(ids_path, "rb") as f:
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data) and not self.readonly:
+            # A torn write after the last newline: drop it before appending
+            with open(ids_path, "r+b") as f:
+                f.truncate(end)
+        ids = data[:end].decode("utf-8").split("\n")
+        ids.pop()
+        return ids[: self.capacity]
+
+    def _map(self) -> None:
+        capacity = (os.path.getsize(self._vec_path) - HEADER_SIZE) // self._row_bytes
+        self.matrix = np.memmap(
+            self._vec_path,
+            dtype=self.dtype,
+            mode="r" if self.readonly else "r+",
+            offset=HEADER_SIZE,
+            shape=(capacity, self.dim),
+        )
+
+    def _reserve(self, n: int) -> None:
+        capacity = self.capacity
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        self.matrix.flush()
+        with open(self._vec_path, "r+b") as f:
+            f.truncate(HEADER_SIZE + capacity * self._row_bytes)
+        self._map()
+
+        live = np.ones(capacity, dtype=bool)
+        live[: len(self.ids)] = self._live[: len(self.ids)]
+        self._live = live
+
+    # -----------------------------------------------------
+    # Writes
+    # -----------------------------------------------------
+    def append(self, ids: Sequence[str], vectors: np.ndarray) -> List[int]:
+        """
+        Append vectors (stored as given, not normalized) and return their
+        rows. An id that already exists is overwritten: its old row dies.
+        """
+        if self.readonly:
+            raise PermissionError(f"{self.path} was opened read-only")
+        vectors = np.asarray(vectors)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected vectors of shape (n, {self.dim}), got {vectors.shape}"
+            )
+        if len(ids) != len(vectors):
+            raise ValueError(f"{len(ids)} ids for {len(vectors)} vectors")
+        if any("\n" in item_id for item_id in ids):
+            raise ValueError("ids may not contain newlines")
+
+        with self._lock:
+            start = len(self.ids)
+            self._reserve(start + len(ids))
+            self.matrix[start:start + len(ids)] = vectors
+
+            rows = list(range(start, start + len(ids)))
+            dead = []
+            for item_id, row in zip(ids, rows):
+                previous = self.rows.get(item_id)
+                if previous is not None:
+                    dead.append(previous)
+                self.rows[item_id] = row
+            self.ids.extend(ids)
+            self._ids_file.write("".join(f"{item_id}\n" for item_id in ids))
+            self._mark_dead(dead)
+            return rows
+
+    def delete(self, item_id: str) -> bool:
+        if self.readonly:
+            raise PermissionError(f"{self.path} was opened read-only")
+        with self._lock:
+            row = self.rows.pop(item_id, None)
+            if row is None:
+                return False
+            self._mark_dead([row])
+            return True
+
+    def _mark_dead(self, rows: List[int]) -> None:
+        if not rows:
+            return
+        rows = sorted(set(rows))
+        self._dead += int(self._live[rows].sum())
+        self._live[rows] = False
+        self._del_file.write(np.asarray(rows, dtype=np.int64).tobytes())
+
+    def flush(self) -> None:
+        """Write vectors before the ids that make them visible."""
+        with self._lock:
+            if self.readonly:
+                return
+            self.matrix.flush()
+            self._ids_file.flush()
+            self._del_file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            for f in (self._ids_file, self._del_file):
+                if f is not None:
+                    f.close()
+            self._ids_file = self._del_file = None
+
+    # -----------------------------------------------------
+    # Reads
+    # -----------------------------------------------------
+    @property
+    def rows(self) -> Dict[str, int]:
+        """
+        id -> live row. Hashing every id is most of the cost of an open,
+        so it waits until needed.
+        """
+        with self._lock:
+            if self._rows is None:
+                # Later rows win, so a re-added id maps to its newest row
+                rows = dict(zip(self.ids, range(len(self.ids))))
+                for row in np.flatnonzero(~self.live).tolist():
+                    if rows.get(self.ids[row]) == row:
+                        del rows[self.ids[row]]
+                self._rows = rows
+            return self._rows
+
+    def __len__(self) -> int:
+        return len(self.ids) - self._dead
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.rows
+
+    @property
+    def count(self) -> int:
+        """Rows written, live or dead."""
+        return len(self.ids)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.matrix)
+
+    @property
+    def live(self) -> np.ndarray:
+        """Boolean mask over rows [0, count)."""
+        return self._live[: len(self.ids)]
+
+    @property
+    def dead(self) -> int:
+        return self._dead
+
+    def get(self, item_id: str) -> Optional[np.ndarray]:
+        row = self.rows.get(item_id)
+        return None if row is None else self.matrix[row]
+
+    @property
+    def nbytes_on_disk(self) -> int:
+        return sum(
+            os.path.getsize(f"{self.path}{suffix}")
+            for suffix in (".vec", ".ids", ".del")
+            if os.path.exists(f"{self.path}{suffix}")
+        )
@@ -5,7 +5,7 @@ Useful for short‑term continuity and contextual reasoning.
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from continuum.memory.memory_store import MemoryStore
 from continuum.core.context import ContinuumContext
@@ -14,18 +14,26 @@ from continuum.core.context import ContinuumContext
 @dataclass
 class EpisodicMemory:
     store: MemoryStore
+    # Optional memory.retrieval.MemoryRetriever; episodes become recallable
+    retriever: Any = None
 
-    def record(self, context: ContinuumContext) -> None:
+    def record(
+        self, context: ContinuumContext, episode_id: Optional[str] = None
+    ) -> None:
         """Save the latest user message as an episodic entry."""
         msg = context.last_user_message()
         if not msg:
             return
 
+        episode_id = episode_id or str(self.store.episodes_added)
         entry: Dict[str, Any] = {
             "content": msg.content,
             "metadata": msg.metadata,
+            "episode_id": episode_id,
         }
         self.store.add_episode(entry)
+        if self.retriever is not None:
+            self.retriever.add_episode(episode_id, msg.content)
 
     def recall_recent(self, limit: int = 5):
         """Return the most recent episodic entries."""
@@ -0,0 +1,105 @@
+# continuum/memory/facts.py
+
+"""
+Stable facts the user states about themselves, for SemanticMemory.
+
+    remember_facts(context.semantic_memory, "My name is Ada. I love hiking")
+    # name -> "Ada", likes -> "hiking"
+
+Extraction is rule-based and needs no model. Only first-person
+statements that match one of a few patterns count:
+
+    my name is X / call me X          name
+    I'm X years old                   age
+    I live in X / I'm from X          lives in / from
+    I work as X                       occupation
+    my favorite T is X                favorite T
+    my T is named/called X            T's name
+    I like/love/enjoy X               likes      (accumulates)
+    I hate/dislike/don't like X       dislikes   (accumulates)
+
+Questions and vague values ("I like it") are skipped. A value ends at
+the first clause break (comma, "and", "but", ...) and is clipped to
+MAX_VALUE_WORDS words. A newer
+statement replaces the old value, except for likes and dislikes, which
+collect up to MAX_LIST_ITEMS items.
+"""
+
+import re
+from typing import List, Tuple
+
+MAX_VALUE_WORDS = 5
+MAX_LIST_ITEMS = 8
+
+LIST_KEYS = frozenset({"likes", "dislikes"})
+
+# Values that only make sense in the conversation they came from
+_VAGUE = frozenset(
+    {"it", "that", "this", "these", "those", "them", "you", "him", "her"}
+)
+
+_SENTENCE = re.compile(r"[^.!?;\n]+[.!?;]?")
+_CLAUSE_BREAK = re.compile(
+    r",|\b(?:and|but|because|since|so|though|although|which|who|when|if)\b",
+    re.IGNORECASE,
+)
+
+_ADVERBS = r"(?:(?:really|also|still|just|absolutely) )*"
+
+# (pattern, key) pairs; a key containing "{}" takes the first group and
+# the value is the last group
+_PATTERNS = [
+    (r"\bmy name is (.+)", "name"),
+    (r"\bcall me (.+)", "name"),
+    (r"\bi(?: am|'m) (\d{1,3}) years? old\b", "age"),
+    (r"\bi (?:live|am living|'m living) in (.+)", "lives in"),
+    (r"\bi(?: am|'m) from (.+)", "from"),
+    (r"\bi work as (?:an? )?(.+)", "occupation"),
+    (r"\bmy favou?rite (\w+(?: \w+)?) is (.+)", "favorite {}"),
+    (r"\bmy (\w+)(?: is named| is called|'s name is) (.+)", "{}'s name"),
+    (rf"\bi {_ADVERBS}(?:like|love|enjoy) (.+)", "likes"),
+    (rf"\bi {_ADVERBS}(?:hate|dislike|don't like|do not like) (.+)", "dislikes"),
+]
+_COMPILED = [(re.compile(p, re.IGNORECASE), key) for p, key in _PATTERNS]
+
+
+def _clip(value: str) -> str:
+    value = _CLAUSE_BREAK.split(value, maxsplit=1)[0]
+    words = value.strip(" \t\"'.!?;:").split()
+    return " ".join(words[:MAX_VALUE_WORDS])
+
+
+def extract_facts(text: str) -> List[Tuple[str, str]]:
+    """(key, value) pairs stated in `text`, in order."""
+    facts: List[Tuple[str, str]] = []
+    for sentence in _SENTENCE.findall(text or ""):
+        sentence = sentence.strip()
+        if not sentence or sentence.endswith("?"):
+            continue
+        for pattern, key in _COMPILED:
+            match = pattern.search(sentence)
+            if match is None:
+                continue
+            value = _clip(match.group(match.lastindex))
+            if not value or value.lower() in _VAGUE:
+                continue
+            if "{}" in key:
+                key = key.format(match.group(1).lower())
+            facts.append((key, value))
+    return facts
+
+
+def remember_facts(semantic_memory, text: str) -> List[Tuple[str, str]]:
+    """Store the facts stated in `text`; returns the (key, value) pairs set."""
+    stored: List[Tuple[str, str]] = []
+    for key, value in extract_facts(text):
+        if key in LIST_KEYS:
+            items = [i for i in (semantic_memory.get(key) or "").split(", ") if i]
+            if value.lower() in (i.lower() for i in items):
+                continue
+            value = ", ".join((items + [value])[-MAX_LIST_ITEMS:])
+        elif semantic_memory.get(key) == value:
+            continue
+        semantic_memory.set(key, value)
+        stored.append((key, value))
+    return stored
@@ -0,0 +1,387 @@
+# continuum/memory/inverted_index.py
+
+"""
+Incremental inverted index with BM25 ranking.
+
+    index = InvertedIndex()
+    index.add("pref:tea", "pref:tea likes green tea in the morning")
+    index.search("green mor", limit=10)     # -> [("pref:tea", 1.73)]
+
+Documents are tokenized into lowercase word tokens. Every query term
+must match (AND), or with match_all=False any of them (OR). With
+prefix=True a term matches any indexed token it is a prefix of
+("mor" -> "morning"), via bisect over a sorted vocabulary. Matches are
+ranked by BM25; a prefix term that expands to several tokens of a
+document scores as its best expansion.
+
+add() on an existing id replaces the document, remove() drops it; both
+update postings in place, so the index never needs a rebuild.
+
+Top-k queries (limit=k) don't score every match. Each queried token
+keeps an impact-ordered posting list (documents sorted by their BM25
+term weight), maintained incrementally once built, and the query walks
+the lists of all terms in parallel until no unseen document can beat
+the current k-th score (Fagin's threshold algorithm). A query for a
+term found in half the corpus then touches ~k documents, not half the
+corpus. Selective queries (few documents match every term) skip this
+and score the exact AND set directly. Impacts use the average document
+length at the time they were built; they are rebuilt when the live
+average drifts by more than AVG_LEN_DRIFT.
+"""
+
+import heapq
+import math
+import re
+import sys
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+AVG_LEN_DRIFT = 0.25
+
+# Top-k strategy: build the exact AND set when the rarest term occurs in at
+# most INTERSECT_MAX documents, and score it directly if it has at most
+# SCORE_ALL_MAX members; otherwise run the threshold algorithm.
+INTERSECT_MAX = 10_000
+SCORE_ALL_MAX = 1_000
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[str, int]] = {}   # token -> {doc_id: tf}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}  # doc_id -> {token: tf}
+        self._doc_len: Dict[str, int] = {}
+        self._total_len = 0
+        self._vocab: List[str] = []                      # sorted, for prefix lookups
+
+        # token -> [(-impact, doc_id)] ascending, built on first query
+        self._impacts: Dict[str, List[Tuple[float, str]]] = {}
+        self._impact_avg_len = 0.0
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # Writes
+    # -----------------------------------------------------
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version of it."""
+        terms = Counter(tokenize(text))
+        length = sum(terms.values())
+        with self._lock:
+            self._remove(doc_id)
+            for token, tf in terms.items():
+                posting = self._postings.get(token)
+                if posting is None:
+                    posting = self._postings[token] = {}
+                    insort(self._vocab, token)
+                posting[doc_id] = tf
+                impacts = self._impacts.get(token)
+                if impacts is not None:
+                    insort(impacts, (-self._impact(tf, length), doc_id))
+            self._doc_terms[doc_id] = dict(terms)
+            self._doc_len[doc_id] = length
+            self._total_len += length
+
+    def remove(self, doc_id: str) -> bool:
+        with self._lock:
+            return self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> bool:
+        """Caller holds the lock."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        length = self._doc_len.pop(doc_id)
+        for token, tf in terms.items():
+            posting = self._postings[token]
+            del posting[doc_id]
+            impacts = self._impacts.get(token)
+            if impacts is not None:
+                del impacts[bisect_left(impacts, (-self._impact(tf, length), doc_id))]
+            if not posting:
+                del self._postings[token]
+                self._impacts.pop(token, None)
+                del self._vocab[bisect_left(self._vocab, token)]
+        self._total_len -= length
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_len.clear()
+            self._total_len = 0
+            self._vocab = []
+            self._impacts.clear()
+
+    # -----------------------------------------------------
+    # Scoring
+    # -----------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_len
+
+    def _idf(self, token: str) -> float:
+        n = len(self._doc_len)
+        df = len(self._postings[token])
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _impact(self, tf: int, length: int) -> float:
+        """BM25 term-frequency weight (no idf) against the frozen average length."""
+        norm = self.k1 * (1.0 - self.b + self.b * length / self._impact_avg_len)
+        return tf * (self.k1 + 1.0) / (tf + norm)
+
+    def _impact_list(self, token: str) -> List[Tuple[float, str]]:
+        impacts = self._impacts.get(token)
+        if impacts is None:
+            doc_len = self._doc_len
+            impacts = sorted(
+                (-self._impact(tf, doc_len[doc_id]), doc_id)
+                for doc_id, tf in self._postings[token].items()
+            )
+            self._impacts[token] = impacts
+        return impacts
+
+    def _refresh_impacts(self) -> None:
+        avg_len = max(1.0, self._total_len / len(self._doc_len))
+        frozen = self._impact_avg_len
+        if not frozen or abs(avg_len - frozen) > AVG_LEN_DRIFT * frozen:
+            self._impacts.clear()
+            self._impact_avg_len = avg_len
+
+    def _expand(self, term: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [term] if term in self._postings else []
+        start = bisect_left(self._vocab, term)
+        end = bisect_left(self._vocab, term + "\U0010ffff", start)
+        return self._vocab[start:end]
+
+    def _term_score(
+        self, doc_id: str, tokens: List[str], idf: Dict[str, float]
+    ) -> float:
+        """Best weight of any of `tokens` in the document (0.0 if none occurs)."""
+        terms = self._doc_terms[doc_id]
+        length = self._doc_len[doc_id]
+        if len(tokens) == 1:
+            tf = terms.get(tokens[0])
+            return idf[tokens[0]] * self._impact(tf, length) if tf else 0.0
+        best = 0.0
+        if len(tokens) > len(terms):
+            candidates = [t for t in terms if t in idf]
+        else:
+            candidates = [t for t in tokens if t in terms]
+        for token in candidates:
+            best = max(best, idf[token] * self._impact(terms[token], length))
+        return best
+
+    # -----------------------------------------------------
+    # Queries
+    # -----------------------------------------------------
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        prefix: bool = True,
+        match_all: bool = True,
+    ) -> List[Tuple[str, float]]:
+        """
+        (doc_id, BM25 score) for documents matching every query term, best
+        first. With match_all=False any term is enough (for recall over
+        natural-language queries).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or (limit is not None and limit <= 0):
+            return []
+
+        with self._lock:
+            expansions = [self._expand(term, prefix) for term in terms]
+            if not match_all:
+                expansions = [tokens for tokens in expansions if tokens]
+            if not expansions or not all(expansions) or not self._doc_len:
+                return []
+            self._refresh_impacts()
+            idfs = [
+                {token: self._idf(token) for token in tokens} for tokens in expansions
+            ]
+
+            if not match_all:
+                if (
+                    limit is None
+                    or sum(self._df(tokens) for tokens in expansions) <= SCORE_ALL_MAX
+                ):
+                    scored = self._score(self._union(expansions), expansions, idfs)
+                    return scored[:limit]
+                return self._top_k(expansions, idfs, limit, match_all=False)
+
+            if limit is None:
+                return self._score(self._intersect(expansions), expansions, idfs)
+
+            # Selective queries: the exact AND set is cheap, score it directly
+            matches = None
+            if len(expansions) > 1 or self._df(expansions[0]) <= SCORE_ALL_MAX:
+                matches = self._intersect(expansions, max_size=INTERSECT_MAX)
+            if matches is not None and len(matches) <= SCORE_ALL_MAX:
+                return self._score(matches, expansions, idfs)[:limit]
+            return self._top_k(expansions, idfs, limit, matches)
+
+    def _df(self, tokens: List[str]) -> int:
+        """Documents containing any of `tokens` (upper bound for prefix terms)."""
+        return sum(len(self._postings[token]) for token in tokens)
+
+    def _intersect(
+        self, expansions, max_size: Optional[int] = None
+    ) -> Optional[Set[str]]:
+        """
+        Documents containing every term. None if even the rarest term
+        occurs in more than max_size documents. Caller holds the lock.
+        """
+        sizes = [self._df(tokens) for tokens in expansions]
+        if max_size is not None and min(sizes) > max_size:
+            return None
+
+        matches: Optional[Set[str]] = None
+        for _, tokens in sorted(zip(sizes, expansions), key=lambda item: item[0]):
+            docs: Set[str] = set()
+            for token in tokens:
+                posting = self._postings[token]
+                docs.update(
+                    posting if matches is None else matches.intersection(posting)
+                )
+            matches = docs
+            if not matches:
+                break
+        return matches
+
+    def _union(self, expansions) -> Set[str]:
+        """Documents containing any term. Caller holds the lock."""
+        docs: Set[str] = set()
+        for tokens in expansions:
+            for token in tokens:
+                docs.update(self._postings[token])
+        return docs
+
+    def _score(self, matches: Set[str], expansions, idfs) -> List[Tuple[str, float]]:
+        """BM25 for each matching document, best first. Caller holds the lock."""
+        scored = [
+            (
+                doc_id,
+                sum(
+                    self._term_score(doc_id, tokens, idf)
+                    for tokens, idf in zip(expansions, idfs)
+                ),
+            )
+            for doc_id in matches
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
+
+    def _weights(self, token: str, idf: float) -> Iterator[Tuple[float, str]]:
+        for neg_impact, doc_id in self._impact_list(token):
+            yield -neg_impact * idf, doc_id
+
+    def _stream(
+        self, tokens: List[str], idf: Dict[str, float]
+    ) -> Iterator[Tuple[float, str]]:
+        """(weight, doc_id) over all expansions of one term, highest weight first."""
+        if len(tokens) == 1:
+            return self._weights(tokens[0], idf[tokens[0]])
+        streams = [self._weights(token, idf[token]) for token in tokens]
+        return heapq.merge(*streams, key=lambda item: item[0], reverse=True)
+
+    def _top_k(
+        self,
+        expansions,
+        idfs,
+        k: int,
+        matches: Optional[Set[str]] = None,
+        match_all: bool = True,
+    ) -> List[Tuple[str, float]]:
+        """
+        Threshold algorithm over impact-ordered lists. With `matches` (the
+        AND set, when known) other documents are skipped without scoring.
+        Caller holds the lock.
+        """
+        streams = [self._stream(tokens, idf) for tokens, idf in zip(expansions, idfs)]
+        frontier = [math.inf] * len(streams)   # last weight seen per term
+        active = list(range(len(streams)))
+        seen: Set[str] = set()
+        heap: List[Tuple[float, str]] = []     # min-heap of (score, doc_id)
+
+        while active:
+            for i in tuple(active):
+                item = next(streams[i], None)
+                if item is None:
+                    if match_all:
+                        # Every document containing term i has been seen
+                        return self._ranked(heap)
+                    frontier[i] = 0.0
+                    active.remove(i)
+                    continue
+                weight, doc_id = item
+                frontier[i] = weight
+                if doc_id in seen or (matches is not None and doc_id not in matches):
+                    continue
+                seen.add(doc_id)
+
+                score = 0.0
+                for tokens, idf in zip(expansions, idfs):
+                    term_score = self._term_score(doc_id, tokens, idf)
+                    if not term_score and match_all:
+                        break
+                    score += term_score
+                else:
+                    if len(heap) < k:
+                        heapq.heappush(heap, (score, doc_id))
+                    elif score > heap[0][0]:
+                        heapq.heapreplace(heap, (score, doc_id))
+
+            if len(heap) == k and heap[0][0] >= sum(frontier):
+                return self._ranked(heap)
+            if matches is not None and len(seen) == len(matches):
+                return self._ranked(heap)
+        return self._ranked(heap)
+
+    @staticmethod
+    def _ranked(heap: List[Tuple[float, str]]) -> List[Tuple[str, float]]:
+        return [(doc_id, score) for score, doc_id in sorted(heap, reverse=True)]
+
+    # -----------------------------------------------------
+    # Footprint
+    # -----------------------------------------------------
+    def stats(self) -> Dict[str, int]:
+        """Sizes of the index structures; `bytes` is a shallow estimate."""
+        with self._lock:
+            postings = sum(len(p) for p in self._postings.values())
+            size = (
+                sys.getsizeof(self._postings)
+                + sys.getsizeof(self._doc_terms)
+                + sys.getsizeof(self._doc_len)
+                + sys.getsizeof(self._vocab)
+                + sys.getsizeof(self._impacts)
+                + sum(sys.getsizeof(t) for t in self._postings)
+                + sum(sys.getsizeof(p) for p in self._postings.values())
+                + sum(sys.getsizeof(t) for t in self._doc_terms.values())
+                + sum(sys.getsizeof(i) + 64 * len(i) for i in self._impacts.values())
+            )
+            return {
+                "documents": len(self._doc_len),
+                "terms": len(self._postings),
+                "postings": postings,
+                "cached_impact_lists": len(self._impacts),
+                "bytes": size,
+            }
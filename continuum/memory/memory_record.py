@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Any, Dict
 
 @dataclass
@@ -6,4 +7,5 @@ class MemoryRecord:
     """A single stored memory item."""
     key: str
     value: Any
-    metadata: Dict[str, Any]
\ No newline at end of file
+    metadata: Dict[str, Any]
+    ts: float = field(default_factory=time.time)
\ No newline at end of file
@@ -1,27 +1,76 @@
 """
 Simple in‑memory storage backend for The Continuum.
 This keeps memory logic decoupled from storage implementation.
+
+Episodes are EpisodeRecords in a fixed-capacity RingBuffer: the oldest
+are dropped once CONTINUUM_EPISODE_CAPACITY (default 10000) is reached.
 """
 
 from __future__ import annotations
+import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List
+
+from continuum.memory.ring_buffer import EpisodeRecord, RingBuffer, RingView
+
+EPISODE_CAPACITY = int(os.getenv("CONTINUUM_EPISODE_CAPACITY", 10_000))
 
 
 @dataclass
 class MemoryStore:
     """A lightweight key‑value store for episodic and semantic memory."""
-    episodic: List[Dict[str, Any]] = field(default_factory=list)
+    episodic: RingBuffer[EpisodeRecord] = field(
+        default_factory=lambda: RingBuffer(EPISODE_CAPACITY)
+    )
     semantic: Dict[str, Any] = field(default_factory=dict)
+    # Bumped on every write, so readers can tell whether anything changed
+    version: int = 0
+
+    @property
+    def episodes_added(self) -> int:
+        """Episodes ever added; len(episodic) stops counting once old ones drop."""
+        return self.episodic.appended
 
     def add_episode(self, data: Dict[str, Any]) -> None:
-        self.episodic.append(data)
+        self.episodic.append(EpisodeRecord.from_dict(data))
+        self.version += 1
+
+    def remove_episodes(
+        self, keep: Callable[[EpisodeRecord], bool]
+    ) -> List[EpisodeRecord]:
+        """Drop the episodes keep() rejects; returns them."""
+        dropped = self.episodic.retain(keep)
+        if dropped:
+            self.version += 1
+        return dropped
 
     def add_semantic(self, key: str, value: Any) -> None:
         self.semantic[key] = value
+        self.version += 1
 
     def get_semantic(self, key: str) -> Any:
         return self.semantic.get(key)
 
-    def recent_episodes(self, limit: int = 5) -> List[Dict[str, Any]]:
-        return self.episodic[-limit:]
\ No newline at end of file
+    def recent_episodes(self, limit: int = 5) -> RingView[EpisodeRecord]:
+        """The newest `limit` episodes, oldest first (a view, not a copy)."""
+        return self.episodic.last(limit)
+
+    def export_state(self) -> Dict[str, Any]:
+        """Episodes, facts and counters as plain lists/dicts (for snapshots)."""
+        return {
+            "episodes": [
+                [e.content, e.metadata, e.ts, e.episode_id] for e in self.episodic
+            ],
+            "episodes_added": self.episodes_added,
+            "semantic": dict(self.semantic),
+            "version": self.version,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.episodic.load(
+            (EpisodeRecord(*values) for values in state["episodes"]),
+            state["episodes_added"],
+        )
+        self.semantic.clear()
+        self.semantic.update(state["semantic"])
+        self.version = state["version"]
@@ -1,137 +1,340 @@
+# continuum/memory/mysql_backend.py
 """
 MySQL-backed memory store for The Continuum.
 This is a drop-in replacement for MemoryStore, providing
 persistent episodic and semantic memory using MySQL.
 
-This is a stub: the structure is complete, and the queries
-are ready, but you can expand it with indexing, embeddings,
-or retrieval logic later.
+Episodes are write-buffered: add_episode() only appends to an in-process
+buffer, which is written as one multi-row INSERT when it reaches
+flush_size rows, every flush_interval seconds (background flusher), on
+read (recent_episodes), and at close()/interpreter exit. Each episode is
+stamped when it is added, not when it is flushed.
+
+Tables are declared with SQLAlchemy Core, so the same backend runs on
+SQLite (CONTINUUM_DB_URL=sqlite:///...) for offline runs and benchmarks.
+JSON columns round-trip Python values (dicts, lists, strings, numbers).
+
+Environment:
+    CONTINUUM_MEMORY_FLUSH_SIZE       rows per multi-row INSERT (default 100)
+    CONTINUUM_MEMORY_FLUSH_INTERVAL   seconds between background flushes (default 1.0)
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Dict, List, Optional
-import mysql.connector
-from mysql.connector import Error
+
+from sqlalchemy import (
+    JSON, Column, DateTime, Index, Integer, MetaData, String, Table, Text,
+    inspect, select, update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from continuum.core.logger import log_debug, log_error
+from continuum.db.sqlalchemy_connection import get_engine
+
+FLUSH_SIZE = int(os.getenv("CONTINUUM_MEMORY_FLUSH_SIZE", 100))
+FLUSH_INTERVAL = float(os.getenv("CONTINUUM_MEMORY_FLUSH_INTERVAL", 1.0))
+MAX_PENDING_FLUSHES = 50     # keep at most this many failed batches buffered
+
+# ---------------------------------------------------------
+# Schema
+# ---------------------------------------------------------
+metadata = MetaData()
+
+episodic_memory = Table(
+    "episodic_memory",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("content", Text, nullable=False),
+    Column("metadata", JSON),
+    Column("timestamp", DateTime, nullable=False, default=datetime.utcnow),
+    # recent_episodes() walks this index backwards instead of sorting the table
+    Index("ix_episodic_memory_ts", "timestamp", "id"),
+)
+
+semantic_memory = Table(
+    "semantic_memory",
+    metadata,
+    Column("mem_key", String(255), primary_key=True),
+    Column("mem_value", JSON, nullable=False),
+    Column(
+        "updated",
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    ),
+)
 
 
 @dataclass
 class MySQLMemoryBackend:
-    host: str
-    port: int
-    user: str
-    password: str
-    database: str
+    """
+    Runs on the process-wide pooled engine: each call checks a
+    connection out for the duration of one statement (or one batch)
+    and returns it.
+    """
 
-    conn: Optional[mysql.connector.connection.MySQLConnection] = None
+    engine: Optional[Engine] = None
+    flush_size: int = FLUSH_SIZE
+    flush_interval: float = FLUSH_INTERVAL
 
-    def connect(self) -> None:
-        """Establish a MySQL connection if not already connected."""
-        if self.conn and self.conn.is_connected():
-            return
+    _buffer: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _buffer_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _flush_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _flusher: Optional["EpisodeFlusher"] = field(default=None, init=False, repr=False)
 
-        try:
-            self.conn = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                autocommit=True,
-            )
-        except Error as e:
-            print(f"[MySQLMemoryBackend] Connection error: {e}")
-            self.conn = None
+    def __post_init__(self):
+        atexit.register(self.close)
+
+    def connect(self) -> Optional[Engine]:
+        """Bind to the shared engine if not already bound."""
+        if self.engine is None:
+            try:
+                self.engine = get_engine()
+            except SQLAlchemyError as e:
+                log_error(f"[MySQLMemoryBackend] Connection error: {e}", phase="memory")
+        return self.engine
 
     def ensure_schema(self) -> None:
-        """Create tables if they do not exist."""
-        self.connect()
-        if not self.conn:
+        """Create tables and indexes if they do not exist."""
+        if not self.connect():
             return
+        metadata.create_all(self.engine, checkfirst=True)
 
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS episodic_memory (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                content TEXT NOT NULL,
-                metadata JSON,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS semantic_memory (
-                mem_key VARCHAR(255) PRIMARY KEY,
-                mem_value JSON NOT NULL,
-                updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    ON UPDATE CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.close()
+        # Tables created before the timestamp index existed
+        existing = {
+            ix["name"] for ix in inspect(self.engine).get_indexes(episodic_memory.name)
+        }
+        for index in episodic_memory.indexes:
+            if index.name not in existing:
+                index.create(bind=self.engine)
+                log_debug(
+                    f"[MySQLMemoryBackend] Created index {index.name}", phase="memory"
+                )
 
     # -----------------------------
     # Episodic Memory
     # -----------------------------
 
     def add_episode(self, data: Dict[str, Any]) -> None:
-        self.connect()
-        if not self.conn:
+        """Buffer an episode; it is written with the next batch."""
+        row = {
+            "content": data.get("content", ""),
+            "metadata": data.get("metadata") or {},
+            "timestamp": datetime.utcnow(),
+        }
+        with self._buffer_lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.flush_size
+        self._start_flusher()
+        if full:
+            self.flush()
+
+    def pending(self) -> int:
+        """Episodes buffered but not yet written."""
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """
+        Write all buffered episodes as multi-row INSERTs in one
+        transaction. Returns the number written. On failure the rows go
+        back to the front of the buffer for the next attempt.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            if not self.connect():
+                self._requeue(rows)
+                return 0
+
+            start = time.perf_counter()
+            try:
+                with self.engine.begin() as conn:
+                    for i in range(0, len(rows), self.flush_size):
+                        conn.execute(
+                            episodic_memory.insert(), rows[i:i + self.flush_size]
+                        )
+            except SQLAlchemyError as e:
+                log_error(
+                    f"[MySQLMemoryBackend] Flush of {len(rows)} episodes failed: {e}",
+                    phase="memory",
+                )
+                self._requeue(rows)
+                return 0
+
+            log_debug(
+                "[MySQLMemoryBackend] Flushed %d episodes in %.1f ms",
+                len(rows), (time.perf_counter() - start) * 1000.0,
+                phase="memory",
+            )
+            return len(rows)
+
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        limit = self.flush_size * MAX_PENDING_FLUSHES
+        with self._buffer_lock:
+            self._buffer[:0] = rows
+            overflow = len(self._buffer) - limit
+            if overflow > 0:
+                del self._buffer[:overflow]
+        if overflow > 0:
+            log_error(
+                f"[MySQLMemoryBackend] Buffer full, dropped {overflow} oldest episodes",
+                phase="memory",
+            )
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None or self.flush_interval <= 0:
             return
+        with self._buffer_lock:
+            if self._flusher is None:
+                self._flusher = EpisodeFlusher(self, self.flush_interval)
+                self._flusher.start()
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO episodic_memory (content, metadata) VALUES (%s, %s)",
-            (data.get("content", ""), str(data.get("metadata", {}))),
-        )
-        cursor.close()
+    def close(self) -> None:
+        """Stop the background flusher and write what is still buffered."""
+        if self._flusher is not None:
+            self._flusher.stop()
+            self._flusher = None
+        self.flush()
 
     def recent_episodes(self, limit: int = 5) -> List[Dict[str, Any]]:
-        self.connect()
-        if not self.conn:
+        self.flush()
+        if not self.connect():
             return []
-
-        cursor = self.conn.cursor(dictionary=True)
-        cursor.execute(
-            "SELECT content, metadata, timestamp FROM episodic_memory "
-            "ORDER BY timestamp DESC LIMIT %s",
-            (limit,),
+        query = (
+            select(
+                episodic_memory.c.content,
+                episodic_memory.c.metadata,
+                episodic_memory.c.timestamp,
+            )
+            .order_by(episodic_memory.c.timestamp.desc(), episodic_memory.c.id.desc())
+            .limit(limit)
         )
-        rows = cursor.fetchall()
-        cursor.close()
-        return rows
+        with self.engine.connect() as conn:
+            return [dict(r) for r in conn.execute(query).mappings()]
 
     # -----------------------------
     # Semantic Memory
     # -----------------------------
 
     def add_semantic(self, key: str, value: Any) -> None:
-        self.connect()
-        if not self.conn:
+        if not self.connect():
             return
+        now = datetime.utcnow()
+        dialect = self.engine.dialect.name
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO semantic_memory (mem_key, mem_value)
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE mem_value = VALUES(mem_value)
-            """,
-            (key, str(value)),
-        )
-        cursor.close()
+        with self.engine.begin() as conn:
+            if dialect in ("mysql", "mariadb"):
+                stmt = mysql_insert(semantic_memory).values(
+                    mem_key=key, mem_value=value, updated=now
+                )
+                conn.execute(
+                    stmt.on_duplicate_key_update(
+                        mem_value=stmt.inserted.mem_value, updated=now
+                    )
+                )
+            elif dialect in ("sqlite", "postgresql"):
+                insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+                stmt = insert(semantic_memory).values(
+                    mem_key=key, mem_value=value, updated=now
+                )
+                conn.execute(stmt.on_conflict_do_update(
+                    index_elements=[semantic_memory.c.mem_key],
+                    set_={"mem_value": stmt.excluded.mem_value, "updated": now},
+                ))
+            else:
+                result = conn.execute(
+                    update(semantic_memory)
+                    .where(semantic_memory.c.mem_key == key)
+                    .values(mem_value=value, updated=now)
+                )
+                if result.rowcount == 0:
+                    conn.execute(
+                        semantic_memory.insert().values(
+                            mem_key=key, mem_value=value, updated=now
+                        )
+                    )
 
     def get_semantic(self, key: str) -> Any:
-        self.connect()
-        if not self.conn:
+        if not self.connect():
             return None
-
-        cursor = self.conn.cursor(dictionary=True)
-        cursor.execute(
-            "SELECT mem_value FROM semantic_memory WHERE mem_key = %s",
-            (key,),
+        query = select(semantic_memory.c.mem_value).where(
+            semantic_memory.c.mem_key == key
         )
-        row = cursor.fetchone()
-        cursor.close()
-        return row["mem_value"] if row else None
\ No newline at end of file
+        with self.engine.connect() as conn:
+            return conn.execute(query).scalar_one_or_none()
+
+
+class EpisodeFlusher(threading.Thread):
+    """Background thread that flushes a backend's episode buffer every interval."""
+
+    def __init__(self, backend: MySQLMemoryBackend, interval_seconds: float):
+        super().__init__(daemon=True, name="episode-flusher")
+        self.backend = backend
+        self.interval = interval_seconds
+        self.running = True
+        self._wake = threading.Event()
+
+    def run(self):
+        while self.running:
+            self._wake.wait(self.interval)
+            if self.backend.pending():
+                self.backend.flush()
+
+    def stop(self):
+        self.running = False
+        self._wake.set()
+
+
+# ---------------------------------------------------------
+# Async variant
+# ---------------------------------------------------------
+class AsyncMySQLMemoryBackend:
+    """
+    asyncio front end for MySQLMemoryBackend. Every call runs on a
+    worker thread (asyncio.to_thread), so the event loop never blocks on
+    the database; the buffering and the pool are the sync backend's.
+    """
+
+    def __init__(self, backend: Optional[MySQLMemoryBackend] = None):
+        self.backend = backend or MySQLMemoryBackend()
+
+    async def ensure_schema(self) -> None:
+        await asyncio.to_thread(self.backend.ensure_schema)
+
+    async def add_episode(self, data: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self.backend.add_episode, data)
+
+    async def flush(self) -> int:
+        return await asyncio.to_thread(self.backend.flush)
+
+    async def recent_episodes(self, limit: int = 5) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.backend.recent_episodes, limit)
+
+    async def add_semantic(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.backend.add_semantic, key, value)
+
+    async def get_semantic(self, key: str) -> Any:
+        return await asyncio.to_thread(self.backend.get_semantic, key)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.backend.close)
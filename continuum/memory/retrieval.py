@@ -0,0 +1,307 @@
+# continuum/memory/retrieval.py
+
+"""
+Hybrid memory recall over episodic and semantic memory.
+
+    retriever = MemoryRetriever(embed_fn=embed)
+    retriever.add_episode(turn_id, "I adopted a dog named Rex last week")
+    retriever.add_fact("pet", "dog named Rex")
+    retriever.retrieve("how is my dog doing?", k=5)    # -> [MemoryHit, ...]
+    retriever.summary("how is my dog doing?")           # prompt-ready lines
+
+Two rankers each return their top `candidates` memories: BM25 over an
+InvertedIndex (any non-stopword query word may match) and cosine
+similarity over a VectorIndex of embeddings. They are fused with
+reciprocal rank fusion,
+
+    score(d) = sum over rankers of  weight / (rrf_k + rank(d))
+
+and each episodic memory's score is then scaled by its recency,
+
+    floor + (1 - floor) * 0.5 ** (age / half_life)
+
+so recent episodes win ties while an old but strongly matching one can
+still be recalled. Semantic facts don't decay.
+
+Results are cached per turn: within one turn (trace id) the Senate
+actors, the Jury and Aira all ask for the same summary, and only the
+first call runs the rankers. Adding a memory invalidates the cache.
+Without embeddings (no embed_fn, or the model fails to load) recall is
+lexical only. Pass vectors=VectorIndex.open(path, dim) to keep the
+embeddings in an on-disk EmbeddingStore instead of RAM (controller_init
+does this when CONTINUUM_EMBEDDING_DIR is set). Only the vectors are on
+disk: memory texts and the BM25 index live in RAM and come back from a
+conversation snapshot, which reuses the stored vectors
+(add(..., reuse_vector=True)) rather than embedding again.
+
+Environment:
+    CONTINUUM_RECALL_HALF_LIFE_H   episodic half-life in hours (default 72)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from continuum.core.logger import log_debug, log_error
+from continuum.core.tracing import span
+from continuum.memory.inverted_index import InvertedIndex, tokenize
+from continuum.memory.vector_index import VectorIndex
+from continuum.monitoring.metrics import CACHE_REQUESTS_TOTAL
+
+EPISODIC = "episodic"
+SEMANTIC = "semantic"
+
+RRF_K = 60                 # the usual RRF constant; damps the head of each ranking
+CANDIDATES = 50            # per ranker
+MIN_SIMILARITY = 0.25      # vector hits below this are noise, not recall
+HALF_LIFE_H = float(os.getenv("CONTINUUM_RECALL_HALF_LIFE_H", 72))
+RECENCY_FLOOR = 0.3
+SUMMARY_LINE_CHARS = 300
+
+# Function words carry no recall signal but would match nearly every
+# episode once the lexical ranker accepts any query word
+STOPWORDS = frozenset(
+    "a an and are as at be but by can could did do does doing for from had has have "
+    "he her him his how i if in into is it its just me my of on or our she so that "
+    "the their them then there these they this to us was we were what when where "
+    "which who why will with would you your".split()
+)
+
+
+@dataclass
+class MemoryHit:
+    doc_id: str
+    source: str                       # EPISODIC | SEMANTIC
+    text: str
+    score: float
+    ts: float
+    lexical_rank: Optional[int] = None
+    vector_rank: Optional[int] = None
+
+
+class MemoryRetriever:
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        rrf_k: int = RRF_K,
+        lexical_weight: float = 1.0,
+        vector_weight: float = 1.0,
+        candidates: int = CANDIDATES,
+        half_life_h: float = HALF_LIFE_H,
+        recency_floor: float = RECENCY_FLOOR,
+        cache_size: int = 32,
+        vectors: Optional[VectorIndex] = None,
+    ):
+        self.embed_fn = embed_fn
+        self.rrf_k = rrf_k
+        self.lexical_weight = lexical_weight
+        self.vector_weight = vector_weight
+        self.candidates = candidates
+        self.half_life_s = half_life_h * 3600.0
+        self.recency_floor = recency_floor
+
+        self.lexical = InvertedIndex()
+        self.vectors = vectors
+        # doc_id -> (source, text, ts)
+        self._docs: Dict[str, Tuple[str, str, float]] = {}
+
+        self._cache: "OrderedDict[Tuple[str, int], List[MemoryHit]]" = OrderedDict()
+        self._cache_turn: Optional[str] = None
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # Writes
+    # -----------------------------------------------------
+    def _embed(self, text: str) -> Optional[Sequence[float]]:
+        if self.embed_fn is None:
+            return None
+        try:
+            return self.embed_fn(text)
+        except Exception as e:
+            # Missing model/package: keep recalling lexically
+            log_error(
+                f"[RECALL] Embedding failed, continuing lexical-only: {e}",
+                phase="memory",
+            )
+            self.embed_fn = None
+            return None
+
+    def add(
+        self,
+        doc_id: str,
+        text: str,
+        source: str,
+        ts: Optional[float] = None,
+        vector: Optional[Sequence[float]] = None,
+        reuse_vector: bool = False,
+    ) -> None:
+        """
+        Index a memory (replacing any previous one with the same id).
+        With reuse_vector, a vector the index already holds for doc_id is
+        kept instead of embedding the text again (an on-disk index that
+        outlived the process).
+        """
+        self.lexical.add(doc_id, text)
+        if not (reuse_vector and self.vectors is not None and doc_id in self.vectors):
+            if vector is None:
+                vector = self._embed(text)
+            if vector is not None:
+                if self.vectors is None:
+                    self.vectors = VectorIndex(dim=len(vector))
+                self.vectors.add(doc_id, vector)
+
+        with self._lock:
+            self._docs[doc_id] = (source, text, time.time() if ts is None else ts)
+            self._cache.clear()
+
+    def add_episode(
+        self,
+        episode_id: str,
+        text: str,
+        ts: Optional[float] = None,
+        vector=None,
+        reuse_vector: bool = False,
+    ) -> None:
+        self.add(f"episode:{episode_id}", text, EPISODIC, ts, vector, reuse_vector)
+
+    def add_fact(
+        self, key: str, value, ts: Optional[float] = None, vector=None
+    ) -> None:
+        self.add(f"fact:{key}", f"{key}: {value}", SEMANTIC, ts, vector)
+
+    def remove(self, doc_id: str) -> bool:
+        self.lexical.remove(doc_id)
+        if self.vectors is not None:
+            self.vectors.remove(doc_id)
+        with self._lock:
+            self._cache.clear()
+            return self._docs.pop(doc_id, None) is not None
+
+    def clear(self) -> None:
+        """Forget every memory (the indexes are emptied in place)."""
+        with self._lock:
+            doc_ids = list(self._docs)
+        for doc_id in doc_ids:
+            self.remove(doc_id)
+
+    def prune_vectors(self) -> int:
+        """Drop vectors with no memory behind them; returns how many."""
+        if self.vectors is None:
+            return 0
+        with self._lock:
+            stale = [d for d in self.vectors.ids() if d not in self._docs]
+        for doc_id in stale:
+            self.vectors.remove(doc_id)
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # -----------------------------------------------------
+    # Recall
+    # -----------------------------------------------------
+    def _recency(self, source: str, age_s: float) -> float:
+        if source != EPISODIC or self.half_life_s <= 0:
+            return 1.0
+        decay = 0.5 ** (max(0.0, age_s) / self.half_life_s)
+        return self.recency_floor + (1.0 - self.recency_floor) * decay
+
+    def _rank(self, query: str, k: int) -> List[MemoryHit]:
+        terms = " ".join(t for t in tokenize(query) if t not in STOPWORDS)
+        lexical = self.lexical.search(
+            terms, limit=self.candidates, prefix=False, match_all=False
+        )
+
+        vector: List[Tuple[str, float]] = []
+        if self.vectors is not None and len(self.vectors):
+            query_vector = self._embed(query)
+            if query_vector is not None:
+                vector = [
+                    (doc_id, sim)
+                    for doc_id, sim in self.vectors.search(
+                        query_vector, self.candidates
+                    )
+                    if sim >= MIN_SIMILARITY
+                ]
+
+        fused: Dict[str, float] = {}
+        ranks: Dict[str, List[Optional[int]]] = {}
+        for slot, (weight, ranking) in enumerate(
+            ((self.lexical_weight, lexical), (self.vector_weight, vector))
+        ):
+            for rank, (doc_id, _) in enumerate(ranking, start=1):
+                fused[doc_id] = fused.get(doc_id, 0.0) + weight / (self.rrf_k + rank)
+                ranks.setdefault(doc_id, [None, None])[slot] = rank
+
+        now = time.time()
+        hits: List[MemoryHit] = []
+        for doc_id, score in fused.items():
+            doc = self._docs.get(doc_id)
+            if doc is None:
+                continue
+            source, text, ts = doc
+            hits.append(MemoryHit(
+                doc_id=doc_id,
+                source=source,
+                text=text,
+                score=score * self._recency(source, now - ts),
+                ts=ts,
+                lexical_rank=ranks[doc_id][0],
+                vector_rank=ranks[doc_id][1],
+            ))
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits[:k]
+
+    def retrieve(
+        self, query: str, k: int = 5, turn_id: Optional[str] = None
+    ) -> List[MemoryHit]:
+        """Top-k memories for `query`; cached for the rest of turn `turn_id`."""
+        if not query or not self._docs or k <= 0:
+            return []
+
+        key = (query, k)
+        with self._lock:
+            if turn_id != self._cache_turn:
+                self._cache.clear()
+                self._cache_turn = turn_id
+            cached = self._cache.get(key) if turn_id is not None else None
+        if cached is not None:
+            CACHE_REQUESTS_TOTAL.labels(cache="recall", result="hit").inc()
+            return list(cached)
+        CACHE_REQUESTS_TOTAL.labels(cache="recall", result="miss").inc()
+
+        with span("memory.recall", k=k, memories=len(self._docs)) as sp:
+            hits = self._rank(query, k)
+            sp.set(hits=len(hits))
+
+        if turn_id is not None:
+            with self._lock:
+                if turn_id == self._cache_turn:
+                    self._cache[key] = hits
+                    if len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+
+        log_debug(
+            "[RECALL] %d hits for %r: %s",
+            len(hits), query[:60], [(h.doc_id, round(h.score, 4)) for h in hits],
+            phase="memory",
+        )
+        return list(hits)
+
+    def summary(self, query: str, k: int = 5, turn_id: Optional[str] = None) -> str:
+        """Recalled memories as prompt lines, most relevant first."""
+        lines = []
+        for hit in self.retrieve(query, k, turn_id):
+            text = " ".join(hit.text.split())
+            if len(text) > SUMMARY_LINE_CHARS:
+                text = text[:SUMMARY_LINE_CHARS] + "…"
+            lines.append(
+                f"- Earlier, the user said: {text}"
+                if hit.source == EPISODIC
+                else f"- {text}"
+            )
+        return "\n".join(lines)
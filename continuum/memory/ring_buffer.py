@@ -0,0 +1,221 @@
+# continuum/memory/ring_buffer.py
+
+"""
+Fixed-capacity ring buffer for memory records.
+
+    events = RingBuffer(capacity=200)
+    events.append(event)          # O(1); returns the evicted record once full
+    events.last(5)                # view of the 5 newest, oldest first (no copy)
+    events[-1], events[:3]        # indexing and slicing like a list
+
+The buffer is one list plus a head index. The list grows up to capacity
+(an empty buffer costs nothing per slot, so idle sessions stay small);
+after that, appending overwrites the oldest slot instead of shifting
+every element (list.pop(0) is O(n)).
+
+Views (last(), slices) are live windows onto absolute positions, not
+copies. If a later append evicts a record a view still covers, reading
+it raises IndexError. Call list(view) to keep a snapshot. retain()
+(used by memory compaction) closes up the gaps it leaves, so views taken
+before it may no longer line up.
+
+Records are __slots__ dataclasses (EpisodeRecord here, EmotionalEvent
+in persona.emotional_memory). That saves a per-instance __dict__
+compared with plain dicts or regular dataclasses; see
+bench/bench_ring_buffer.py.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------
+# Records
+# ---------------------------------------------------------
+@dataclass(slots=True)
+class EpisodeRecord:
+    """One episodic memory: what the user said, and when."""
+    content: str
+    # None rather than an empty dict per record
+    metadata: Optional[Dict[str, Any]] = None
+    ts: float = 0.0
+    episode_id: Optional[str] = None              # the retriever's "episode:<id>"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EpisodeRecord":
+        return cls(
+            content=data.get("content", ""),
+            metadata=data.get("metadata") or None,
+            ts=data.get("ts") or time.time(),
+            episode_id=data.get("episode_id"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ---------------------------------------------------------
+# Buffer
+# ---------------------------------------------------------
+class RingBuffer(Generic[T]):
+    __slots__ = ("capacity", "_items", "_head", "_len", "_appended", "_lock")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self._items: List[Optional[T]] = []
+        self._head = 0            # slot of the oldest record (0 until full)
+        self._len = 0
+        self._appended = 0  # records ever appended; absolute position of the next one
+        self._lock = threading.Lock()
+
+    def append(self, item: T) -> Optional[T]:
+        """Add an item; returns the item it evicted, if the buffer was full."""
+        with self._lock:
+            evicted = None
+            if self._len < self.capacity:
+                self._items.append(item)
+                self._len += 1
+            else:
+                evicted = self._items[self._head]
+                self._items[self._head] = item
+                self._head = (self._head + 1) % self.capacity
+            self._appended += 1
+            return evicted
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.append(item)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items = []
+            self._head = 0
+            self._len = 0
+
+    def load(self, items, appended: int) -> None:
+        """
+        Replace the contents with `items` (oldest first; only the newest
+        `capacity` are kept) as if `appended` items had ever been added.
+        For restoring a saved buffer with its absolute positions.
+        """
+        items = list(items)[-self.capacity:]
+        with self._lock:
+            self._items = items
+            self._head = 0
+            self._len = len(items)
+            self._appended = max(appended, len(items))
+
+    def retain(self, keep: Callable[[T], bool]) -> List[T]:
+        """
+        Drop every item for which keep(item) is false, preserving order;
+        returns the dropped items. O(n), for background compaction.
+        """
+        with self._lock:
+            kept: List[Optional[T]] = []
+            dropped: List[T] = []
+            for item in self:
+                (kept if keep(item) else dropped).append(item)
+            if dropped:
+                self._len = len(kept)
+                self._items = kept
+                self._head = 0
+            return dropped
+
+    @property
+    def appended(self) -> int:
+        """Items ever appended, including evicted ones."""
+        return self._appended
+
+    @property
+    def first(self) -> int:
+        """Absolute position of the oldest held item."""
+        return self._appended - self._len
+
+    def at(self, position: int) -> T:
+        """Item at an absolute position (see `first`/`appended`)."""
+        offset = position - self.first
+        if offset < 0 or offset >= self._len:
+            raise IndexError(f"position {position} is not in the buffer")
+        return self._items[(self._head + offset) % self.capacity]
+
+    def last(self, k: int) -> "RingView[T]":
+        """View of up to k newest items, oldest first."""
+        if k > self._len:
+            k = self._len
+        elif k < 0:
+            k = 0
+        return RingView(self, self._appended - k, self._appended)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        items, head, capacity = self._items, self._head, self.capacity
+        for i in range(self._len):
+            yield items[(head + i) % capacity]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "RingView[T]"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            return RingView(self, self.first + start, self.first + max(start, stop))
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError("ring buffer index out of range")
+        return self._items[(self._head + index) % self.capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(len={self._len}, capacity={self.capacity})"
+
+
+class RingView(Generic[T]):
+    """A window [lo, hi) of absolute positions in a RingBuffer."""
+
+    __slots__ = ("_ring", "_lo", "_hi")
+
+    def __init__(self, ring: RingBuffer[T], lo: int, hi: int):
+        self._ring = ring
+        self._lo = lo
+        self._hi = hi
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(self._lo, self._hi):
+            yield self._ring.at(position)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [
+                self._ring.at(self._lo + i) for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("view index out of range")
+        return self._ring.at(self._lo + index)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"RingView({list(self)!r})"
@@ -2,34 +2,87 @@
 """
 Semantic memory: stores stable facts about the user or system.
 Examples: preferences, long‑term goals, known facts.
+
+Each fact is embedded as "key: value" and indexed in a VectorIndex, so
+search(query, k) returns the facts closest in meaning to the query.
+The embedding model is loaded on first use. Pass
+index=VectorIndex.open(path, dim) to keep the embeddings on disk.
 """
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from continuum.memory.memory_store import MemoryStore
-from sentence_transformers import SentenceTransformer
-import os
+from continuum.memory.vector_index import VectorIndex
 
 # Use the fully-qualified, stable model name
-_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Output size of EMBEDDING_MODEL; on-disk indexes are created with it
+EMBEDDING_DIM = int(os.getenv("CONTINUUM_EMBEDDING_DIM", 384))
+
+_model = None
+
+
+def _get_model():
+    global _model
+    if _model is None:
+        from sentence_transformers import SentenceTransformer
+
+        _model = SentenceTransformer(EMBEDDING_MODEL)
+    return _model
+
 
 def embed(text: str):
-    emb = _model.encode(text)
+    emb = _get_model().encode(text)
     return emb.tolist()
 
+
 @dataclass
 class SemanticMemory:
     store: MemoryStore
+    embed_fn: Callable[[str], Sequence[float]] = embed
+    index: Optional[VectorIndex] = field(default=None, repr=False)
+    # Optional memory.retrieval.MemoryRetriever; facts become recallable
+    retriever: Any = field(default=None, repr=False)
 
     def set(self, key: str, value: Any) -> None:
         """Store or update a semantic fact."""
         self.store.add_semantic(key, value)
+        self._index(key, value)
+
+    def _index(self, key: str, value: Any) -> None:
+        vector = self.embed_fn(f"{key}: {value}")
+        if self.index is None:
+            self.index = VectorIndex(dim=len(vector))
+        self.index.add(key, vector)
+        if self.retriever is not None:
+            self.retriever.add_fact(key, value, vector=vector)
+
+    def reindex(self) -> None:
+        """Embed every fact in the store again, e.g. after it was restored."""
+        facts = dict(self.store.semantic)
+        if self.index is not None:
+            for key in self.index.ids():
+                if key not in facts:
+                    self.index.remove(key)
+        for key, value in facts.items():
+            self._index(key, value)
 
     def get(self, key: str) -> Any:
         """Retrieve a semantic fact."""
         return self.store.get_semantic(key)
 
+    def __len__(self) -> int:
+        return len(self.index) if self.index is not None else 0
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, Any, float]]:
+        """Top-k facts as (key, value, similarity), most similar first."""
+        if not query or not len(self):
+            return []
+        hits = self.index.search(self.embed_fn(query), k)
+        return [(key, self.store.get_semantic(key), score) for key, score in hits]
+
     def merge_into_context(self, context) -> None:
         """Inject semantic memory into the context snapshot."""
-        context.memory_snapshot.update(self.store.semantic)
\ No newline at end of file
+        context.memory_snapshot.update(self.store.semantic)
@@ -0,0 +1,146 @@
+# continuum/memory/summarizer.py
+
+"""
+Rolling memory summary, maintained incrementally.
+
+    summarizer = MemorySummarizer(store)
+    summarizer.summary()     # folds in episodes added since the last call
+
+The summarizer keeps a checkpoint (how many episodes it has folded in)
+and the last summary, stamped with the store's version. A call while
+the store is unchanged returns the cached text, so the Senate actors,
+the Jury and Aira all share one summary per turn. After a change, only
+the episodes added since the checkpoint are passed to the fold
+function, along with the previous summary:
+
+    fold_fn(previous_summary, new_episodes) -> summary
+
+The default fold is extractive and needs no model: it keeps running
+topic counts and the last few episodes. An LLM-backed fold_fn can be
+plugged in without changing the caching.
+"""
+
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from continuum.core.logger import log_debug
+from continuum.core.tracing import span
+from continuum.memory.inverted_index import tokenize
+from continuum.memory.retrieval import STOPWORDS
+from continuum.memory.ring_buffer import EpisodeRecord
+from continuum.monitoring.metrics import CACHE_REQUESTS_TOTAL
+
+FoldFn = Callable[[str, Sequence[EpisodeRecord]], str]
+
+RECENT_EPISODES = 5
+TOPICS = 8
+EPISODE_CHARS = 160
+
+
+class ExtractiveFold:
+    """Running topic counts plus the most recent episodes."""
+
+    def __init__(self, recent: int = RECENT_EPISODES, topics: int = TOPICS):
+        self.topics = topics
+        self.counts: Counter = Counter()
+        self.recent: deque = deque(maxlen=recent)
+
+    def __call__(self, previous: str, episodes: Sequence[EpisodeRecord]) -> str:
+        for episode in episodes:
+            text = " ".join(episode.content.split())
+            if not text:
+                continue
+            self.counts.update(
+                t for t in set(tokenize(text))
+                if len(t) > 2 and t not in STOPWORDS and not t.isdigit()
+            )
+            self.recent.append(
+                text if len(text) <= EPISODE_CHARS else text[:EPISODE_CHARS] + "…"
+            )
+
+        lines = []
+        recurring = [
+            (term, n) for term, n in self.counts.most_common(self.topics) if n > 1
+        ]
+        if recurring:
+            lines.append(
+                "Recurring topics: "
+                + ", ".join(f"{term} ({n})" for term, n in recurring)
+            )
+        if self.recent:
+            lines.append("Recent moments:")
+            lines.extend(f"- {text}" for text in self.recent)
+        return "\n".join(lines)
+
+    def export_state(self) -> Dict[str, Any]:
+        return {"counts": dict(self.counts), "recent": list(self.recent)}
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.counts = Counter(state["counts"])
+        self.recent = deque(state["recent"], maxlen=self.recent.maxlen)
+
+
+@dataclass(frozen=True)
+class SummaryStamp:
+    version: int            # store.version the summary reflects
+    episodes: int           # store.episodes_added folded in so far
+
+
+class MemorySummarizer:
+    def __init__(self, store, fold_fn: Optional[FoldFn] = None):
+        self.store = store
+        self.fold_fn: FoldFn = fold_fn or ExtractiveFold()
+        self.stamp = SummaryStamp(version=-1, episodes=0)
+        self._text = ""
+        self._lock = threading.Lock()
+
+    def summary(self) -> str:
+        """The rolling summary, recomputed only if the store changed."""
+        with self._lock:
+            version = self.store.version
+            if version == self.stamp.version:
+                CACHE_REQUESTS_TOTAL.labels(cache="memory_summary", result="hit").inc()
+                return self._text
+            CACHE_REQUESTS_TOTAL.labels(cache="memory_summary", result="miss").inc()
+
+            added = self.store.episodes_added
+            new = added - self.stamp.episodes
+            if new > 0:
+                # Episodes the store dropped before we saw them are lost to the summary
+                episodes = self.store.recent_episodes(new)
+                with span("memory.summarize", episodes=len(episodes)):
+                    self._text = self.fold_fn(self._text, episodes)
+                log_debug(
+                    "[SUMMARY] Folded %d new episodes (v%d -> v%d)",
+                    len(episodes), self.stamp.version, version,
+                    phase="memory",
+                )
+
+            self.stamp = SummaryStamp(version=version, episodes=added)
+            return self._text
+
+    def export_state(self) -> Dict[str, Any]:
+        """
+        The summary, its checkpoint and the fold's running state (if the
+        fold has export_state(), as ExtractiveFold does).
+        """
+        with self._lock:
+            state: Dict[str, Any] = {
+                "text": self._text,
+                "episodes": self.stamp.episodes,
+            }
+            export = getattr(self.fold_fn, "export_state", None)
+            if export is not None:
+                state["fold"] = export()
+            return state
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self._text = state["text"]
+            # Unknown version: the next summary() re-checks the store once
+            self.stamp = SummaryStamp(version=-1, episodes=state["episodes"])
+            load = getattr(self.fold_fn, "load_state", None)
+            if load is not None and "fold" in state:
+                load(state["fold"])
@@ -0,0 +1,382 @@
+# continuum/memory/vector_index.py
+
+"""
+Vector index for embedding-backed memory.
+
+    index = VectorIndex(dim=384)
+    index.add("pref:tea", embedding)
+    index.search(query_embedding, k=5)    # -> [(id, cosine), ...]
+
+Vectors are L2-normalized on insert and kept in one contiguous float32
+matrix, so a search is a single matrix-vector product.
+
+Up to `ivf_threshold` vectors the search is exact (brute force over the
+matrix; ~1 ms at 10k x 384). Past it the index trains an IVF coarse
+quantizer (spherical k-means, ~sqrt(N) centroids) and a search only
+scores the rows in the `nprobe` nearest clusters. The quantizer is
+retrained when the index has grown 4x since the last training.
+search(..., exact=True) always scans everything.
+
+With store=EmbeddingStore(...) the matrix is the store's memory-mapped
+file instead of a RAM array: opening an index reads no vectors, writes
+are appended to disk, and searches score the mapping in place (float16
+stores are upcast one block at a time). Removed rows stay in the file
+and are masked out. An IVF over a reopened store is trained by its first
+search rather than at open.
+
+Environment:
+    CONTINUUM_VECTOR_IVF_THRESHOLD   switch to IVF at this size (default 50000)
+    CONTINUUM_VECTOR_NPROBE          clusters scanned per IVF query (default 8)
+"""
+
+import os
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from continuum.core.logger import log_debug, log_info
+from continuum.memory.embedding_store import EmbeddingStore
+
+IVF_THRESHOLD = int(os.getenv("CONTINUUM_VECTOR_IVF_THRESHOLD", 50_000))
+NPROBE = int(os.getenv("CONTINUUM_VECTOR_NPROBE", 8))
+
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_CENTROID = 64
+RETRAIN_GROWTH = 4
+_ASSIGN_BATCH = 16_384
+_SCORE_BLOCK = 4096       # rows upcast per step; stays in cache
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """matrix @ query, a block at a time when the matrix needs upcasting."""
+    if matrix.dtype == np.float32:
+        return matrix @ query
+    out = np.empty(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), _SCORE_BLOCK):
+        out[start:start + _SCORE_BLOCK] = (
+            matrix[start:start + _SCORE_BLOCK].astype(np.float32) @ query
+        )
+    return out
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+# ---------------------------------------------------------
+# IVF coarse quantizer
+# ---------------------------------------------------------
+class _IVF:
+    """Centroids + one posting list of matrix rows per centroid."""
+
+    def __init__(self, centroids: np.ndarray, trained_size: int):
+        self.centroids = centroids
+        self.trained_size = trained_size
+        self.lists: List[array] = [array("q") for _ in range(len(centroids))]
+        self.list_of_row: Dict[int, int] = {}
+
+    @classmethod
+    def train(cls, data: np.ndarray, seed: int = 0) -> "_IVF":
+        n = len(data)
+        nlist = max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample_size = min(n, nlist * KMEANS_SAMPLE_PER_CENTROID)
+        sample = np.asarray(
+            data[np.sort(rng.choice(n, size=sample_size, replace=False))],
+            dtype=np.float32,
+        )
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            counts = np.bincount(assign, minlength=nlist)
+            empty = counts == 0
+            # Re-seed empty clusters from random sample points
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        return cls(centroids, trained_size=n)
+
+    def nearest(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def add_rows(self, rows: Sequence[int], data: np.ndarray) -> None:
+        """Assign data[rows] to clusters, a batch of rows at a time."""
+        rows = np.asarray(rows, dtype=np.int64)
+        for start in range(0, len(rows), _ASSIGN_BATCH):
+            chunk = rows[start:start + _ASSIGN_BATCH]
+            for row, cluster in zip(chunk.tolist(), self.nearest(data[chunk]).tolist()):
+                self.lists[cluster].append(row)
+                self.list_of_row[row] = cluster
+
+    def remove_row(self, row: int) -> None:
+        cluster = self.list_of_row.pop(row, None)
+        if cluster is not None:
+            self.lists[cluster].remove(row)
+
+    def move_row(self, old: int, new: int) -> None:
+        cluster = self.list_of_row.pop(old)
+        posting = self.lists[cluster]
+        posting[posting.index(old)] = new
+        self.list_of_row[new] = cluster
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        probe = _top_k(self.centroids @ query, nprobe)
+        parts = [
+            np.frombuffer(self.lists[c], dtype=np.int64)
+            for c in probe
+            if len(self.lists[c])
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+# ---------------------------------------------------------
+# Index
+# ---------------------------------------------------------
+class VectorIndex:
+    """Cosine-similarity index: exact for small sets, IVF for large ones."""
+
+    def __init__(
+        self,
+        dim: int,
+        ivf_threshold: int = IVF_THRESHOLD,
+        nprobe: int = NPROBE,
+        initial_capacity: int = 1024,
+        store: Optional[EmbeddingStore] = None,
+    ):
+        self.dim = dim
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._ivf: Optional[_IVF] = None
+        self._lock = threading.RLock()
+
+        self._store = store
+        if store is not None:
+            if store.dim != dim:
+                raise ValueError(
+                    f"Store {store.path} holds dim {store.dim}, expected {dim}"
+                )
+            # Shared with the store, not copied
+            self._data = store.matrix
+            self._ids: List[str] = store.ids
+        else:
+            self._data = np.zeros((initial_capacity, dim), dtype=np.float32)
+            self._ids = []
+            self._row_map: Dict[str, int] = {}
+
+    @property
+    def _rows(self) -> Dict[str, int]:
+        return self._store.rows if self._store is not None else self._row_map
+
+    @classmethod
+    def open(
+        cls, path: str, dim: int, dtype: str = "float16", **kwargs
+    ) -> "VectorIndex":
+        """Index backed by the embedding store at `path`, created if missing."""
+        return cls(dim=dim, store=EmbeddingStore(path, dim=dim, dtype=dtype), **kwargs)
+
+    # -----------------------------------------------------
+    # Writes
+    # -----------------------------------------------------
+    def _reserve(self, n: int) -> None:
+        if n <= len(self._data):
+            return
+        capacity = len(self._data)
+        while capacity < n:
+            capacity *= 2
+        grown = np.zeros((capacity, self.dim), dtype=np.float32)
+        grown[: len(self._ids)] = self._data[: len(self._ids)]
+        self._data = grown
+
+    def add(self, item_id: str, vector: Sequence[float]) -> None:
+        """Insert or overwrite one vector."""
+        self.add_many([item_id], np.asarray(vector, dtype=np.float32)[None, :])
+
+    def add_many(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = _normalize(vectors)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected vectors of shape (n, {self.dim}), got {vectors.shape}"
+            )
+        if len(ids) != len(vectors):
+            raise ValueError(f"{len(ids)} ids for {len(vectors)} vectors")
+
+        with self._lock:
+            if self._store is not None:
+                self._append_to_store(ids, vectors)
+                return
+            self._reserve(len(self._ids) + len(ids))
+            rows: List[int] = []
+            for item_id, vector in zip(ids, vectors):
+                row = self._rows.get(item_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._ids.append(item_id)
+                    self._rows[item_id] = row
+                elif self._ivf is not None:
+                    self._ivf.remove_row(row)
+                self._data[row] = vector
+                rows.append(row)
+
+            if self._ivf is not None:
+                rows = list(dict.fromkeys(rows))   # an id repeated within the batch
+                self._ivf.add_rows(rows, self._data)
+            self._maybe_train()
+
+    def close(self) -> None:
+        """Flush and close the backing store, if any. Searches still work."""
+        if self._store is not None:
+            self._store.close()
+
+    def _append_to_store(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        if self._ivf is not None:
+            for item_id in ids:
+                if item_id in self._rows:
+                    self._ivf.remove_row(self._rows[item_id])
+        rows = self._store.append(ids, vectors)
+        self._data = self._store.matrix      # remapped if the file grew
+        if self._ivf is not None:
+            live = [
+                row for item_id, row in zip(ids, rows) if self._rows[item_id] == row
+            ]
+            self._ivf.add_rows(live, self._data)
+        self._maybe_train()
+
+    def remove(self, item_id: str) -> bool:
+        with self._lock:
+            if self._store is not None:
+                row = self._rows.get(item_id)
+                if row is None:
+                    return False
+                if self._ivf is not None:
+                    self._ivf.remove_row(row)
+                return self._store.delete(item_id)
+
+            row = self._rows.pop(item_id, None)
+            if row is None:
+                return False
+            last = len(self._ids) - 1
+            if self._ivf is not None:
+                self._ivf.remove_row(row)
+            if row != last:
+                # Keep the matrix dense: move the last row into the hole
+                moved = self._ids[last]
+                self._data[row] = self._data[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                if self._ivf is not None:
+                    self._ivf.move_row(last, row)
+            self._ids.pop()
+            return True
+
+    def _live_rows(self) -> np.ndarray:
+        if self._store is not None and self._store.dead:
+            return np.flatnonzero(self._store.live)
+        return np.arange(len(self._ids))
+
+    def _maybe_train(self) -> None:
+        n = len(self)
+        if n < self.ivf_threshold:
+            return
+        if self._ivf is not None and n < self._ivf.trained_size * RETRAIN_GROWTH:
+            return
+
+        started = time.perf_counter()
+        # Dead store rows may end up in the k-means sample; they only nudge centroids
+        self._ivf = _IVF.train(self._data[: len(self._ids)])
+        self._ivf.trained_size = n
+        self._ivf.add_rows(self._live_rows(), self._data)
+        log_info(
+            "[VECTOR] Trained IVF: %d clusters over %d vectors in %.0f ms",
+            len(self._ivf.centroids),
+            n,
+            (time.perf_counter() - started) * 1000,
+            phase="memory",
+        )
+
+    # -----------------------------------------------------
+    # Reads
+    # -----------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._store) if self._store is not None else len(self._ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    def ids(self) -> List[str]:
+        """Every live id."""
+        with self._lock:
+            return list(self._rows)
+
+    def vector(self, item_id: str) -> Optional[np.ndarray]:
+        """The stored (normalized) vector for an id, as a float32 copy."""
+        with self._lock:
+            row = self._rows.get(item_id)
+            return None if row is None else np.array(self._data[row], dtype=np.float32)
+
+    @property
+    def mode(self) -> str:
+        return "ivf" if self._ivf is not None else "exact"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by vectors, centroids and posting lists.
+        A store's vectors are in the page cache, not counted here.
+        """
+        total = self._data.nbytes if self._store is None else self._store.live.nbytes
+        if self._ivf is not None:
+            total += self._ivf.centroids.nbytes
+            total += sum(p.itemsize * len(p) for p in self._ivf.lists)
+        return total
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 5,
+        exact: bool = False,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Top-k (id, cosine similarity), best first."""
+        if k <= 0:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float32))
+        if q.shape != (self.dim,):
+            raise ValueError(f"Expected a query of shape ({self.dim},), got {q.shape}")
+
+        with self._lock:
+            n = len(self._ids)
+            if not len(self):
+                return []
+            if self._store is not None and self._ivf is None and not exact:
+                self._maybe_train()
+            if self._ivf is None or exact:
+                scores = _scores(self._data[:n], q)
+                if self._store is not None and self._store.dead:
+                    scores[~self._store.live] = -np.inf
+                top = _top_k(scores, min(k, len(self)))
+                hits = [(self._ids[i], float(scores[i])) for i in top]
+            else:
+                rows = self._ivf.candidates(q, nprobe or self.nprobe)
+                scores = self._data[rows] @ q
+                top = _top_k(scores, k)
+                hits = [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+        log_debug("[VECTOR] search k=%d over %d (%s)", k, n, self.mode, phase="memory")
+        return hits
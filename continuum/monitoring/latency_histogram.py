@@ -0,0 +1,257 @@
+# continuum/monitoring/latency_histogram.py
+
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# ---------------------------------------------------------
+# Bucket layout
+# ---------------------------------------------------------
+# Log-spaced bucket bounds (HDR-style): every bucket is ~10% wider than the
+# previous one, so any recorded value is reported with <= ~5% relative error.
+# Bucket 0 collects everything below 1.0; the last bucket is open-ended.
+_GROWTH = 1.1
+_MAX_VALUE = 1_000_000.0
+
+BUCKET_BOUNDS: List[float] = [1.0]
+while BUCKET_BOUNDS[-1] < _MAX_VALUE:
+    BUCKET_BOUNDS.append(BUCKET_BOUNDS[-1] * _GROWTH)
+
+NUM_BUCKETS = len(BUCKET_BOUNDS) + 1
+
+# Metrics tracked per (model, node)
+METRIC_TTFT = "ttft_ms"
+METRIC_TOTAL = "total_ms"
+METRIC_TOKENS_PER_SEC = "tokens_per_sec"
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram for latency-like values.
+
+    Keeps exact count/sum/min/max and log-spaced bucket counts so that
+    p50/p95/p99 can be answered without storing raw samples. Histograms
+    are mergeable, which lets per-window rows be combined at query time.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = array("I", [0]) * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    # ---------------------------------------------------------
+    # RECORD
+    # ---------------------------------------------------------
+    def record(self, value: float, count: int = 1) -> None:
+        if value is None or count <= 0:
+            return
+        value = max(0.0, float(value))
+
+        self.counts[bisect_left(BUCKET_BOUNDS, value)] += count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        if not other.count:
+            return self
+        for idx, c in enumerate(other.counts):
+            if c:
+                self.counts[idx] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    # ---------------------------------------------------------
+    # QUERY
+    # ---------------------------------------------------------
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Return the value at percentile p (0–100), or None if empty.
+        The bucket's geometric midpoint is used, clamped to [min, max].
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for idx, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return self._bucket_value(idx)
+        return self.max
+
+    def percentiles(
+        self, ps: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Optional[float]]:
+        return {f"p{p:g}": self.percentile(p) for p in ps}
+
+    def _bucket_value(self, idx: int) -> float:
+        if idx == 0:
+            estimate = BUCKET_BOUNDS[0] / 2.0
+        elif idx >= len(BUCKET_BOUNDS):
+            estimate = self.max
+        else:
+            estimate = math.sqrt(BUCKET_BOUNDS[idx - 1] * BUCKET_BOUNDS[idx])
+        return max(self.min, min(self.max, estimate))
+
+    # ---------------------------------------------------------
+    # SERIALIZATION (sparse: [bucket, count] pairs as uint32)
+    # ---------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        packed = array("I")
+        for idx, c in enumerate(self.counts):
+            if c:
+                packed.append(idx)
+                packed.append(c)
+        return packed.tobytes()
+
+    @classmethod
+    def from_parts(
+        cls,
+        buckets: Optional[bytes],
+        count: int,
+        total: float,
+        min_value: Optional[float],
+        max_value: Optional[float],
+    ) -> "LatencyHistogram":
+        hist = cls()
+        if buckets:
+            packed = array("I")
+            packed.frombytes(buckets)
+            for i in range(0, len(packed) - 1, 2):
+                if packed[i] < NUM_BUCKETS:
+                    hist.counts[packed[i]] += packed[i + 1]
+        hist.count = count or 0
+        hist.total = total or 0.0
+        hist.min = min_value
+        hist.max = max_value
+        return hist
+
+
+# ---------------------------------------------------------
+# IN-PROCESS RECORDER
+# ---------------------------------------------------------
+
+HistogramKey = Tuple[str, Optional[int], str]
+
+
+class LatencyRecorder:
+    """
+    Thread-safe, in-memory accumulator of per-(model, node, metric)
+    histograms. The LLM client records into it on the request path;
+    a background thread periodically flushes it into
+    model_latency_histograms via flush().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[HistogramKey, LatencyHistogram] = {}
+
+    def record(
+        self, model_name: str, node_id: Optional[int], metric: str, value: float
+    ) -> None:
+        key = (model_name, node_id, metric)
+        with self._lock:
+            hist = self._pending.get(key)
+            if hist is None:
+                hist = self._pending[key] = LatencyHistogram()
+            hist.record(value)
+
+    def record_generation(
+        self,
+        model_name: str,
+        node_id: Optional[int],
+        ttft_ms: Optional[float],
+        total_ms: float,
+        tokens_per_sec: Optional[float],
+    ) -> None:
+        if ttft_ms is not None:
+            self.record(model_name, node_id, METRIC_TTFT, ttft_ms)
+        self.record(model_name, node_id, METRIC_TOTAL, total_ms)
+        if tokens_per_sec is not None:
+            self.record(model_name, node_id, METRIC_TOKENS_PER_SEC, tokens_per_sec)
+
+    def drain(self) -> Dict[HistogramKey, LatencyHistogram]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: Dict[HistogramKey, LatencyHistogram]) -> None:
+        """Merge drained histograms back in (after a failed flush)."""
+        with self._lock:
+            for key, hist in pending.items():
+                current = self._pending.get(key)
+                if current is None:
+                    self._pending[key] = hist
+                else:
+                    current.merge(hist)
+
+    def flush(self, db) -> int:
+        """
+        Merge pending histograms into the current hourly window rows.
+        Returns the number of rows written. On failure the session is
+        rolled back and the samples are kept for the next flush.
+        """
+        from continuum.db.models.model_latency_histograms import (
+            LatencyMetric,
+            ModelLatencyHistogram,
+        )
+
+        pending = self.drain()
+        if not pending:
+            return 0
+
+        window_start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        try:
+            for (model_name, node_id, metric), hist in pending.items():
+                row = (
+                    db.query(ModelLatencyHistogram)
+                    .filter(ModelLatencyHistogram.model_name == model_name)
+                    .filter(ModelLatencyHistogram.node_id == node_id)
+                    .filter(ModelLatencyHistogram.metric == LatencyMetric(metric))
+                    .filter(ModelLatencyHistogram.window_start == window_start)
+                    .first()
+                )
+
+                if row is None:
+                    row = ModelLatencyHistogram(
+                        model_name=model_name,
+                        node_id=node_id,
+                        metric=LatencyMetric(metric),
+                        window_start=window_start,
+                    )
+                    db.add(row)
+                else:
+                    hist = row.to_histogram().merge(hist)
+
+                row.update_from_histogram(hist)
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.restore(pending)
+            raise
+
+        return len(pending)
+
+
+# Shared recorder instance (one per process)
+latency_recorder = LatencyRecorder()
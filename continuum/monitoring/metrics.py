@@ -0,0 +1,474 @@
+# continuum/monitoring/metrics.py
+
+"""
+In-process metrics registry with Prometheus text exposition.
+
+    from continuum.monitoring.metrics import TURN_DURATION, TURNS_TOTAL
+    TURNS_TOTAL.labels(status="ok").inc()
+    TURN_DURATION.observe(elapsed_seconds)
+
+Exposed on a local HTTP endpoint (start_metrics_server) at /metrics
+and dumpable to a file for offline runs (dump_metrics).
+
+Every metric the orchestrator emits is declared in the catalog below;
+names and label sets are part of the operational contract — add new
+metrics rather than renaming existing ones.
+"""
+
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from continuum.core.logger import log_error, log_info
+
+LabelValues = Tuple[str, ...]
+
+# Seconds: 5 ms … 2 min (covers a Jury pass through a slow multi-pass rewrite)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+# ---------------------------------------------------------
+# Metric families
+# ---------------------------------------------------------
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[LabelValues, object] = {}
+        if not self.labelnames:
+            # Unlabelled metrics are exported (as 0) from the start
+            self._children[()] = self._new_child()
+
+    def labels(self, **labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in sorted(children):
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        with self._lock:
+            self.value += amount
+
+    def render(self, name, labelnames, key):
+        return [f"{name}{_fmt_labels(labelnames, key)} {_fmt_value(self.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value", "fn")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+        self.fn: Optional[Callable[[], Optional[float]]] = None
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, fn: Callable[[], Optional[float]]) -> None:
+        """Evaluate fn at scrape time; a None result omits the sample."""
+        self.fn = fn
+
+    def render(self, name, labelnames, key):
+        value = self.value
+        if self.fn is not None:
+            try:
+                value = self.fn()
+            except Exception:
+                value = None
+            if value is None:
+                return []
+        return [f"{name}{_fmt_labels(labelnames, key)} {_fmt_value(value)}"]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, fn: Callable[[], Optional[float]]) -> None:
+        self._default().set_function(fn)
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[idx] += 1
+            self.sum += value
+            self.count += 1
+
+    def render(self, name, labelnames, key):
+        with self._lock:
+            counts = list(self.counts)
+            total, n = self.sum, self.count
+        lines = []
+        cumulative = 0
+        for bound, c in zip(self.bounds + (float("inf"),), counts):
+            cumulative += c
+            le = f'le="{_fmt_value(bound)}"'
+            lines.append(
+                f"{name}_bucket{_fmt_labels(labelnames, key, le)} {cumulative}"
+            )
+        lines.append(f"{name}_sum{_fmt_labels(labelnames, key)} {_fmt_value(total)}")
+        lines.append(f"{name}_count{_fmt_labels(labelnames, key)} {n}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name, help_text, labelnames=(), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+
+# ---------------------------------------------------------
+# Registry
+# ---------------------------------------------------------
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if (
+                    type(existing) is not type(metric)
+                    or existing.labelnames != metric.labelnames
+                ):
+                    raise ValueError(
+                        f"metric {metric.name} already registered differently"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, help_text, labelnames=()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+# ---------------------------------------------------------
+# Catalog (stable names)
+# ---------------------------------------------------------
+# Controller
+TURNS_TOTAL = metrics.counter(
+    "continuum_turns_total",
+    "Turns processed by ContinuumController.process_message, by outcome (ok|error).",
+    ["status"],
+)
+TURN_DURATION = metrics.histogram(
+    "continuum_turn_duration_seconds",
+    "Wall-clock time of a full turn (routing through rewrite).",
+)
+TURNS_INFLIGHT = metrics.gauge(
+    "continuum_turns_inflight",
+    "Turns currently being processed.",
+)
+
+# Router
+ROUTER_DECISIONS_TOTAL = metrics.counter(
+    "continuum_router_decisions_total",
+    "Routing decisions, by classified intent and top model.",
+    ["intent", "model"],
+)
+ROUTER_DURATION = metrics.histogram(
+    "continuum_router_duration_seconds",
+    "Time spent in Router.route (intent + model + node selection).",
+)
+
+# LLM client
+LLM_REQUESTS_TOTAL = metrics.counter(
+    "continuum_llm_requests_total",
+    "LLM generate calls, by model and outcome (ok|error).",
+    ["model", "status"],
+)
+LLM_REQUEST_DURATION = metrics.histogram(
+    "continuum_llm_request_duration_seconds",
+    "Total LLM generate latency, by model.",
+    ["model"],
+)
+LLM_TTFT = metrics.histogram(
+    "continuum_llm_ttft_seconds",
+    "Time to first streamed token, by model.",
+    ["model"],
+)
+LLM_TOKENS_TOTAL = metrics.counter(
+    "continuum_llm_tokens_total",
+    "Tokens generated (Ollama eval_count), by model.",
+    ["model"],
+)
+LLM_INFLIGHT = metrics.gauge(
+    "continuum_llm_inflight_requests",
+    "LLM requests in flight across all nodes (request queue depth).",
+)
+
+# Nodes
+NODE_PING_LATENCY = metrics.gauge(
+    "continuum_node_ping_latency_seconds",
+    "Latency of the last successful health check per node (see continuum_node_up).",
+    ["node"],
+)
+NODE_UP = metrics.gauge(
+    "continuum_node_up",
+    "1 if the node answered its last health check, else 0.",
+    ["node"],
+)
+
+# Jury
+JURY_DURATION = metrics.histogram(
+    "continuum_jury_duration_seconds",
+    "Time spent scoring proposals in Jury.score_all.",
+)
+JURY_PROPOSALS_TOTAL = metrics.counter(
+    "continuum_jury_proposals_scored_total",
+    "Proposals scored by the Jury.",
+)
+
+# Aira (rewrite + polish)
+AIRA_REWRITE_PASSES_TOTAL = metrics.counter(
+    "continuum_aira_rewrite_passes_total",
+    "Rewrite passes executed, by outcome (ok|empty|early_stop).",
+    ["outcome"],
+)
+AIRA_REWRITE_DURATION = metrics.histogram(
+    "continuum_aira_rewrite_duration_seconds",
+    "Time spent in the full Aira rewrite loop.",
+)
+AIRA_POLISH_TOTAL = metrics.counter(
+    "continuum_aira_polish_total",
+    "micro_polish calls, by outcome (ok|error|skipped).",
+    ["outcome"],
+)
+
+# Caches
+CACHE_REQUESTS_TOTAL = metrics.counter(
+    "continuum_cache_requests_total",
+    "Cache lookups, by cache name and result (hit|miss).",
+    ["cache", "result"],
+)
+CACHE_RELOADS_TOTAL = metrics.counter(
+    "continuum_cache_reloads_total",
+    "Cache contents reloaded from their source, by cache name.",
+    ["cache"],
+)
+
+# Memory
+MEMORY_COMPACTED_TOTAL = metrics.counter(
+    "continuum_memory_compacted_total",
+    "Memory records removed by compaction, by tier and action "
+    "(expired|evicted|merged).",
+    ["tier", "action"],
+)
+
+# Internal queues
+LOG_QUEUE_DEPTH = metrics.gauge(
+    "continuum_log_queue_depth",
+    "Log records waiting for the logging listener thread.",
+)
+
+
+def _log_queue_depth() -> Optional[float]:
+    from continuum.core import logger as core_logger
+    return core_logger._log_queue.qsize()
+
+
+LOG_QUEUE_DEPTH.set_function(_log_queue_depth)
+
+
+# ---------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = metrics
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep scrapes out of the console
+        return
+
+
+class MetricsServer(threading.Thread):
+    """Background thread serving /metrics on a local port."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        registry: MetricsRegistry = metrics,
+    ):
+        super().__init__(daemon=True)
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.running = True
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    def run(self):
+        log_info(f"[METRICS] Serving /metrics on port {self.port}", phase="metrics")
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.running = False
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def start_metrics_server(
+    host: str = "127.0.0.1", port: Optional[int] = None
+) -> Optional[MetricsServer]:
+    """Start the endpoint (port from CONTINUUM_METRICS_PORT, default 9464)."""
+    port = port if port is not None else int(os.getenv("CONTINUUM_METRICS_PORT", 9464))
+    try:
+        server = MetricsServer(host, port)
+    except OSError as e:
+        log_error(f"[METRICS] Could not bind {host}:{port}: {e}", phase="metrics")
+        return None
+    server.start()
+    return server
+
+
+def dump_metrics(path: str) -> str:
+    """Write the current exposition to path (for offline runs). Returns the path."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(metrics.render())
+    os.replace(tmp, path)
+    return path
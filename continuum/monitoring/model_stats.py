@@ -3,7 +3,7 @@
 import time
 from datetime import datetime
 
-from continuum.db.sqlalchemy_connection import get_db_session
+from continuum.db.sqlalchemy_connection import session_scope
 from continuum.db.models.model_stats import ModelStats
 
 
@@ -15,47 +15,46 @@ def log_model_call(model_name: str, success: bool, latency_ms: int):
     - total_failures
     - success_rate
     - avg_latency_ms
+
+    Per-node latency distributions are tracked separately by
+    monitoring.latency_histogram (flushed by the HealthMonitor).
     """
 
-    db = get_db_session()
-
-    stats = (
-        db.query(ModelStats)
-        .filter(ModelStats.model_name == model_name)
-        .first()
-    )
-
-    # Create row if missing
-    if not stats:
-        stats = ModelStats(
-            model_name=model_name,
-            total_calls=0,
-            total_failures=0,
-            success_rate=0.0,
-            avg_latency_ms=latency_ms,
-            last_updated=datetime.utcnow()
+    with session_scope() as db:
+        stats = (
+            db.query(ModelStats)
+            .filter(ModelStats.model_name == model_name)
+            .first()
         )
-        db.add(stats)
-
-    # Update totals
-    stats.total_calls += 1
-    if not success:
-        stats.total_failures += 1
-
-    # Update success rate
-    stats.success_rate = (
-        (stats.total_calls - stats.total_failures) / stats.total_calls
-    )
-
-    # Update average latency (EMA)
-    if stats.avg_latency_ms is None:
-        stats.avg_latency_ms = latency_ms
-    else:
-        stats.avg_latency_ms = int(
-            (stats.avg_latency_ms * 0.8) + (latency_ms * 0.2)
+
+        # Create row if missing
+        if not stats:
+            stats = ModelStats(
+                model_name=model_name,
+                total_calls=0,
+                total_failures=0,
+                success_rate=0.0,
+                avg_latency_ms=latency_ms,
+                last_updated=datetime.utcnow()
+            )
+            db.add(stats)
+
+        # Update totals
+        stats.total_calls += 1
+        if not success:
+            stats.total_failures += 1
+
+        # Update success rate
+        stats.success_rate = (
+            (stats.total_calls - stats.total_failures) / stats.total_calls
         )
 
-    stats.last_updated = datetime.utcnow()
+        # Update average latency (EMA)
+        if stats.avg_latency_ms is None:
+            stats.avg_latency_ms = latency_ms
+        else:
+            stats.avg_latency_ms = int(
+                (stats.avg_latency_ms * 0.8) + (latency_ms * 0.2)
+            )
 
-    db.commit()
-    db.close()
\ No newline at end of file
+        stats.last_updated = datetime.utcnow()
@@ -0,0 +1,342 @@
+# continuum/monitoring/profiler.py
+
+"""
+On-demand per-turn profiling.
+
+Set context.debug_flags["profile_turn"] = True and the next
+process_message runs under a profiler; the flag is consumed, so only
+that one turn pays the cost.
+
+Two modes:
+  - sampling (default): a daemon thread snapshots every thread's stack
+    via sys._current_frames() every CONTINUUM_PROFILE_INTERVAL_MS
+    (default 5 ms). Covers Senate executor threads too. Writes a
+    collapsed-stack file (flamegraph.pl / speedscope import) and a
+    speedscope JSON, keyed by the turn's trace id.
+  - cprofile (CONTINUUM_PROFILER=cprofile, or when sampling is not
+    available): deterministic, calling thread only, much heavier.
+    Writes a .prof file for pstats / snakeviz.
+
+Either way the top self-time functions end up in ProfileResult, which
+the controller keeps as last_profile for the debug diagnostics panel.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from continuum.core.logger import log_error, log_info
+from continuum.core.tracing import current_trace_id
+
+PROFILE_DIR = os.getenv(
+    "CONTINUUM_PROFILE_DIR", os.path.join(os.getcwd(), "logs", "profiles")
+)
+PROFILE_MODE = os.getenv("CONTINUUM_PROFILER", "sampling")
+SAMPLE_INTERVAL_MS = float(os.getenv("CONTINUUM_PROFILE_INTERVAL_MS", 5.0))
+MAX_STACK_DEPTH = 128
+TOP_N = 25
+
+# A leaf frame in these stdlib modules (or one of the known blocking
+# loops below, which park inside C calls) means the thread is idle. Such
+# samples are dropped for every thread except the turn thread, where
+# waiting (e.g. on Senate futures) is part of the turn's wall time.
+_IDLE_MODULES = ("threading.py", "queue.py", "selectors.py", "socketserver.py")
+_IDLE_LEAVES = {
+    ("thread.py", "_worker"),       # idle ThreadPoolExecutor worker
+    ("handlers.py", "dequeue"),     # logging QueueListener
+}
+
+
+def _is_idle(code) -> bool:
+    filename = code.co_filename
+    if filename.endswith(_IDLE_MODULES):
+        return True
+    return (os.path.basename(filename), code.co_name) in _IDLE_LEAVES
+
+
+@dataclass
+class ProfileResult:
+    turn_id: str
+    mode: str
+    duration_ms: float
+    samples: int                 # stack samples, or function calls for cprofile
+    files: Dict[str, str] = field(default_factory=dict)
+    # [{"function": "name (file:line)", "self_ms": float, "percent": float}]
+    top_self: List[Dict[str, object]] = field(default_factory=list)
+
+
+# ---------------------------------------------------------
+# Sampling profiler
+# ---------------------------------------------------------
+FrameKey = Tuple[str, str, int]  # (function, filename, first line)
+
+
+class SamplingProfiler(threading.Thread):
+    """Samples all thread stacks at a fixed interval until stop()."""
+
+    def __init__(
+        self,
+        interval_ms: float = SAMPLE_INTERVAL_MS,
+        focus_thread: Optional[int] = None,
+    ):
+        super().__init__(name="continuum-profiler", daemon=True)
+        self.interval = interval_ms / 1000.0
+        self.focus_thread = (
+            focus_thread if focus_thread is not None else threading.get_ident()
+        )
+        self.running = True
+        # (thread name, stack root→leaf) -> sample count / sampled wall ms.
+        # Samples are weighted by the real gap since the previous one:
+        # under GIL contention the sampler wakes late, not on schedule.
+        self.stacks: Counter = Counter()
+        self.stack_ms: Counter = Counter()
+        self.samples = 0
+        self._last_sample = 0.0
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+        self._thread_names: Dict[int, str] = {}
+
+    def _thread_name(self, ident: int) -> str:
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {t.ident: t.name for t in threading.enumerate()}
+            name = self._thread_names.get(ident, f"thread-{ident}")
+        return name
+
+    def _sample(self) -> None:
+        now = time.perf_counter()
+        weight_ms = (now - self._last_sample) * 1000.0
+        self._last_sample = now
+        me = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            if ident != self.focus_thread and _is_idle(frame.f_code):
+                continue
+
+            stack: List[FrameKey] = []
+            f = frame
+            while f is not None and len(stack) < MAX_STACK_DEPTH:
+                code = f.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                f = f.f_back
+            stack.reverse()
+            key = (self._thread_name(ident), tuple(stack))
+            self.stacks[key] += 1
+            self.stack_ms[key] += weight_ms
+        self.samples += 1
+
+    def run(self):
+        self.started_at = self._last_sample = time.perf_counter()
+        next_tick = self.started_at + self.interval
+        time.sleep(self.interval)
+        while self.running:
+            try:
+                self._sample()
+            except Exception as e:
+                log_error(f"[PROFILER] Sampling failed: {e}", phase="profiler")
+                break
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
+        self.stopped_at = time.perf_counter()
+
+    def stop(self):
+        self.running = False
+        if self.is_alive():
+            self.join()
+
+    # -----------------------------------------------------
+    # Output
+    # -----------------------------------------------------
+    @staticmethod
+    def _label(key: FrameKey) -> str:
+        name, filename, line = key
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def collapsed(self) -> str:
+        """Brendan Gregg folded format: thread;frame;frame count"""
+        lines = []
+        for (thread, stack), count in self.stacks.most_common():
+            frames = ";".join(self._label(k) for k in stack)
+            lines.append(f"{thread};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str) -> Dict[str, object]:
+        """speedscope 'sampled' profile, one profile per thread."""
+        frame_index: Dict[FrameKey, int] = {}
+        frames: List[Dict[str, object]] = []
+        per_thread: Dict[str, Tuple[List[List[int]], List[float]]] = {}
+
+        for (thread, stack), ms in self.stack_ms.items():
+            ids = []
+            for key in stack:
+                idx = frame_index.get(key)
+                if idx is None:
+                    idx = frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                ids.append(idx)
+            samples, weights = per_thread.setdefault(thread, ([], []))
+            samples.append(ids)
+            weights.append(round(ms, 3))
+
+        profiles = [
+            {
+                "type": "sampled",
+                "name": thread,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+            for thread, (samples, weights) in per_thread.items()
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "continuum.monitoring.profiler",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def top_self(self, n: int = TOP_N) -> List[Dict[str, object]]:
+        """Leaf-frame wall time summed over sampled threads (threads overlap)."""
+        leaf_ms: Counter = Counter()
+        for (_, stack), ms in self.stack_ms.items():
+            if stack:
+                leaf_ms[stack[-1]] += ms
+        total = sum(leaf_ms.values()) or 1.0
+        return [
+            {
+                "function": self._label(key),
+                "self_ms": round(ms, 2),
+                "percent": round(100.0 * ms / total, 2),
+            }
+            for key, ms in leaf_ms.most_common(n)
+        ]
+
+
+# ---------------------------------------------------------
+# Turn profiler (context manager used by the controller)
+# ---------------------------------------------------------
+class TurnProfiler:
+    """
+    with TurnProfiler() as prof:
+        ...turn...
+    prof.result  # ProfileResult, or None if writing failed
+    """
+
+    def __init__(self, mode: str = PROFILE_MODE, directory: str = PROFILE_DIR):
+        if mode == "sampling" and not hasattr(sys, "_current_frames"):
+            mode = "cprofile"
+        self.mode = mode
+        self.directory = directory
+        self.turn_id: Optional[str] = None
+        self.result: Optional[ProfileResult] = None
+        self._sampler: Optional[SamplingProfiler] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._start = 0.0
+
+    @classmethod
+    def from_flags(cls, debug_flags: Dict[str, object]) -> Optional["TurnProfiler"]:
+        """Consume the one-shot profile_turn flag; None if it wasn't set."""
+        if not debug_flags.pop("profile_turn", False):
+            return None
+        return cls()
+
+    def __enter__(self) -> "TurnProfiler":
+        self.turn_id = current_trace_id() or uuid4().hex
+        self._start = time.perf_counter()
+        if self.mode == "cprofile":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        else:
+            self._sampler = SamplingProfiler()
+            self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ms = (time.perf_counter() - self._start) * 1000.0
+        try:
+            if self._cprofile is not None:
+                self._cprofile.disable()
+                self.result = self._finish_cprofile(duration_ms)
+            else:
+                self._sampler.stop()
+                self.result = self._finish_sampling(duration_ms)
+            log_info(
+                f"[PROFILER] Turn {self.turn_id} profiled ({self.mode}, "
+                f"{duration_ms:.0f} ms) -> {', '.join(self.result.files.values())}",
+                phase="profiler",
+            )
+        except Exception as e:
+            log_error(
+                f"[PROFILER] Failed to write profile for {self.turn_id}: {e}",
+                phase="profiler",
+            )
+        return False
+
+    def _path(self, suffix: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{self.turn_id}{suffix}")
+
+    def _finish_sampling(self, duration_ms: float) -> ProfileResult:
+        sampler = self._sampler
+        files = {
+            "collapsed": self._path(".collapsed.txt"),
+            "speedscope": self._path(".speedscope.json"),
+        }
+        with open(files["collapsed"], "w", encoding="utf-8") as f:
+            f.write(sampler.collapsed())
+        with open(files["speedscope"], "w", encoding="utf-8") as f:
+            json.dump(sampler.speedscope(f"turn {self.turn_id}"), f)
+
+        return ProfileResult(
+            turn_id=self.turn_id,
+            mode="sampling",
+            duration_ms=duration_ms,
+            samples=sampler.samples,
+            files=files,
+            top_self=sampler.top_self(),
+        )
+
+    def _finish_cprofile(self, duration_ms: float) -> ProfileResult:
+        files = {"pstats": self._path(".prof")}
+        self._cprofile.dump_stats(files["pstats"])
+
+        stats = pstats.Stats(self._cprofile)
+        rows = []
+        total_tt = 0.0
+        for (filename, line, name), (_cc, nc, tt, _ct, _callers) in stats.stats.items():
+            total_tt += tt
+            rows.append((tt, nc, f"{name} ({os.path.basename(filename)}:{line})"))
+        rows.sort(reverse=True)
+        total_tt = total_tt or 1.0
+
+        return ProfileResult(
+            turn_id=self.turn_id,
+            mode="cprofile",
+            duration_ms=duration_ms,
+            samples=sum(r[1] for r in rows),
+            files=files,
+            top_self=[
+                {
+                    "function": label,
+                    "self_ms": round(tt * 1000.0, 2),
+                    "percent": round(100.0 * tt / total_tt, 2),
+                }
+                for tt, _nc, label in rows[:TOP_N]
+            ],
+        )
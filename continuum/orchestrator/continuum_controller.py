@@ -1,30 +1,39 @@
 # continuum/orchestrator/continuum_controller.py
 # Clean, modular ContinuumController orchestrator (Router + v2 routing)
 
-from sqlalchemy import text
+import copy
+import time
+from contextlib import nullcontext
+from typing import Optional
 
-from continuum.core.logger import log_info, log_error
+from continuum.core.logger import log_info, log_debug, log_error
 
 # Modular initialization chunks
 from continuum.orchestrator.controller.controller_init import initialize_controller_state
-from continuum.orchestrator.controller.controller_actors import initialize_actors_and_senate
 from continuum.orchestrator.controller.controller_pipelines import initialize_pipelines
 from continuum.orchestrator.controller.controller_process import process_message as _process_message
 from continuum.orchestrator.deliberation_engine import DeliberationEngine
 
 from continuum.aira.meta_rewrite import meta_rewrite_llm as aira_meta_rewrite_llm
 
-# NEW DB-backed registry
-from continuum.db.registry import ModelRegistry
+from continuum.db.sqlalchemy_connection import end_unit_of_work
+from continuum.core.snapshot import SNAPSHOT_DIR, ConversationSnapshotter
+from continuum.core.tracing import start_trace
+from continuum.core.turn_store import TurnStore
+from continuum.monitoring.profiler import TurnProfiler
+from continuum.monitoring.metrics import (
+    TURN_DURATION,
+    TURNS_INFLIGHT,
+    TURNS_TOTAL,
+)
 
-# LLM client
-from continuum.llm.llm_client import LLMClient
+# Process-wide shared resources
+from continuum.orchestrator.resource_hub import ResourceHub, get_resource_hub
 
 # Legacy UI compatibility layer
 from continuum.orchestrator.controller_legacy import LegacyUIFields
 
 # New routing spine
-from continuum.orchestrator.router.router import Router
 from continuum.orchestrator.router.intent_classifier_contract import (
     IntentClassifierContract,
     IntentResult,
@@ -68,11 +77,11 @@ class ContinuumController(LegacyUIFields):
       user_text → Router (Intent + ModelSelectorV2 + NodeSelectorV2)
     """
 
-    def __init__(self):
+    def __init__(
+        self, hub: Optional[ResourceHub] = None, conversation_id: Optional[str] = None
+    ):
         print("USING CONTROLLER FILE:", __file__)
-        log_error("🔥 CONTROLLER.__init__() START 🔥", phase="controller")
-        from continuum.core.logger import logger as continuum_logger
-        self.logger = continuum_logger
+        log_debug("🔥 CONTROLLER.__init__() START 🔥", phase="controller")
 
         # ---------------------------------------------------------
         # 0. Legacy UI fields
@@ -80,68 +89,45 @@ class ContinuumController(LegacyUIFields):
         self._init_legacy_fields()
 
         # ---------------------------------------------------------
-        # 1. Load DB, emotional engine, context
-        # ---------------------------------------------------------
-        initialize_controller_state(self)   # sets self.db, self.context, etc.
-        self.memory = self.context.memory
-
+        # 1. Shared resources: DB session proxy, registry, rewrite model,
+        #    Router, LLM client, actors + Senate + Jury, emotion detector,
+        #    Meta-Persona (orchestrator.resource_hub, built once per process)
         # ---------------------------------------------------------
-        # 2. Load rewrite model from DB (rewrite_config)
-        # ---------------------------------------------------------
-        try:
-            row = self.db.execute(
-                text("SELECT pinned_model FROM rewrite_config LIMIT 1")
-            ).fetchone()
-
-            if row and row[0]:
-                self.rewrite_model = row[0]
-            else:
-                self.rewrite_model = "gemma3:4b"
-        except Exception as e:
-            log_error(f"[REWRITE CONFIG] Failed to load rewrite model: {e}")
-            self.rewrite_model = "llama3.2:latest"
+        (hub or get_resource_hub()).share_with(self)
 
         # ---------------------------------------------------------
-        # 3. Load NEW DB-backed ModelRegistry
+        # 2. Per-session state: emotional engine, context, memories
         # ---------------------------------------------------------
-        self.registry = ModelRegistry(self.db)
-
-        # ---------------------------------------------------------
-        # 4. New routing spine (Router + basic IntentClassifier)
-        # ---------------------------------------------------------
-        self.intent_classifier = BasicIntentClassifier()
-        self.router = Router(
-            intent_classifier=self.intent_classifier,
-            db_conn=self.db,
-            logger_instance=self.logger,
-        )
-        # LLM client
-        self.llm_client = LLMClient()
+        initialize_controller_state(self, conversation_id)   # sets self.context, etc.
+        self.memory = self.context.memory
 
         # ---------------------------------------------------------
-        # 5. Load actors, Senate, Jury
+        # 3. Per-session actor settings (UI toggles) and deliberation
         # ---------------------------------------------------------
-        initialize_actors_and_senate(self)
+        self.actor_settings = copy.deepcopy(self.hub.actor_settings)
         # Attach deliberation engine (Senate → Jury pipeline)
         self.deliberation_engine = DeliberationEngine(self.senate, self.jury)
-        
+
         # ---------------------------------------------------------
-        # 6. Load pipelines (emotion, fusion, meta, etc.)
+        # 4. Load per-session pipelines (emotional arc, fusion)
         # ---------------------------------------------------------
         initialize_pipelines(self)
 
         # Fusion debug mode
         self.debug_fusion = True
 
-        # Simple in-memory turn log (UI / debugging)
-        self.turn_logger = []
+        # Bounded turn history (UI timeline / debugging); old turns spill to disk
+        self.turn_store = TurnStore(self.context.conversation_id)
+
+        # Conversation snapshots after each turn (set CONTINUUM_SNAPSHOT_DIR to enable)
+        self.snapshotter = ConversationSnapshotter(self) if SNAPSHOT_DIR else None
 
         # Attach rewrite hook (Meta-Persona)
         # Explicitly bind to Aira’s rewrite function
         self.meta_rewrite_llm = lambda **kwargs: aira_meta_rewrite_llm(self, **kwargs)
 
         # ---------------------------------------------------------
-        # 7. Phase‑4.5: generation defaults
+        # 5. Phase‑4.5: generation defaults
         # ---------------------------------------------------------
         self.temperature = 0.7
         self.max_tokens = 512
@@ -152,8 +138,18 @@ class ContinuumController(LegacyUIFields):
         # Routing debug / inspection
         self.last_routing_decision = None
 
+        # Set context.debug_flags["profile_turn"] to profile the next turn
+        self.last_profile = None
+
         log_info("ContinuumController initialized (Router + v2 routing, DB‑backed)", phase="controller")
-        log_error("🔥 CONTROLLER INITIALIZATION COMPLETE 🔥", phase="controller")
+        log_debug("🔥 CONTROLLER INITIALIZATION COMPLETE 🔥", phase="controller")
+
+    def close(self) -> None:
+        """Release this session's hold on shared resources (compaction tiers)."""
+        if self.memory_compactor is not None:
+            self.memory_compactor.remove_tiers(self.compaction_tiers)
+        for index in self.vector_indexes:
+            index.close()
 
     # ---------------------------------------------------------
     # Main message pipeline (Router-first, then modular pipeline)
@@ -166,24 +162,67 @@ class ContinuumController(LegacyUIFields):
           1. Route via Router (intent + model + node)
           2. Store routing decision on self for downstream use
           3. Run the modular process_message pipeline
-        """
-        # 1. Router: decide intent, model, node
-        routing_decision = self.router.route(
-            user_text=message,
-            actor_name=None,  # you can pass a specific actor name if desired
-            extra_context={},
-        )
-        self.last_routing_decision = routing_decision
 
-        log_info(
-            f"[Controller] Routing decision: {routing_decision}",
-            phase="controller",
-        )
+        The turn is one unit of work: it is traced as one trace
+        (core.tracing) and the controller thread's scoped DB session is
+        released when it ends. If debug_flags["profile_turn"] is set, the
+        turn also runs under a profiler (monitoring.profiler) and the
+        result is kept as self.last_profile.
+        """
+        start = time.perf_counter()
+        status = "error"
+        profiler = TurnProfiler.from_flags(self.context.debug_flags)
+        TURNS_INFLIGHT.inc()
+        try:
+            with (
+                start_trace("turn", message_len=len(message)),
+                profiler or nullcontext(),
+            ):
+                # 1. Router: decide intent, model, node
+                routing_decision = self.router.route(
+                    user_text=message,
+                    actor_name=None,  # you can pass a specific actor name if desired
+                    extra_context={},
+                )
+                self.last_routing_decision = routing_decision
+
+                log_info(
+                    "[Controller] Routing decision: %s",
+                    routing_decision,
+                    phase="controller",
+                )
+
+                # TODO: In a next pass, we can thread routing_decision directly
+                # into the pipelines and actors. For now, we expose it via
+                # self.last_routing_decision so controller_process / pipelines
+                # can start consuming it incrementally.
+
+                # 2. Run the existing modular pipeline
+                response = _process_message(self, message)
+                status = "ok"
+                self._save_snapshot()
+                return response
+        finally:
+            TURNS_INFLIGHT.dec()
+            TURNS_TOTAL.labels(status=status).inc()
+            TURN_DURATION.observe(time.perf_counter() - start)
+            if profiler is not None and profiler.result is not None:
+                self.last_profile = profiler.result
+            end_unit_of_work()
 
-        # TODO: In a next pass, we can thread routing_decision directly
-        # into the pipelines and actors. For now, we expose it via
-        # self.last_routing_decision so controller_process / pipelines
-        # can start consuming it incrementally.
+    # ---------------------------------------------------------
+    # Snapshots (core.snapshot)
+    # ---------------------------------------------------------
+    def _save_snapshot(self) -> None:
+        if self.snapshotter is None:
+            return
+        try:
+            self.snapshotter.save()
+        except Exception as e:
+            # A missed snapshot only costs a full frame on the next save
+            log_error(f"[SNAPSHOT] Failed to save conversation: {e}", phase="snapshot")
 
-        # 2. Run the existing modular pipeline
-        return _process_message(self, message)
\ No newline at end of file
+    def restore_conversation(self, conversation_id: str) -> bool:
+        """Resume a snapshotted conversation here; False if none is saved."""
+        snapshotter = self.snapshotter or ConversationSnapshotter(self)
+        return snapshotter.restore(conversation_id)
\ No newline at end of file
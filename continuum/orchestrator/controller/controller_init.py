@@ -1,47 +1,106 @@
 # continuum/orchestrator/controller_init.py
 
+import os
 import uuid
-from continuum.db.sqlalchemy_connection import get_db_session
+from urllib.parse import quote
 
 from continuum.persona.emotional_memory import EmotionalMemory
 from continuum.emotion.state_machine import EmotionalState
 
-from continuum.db.registry import ModelRegistry
-from continuum.core.context import ContinuumContext
-from continuum.core.logger import log_debug, log_error
+from continuum.core.context import MESSAGE_ADDED, ContinuumContext
+from continuum.memory.compaction import EmotionalEventTier, EpisodeTier, KeyValueTier
+from continuum.memory.episodic import EpisodicMemory
+from continuum.memory.memory_store import MemoryStore
+from continuum.memory.retrieval import MemoryRetriever
+from continuum.memory.semantic import EMBEDDING_DIM, SemanticMemory, embed
+from continuum.memory.summarizer import MemorySummarizer
+from continuum.memory.vector_index import VectorIndex
+from continuum.core.logger import log_debug
 
+# Keep each conversation's embeddings in memory-mapped files under this
+# directory (<id>.recall.* and <id>.facts.*) instead of RAM. Off if unset.
+EMBEDDING_DIR = os.getenv("CONTINUUM_EMBEDDING_DIR", "")
 
-def initialize_controller_state(controller):
-    log_error("🔥 ENTERED controller_init.initialize_controller_state() 🔥", phase="controller")
 
-    # ---------------------------------------------------------
-    # 1. Database session
-    # ---------------------------------------------------------
-    controller.db = get_db_session()
+def _open_vector_indexes(conversation_id):
+    """(recall, facts) on-disk indexes, or (None, None) when not configured."""
+    if not EMBEDDING_DIR:
+        return None, None
+    os.makedirs(EMBEDDING_DIR, exist_ok=True)
+    # Percent-encoded like snapshot paths, so distinct ids never share files
+    base = os.path.join(EMBEDDING_DIR, quote(conversation_id, safe=""))
+    return (
+        VectorIndex.open(f"{base}.recall", EMBEDDING_DIM),
+        VectorIndex.open(f"{base}.facts", EMBEDDING_DIM),
+    )
+
+
+def initialize_controller_state(controller, conversation_id=None):
+    """
+    Per-session state. The DB session proxy, model registry and the
+    memory compactor come from the shared ResourceHub
+    (orchestrator.resource_hub) and are already on the controller.
+    """
+    log_debug(
+        "🔥 ENTERED controller_init.initialize_controller_state() 🔥",
+        phase="controller",
+    )
 
     # ---------------------------------------------------------
-    # 2. Emotional engine
+    # 1. Emotional engine
     # ---------------------------------------------------------
     controller.emotional_memory = EmotionalMemory()
     controller.emotional_state = EmotionalState()
 
     # ---------------------------------------------------------
-    # 3. Model registry (auto-loads nodes/models from DB)
-    # ---------------------------------------------------------
-    controller.registry = ModelRegistry(controller.db)
-
-    log_debug("[INIT] Model registry initialized", phase="controller")
-
-    # ---------------------------------------------------------
-    # 4. Core context
+    # 2. Core context
     # ---------------------------------------------------------
-    controller.context = ContinuumContext(conversation_id=str(uuid.uuid4()))
+    controller.context = ContinuumContext(
+        conversation_id=conversation_id or str(uuid.uuid4())
+    )
     controller.context.emotional_state = controller.emotional_state
     controller.context.emotional_memory = controller.emotional_memory
+    # Episodes and facts are embedded as they are stored (the embedding
+    # model loads on first use) and recalled via the hybrid retriever
+    recall_vectors, fact_vectors = _open_vector_indexes(
+        controller.context.conversation_id
+    )
+    controller.vector_indexes = [
+        v for v in (recall_vectors, fact_vectors) if v is not None
+    ]
+    controller.memory_store = MemoryStore()
+    controller.memory_retriever = MemoryRetriever(
+        embed_fn=embed, vectors=recall_vectors
+    )
+    controller.episodic_memory = EpisodicMemory(
+        store=controller.memory_store, retriever=controller.memory_retriever
+    )
+    controller.context.semantic_memory = SemanticMemory(
+        store=controller.memory_store,
+        index=fact_vectors,
+        retriever=controller.memory_retriever,
+    )
+    controller.context.memory_retriever = controller.memory_retriever
+    controller.context.memory_summarizer = MemorySummarizer(controller.memory_store)
     controller.context.debug_flags["show_prompts"] = True
 
+    # TTL / importance eviction and duplicate merging off the turn path,
+    # on the hub's compactor thread (removed again by controller.close())
+    controller.compaction_tiers = [
+        EpisodeTier(controller.memory_store, retriever=controller.memory_retriever),
+        KeyValueTier(controller.context.memory),
+        EmotionalEventTier(controller.emotional_memory),
+    ]
+    if controller.memory_compactor is not None:
+        controller.memory_compactor.add_tiers(controller.compaction_tiers)
+
+    # Opt-in: log where each assistant message came from
+    if os.getenv("CONTINUUM_DEBUG_MESSAGES") == "1":
+        from continuum.debug.context_observers import log_message_origin
+        controller.context.subscribe(MESSAGE_ADDED, log_message_origin)
+
     # ---------------------------------------------------------
-    # 5. Meta‑Persona rewrite flags
+    # 3. Meta‑Persona rewrite flags
     # ---------------------------------------------------------
     controller.flags = {"enable_meta_llm": True}
 
@@ -19,30 +19,57 @@ from continuum.core.logger import log_debug
 
 
 
-def initialize_pipelines(controller):
+def initialize_shared_pipelines(hub):
     """
-    Initializes all pipeline components:
-      - Emotion detection
+    Pipeline components shared by every session (see
+    orchestrator.resource_hub): they keep no per-conversation state.
+      - Emotion detection (model loaded on first use)
       - Emotional state manager
-      - Emotional arc engine + pipeline
-      - Fusion pipeline
       - Meta‑Persona + Meta‑Pipeline
     """
 
     # ---------------------------------------------------------
     # 1. Emotion detection + state manager
     # ---------------------------------------------------------
-    controller.emotion_detector = EmotionDetector()
-    controller.state_manager = EmotionalStateManager()
+    hub.emotion_detector = EmotionDetector()
+    hub.state_manager = EmotionalStateManager()
 
     # ---------------------------------------------------------
-    # 2. Emotional arc engine + pipeline
+    # 2. Meta‑Persona + Meta‑Pipeline
+    # ---------------------------------------------------------
+    hub.meta_persona = MetaPersona(
+        name="The Continuum",
+        voice="Warm, precise, collaborative",
+        traits={
+            "architect": "Thinks in systems",
+            "storyweaver": "Uses metaphor to make complexity intuitive",
+            "deliberative": "Surfaces tradeoffs gracefully",
+        },
+    )
+
+    hub.meta_pipeline = MetaPipeline(hub.meta_persona)
+
+    log_debug(
+        "[PIPELINES] Emotion detection and Meta‑Persona pipelines initialized",
+        phase="controller",
+    )
+
+
+def initialize_pipelines(controller):
+    """
+    Per-session pipeline components:
+      - Emotional arc engine + pipeline
+      - Fusion pipeline
+    """
+
+    # ---------------------------------------------------------
+    # 1. Emotional arc engine + pipeline
     # ---------------------------------------------------------
     controller.emotional_arc_engine = EmotionalArcEngine()
     controller.arc_pipeline = ArcPipeline(controller.emotional_arc_engine)
 
     # ---------------------------------------------------------
-    # 3. Fusion pipeline (Phase‑5)
+    # 2. Fusion pipeline (Phase‑5)
     # ---------------------------------------------------------
     controller.fusion_engine = FusionEngine(controller)
     controller.fusion_filters = FusionFilters(controller)
@@ -53,19 +80,6 @@ def initialize_pipelines(controller):
         fusion_filters=controller.fusion_filters,
     )
 
-    # ---------------------------------------------------------
-    # 4. Meta‑Persona + Meta‑Pipeline
-    # ---------------------------------------------------------
-    controller.meta_persona = MetaPersona(
-        name="The Continuum",
-        voice="Warm, precise, collaborative",
-        traits={
-            "architect": "Thinks in systems",
-            "storyweaver": "Uses metaphor to make complexity intuitive",
-            "deliberative": "Surfaces tradeoffs gracefully",
-        },
+    log_debug(
+        "[PIPELINES] Emotional arc and Fusion pipelines initialized", phase="controller"
     )
-
-    controller.meta_pipeline = MetaPipeline(controller.meta_persona)
-
-    log_debug("[PIPELINES] Emotion, Fusion, and Meta‑Persona pipelines initialized", phase="controller")
\ No newline at end of file
@@ -1,7 +1,10 @@
 # continuum/orchestrator/controller_process.py
 # Modernized message‑processing pipeline for ContinuumController
 
-from continuum.core.logger import log_debug, log_error
+from continuum.core.logger import debug_enabled, log_debug, log_error
+from continuum.core.tracing import current_trace_id
+from continuum.core.turn_store import TurnRecord
+from continuum.memory.facts import remember_facts
 
 
 def process_message(controller, message: str) -> str:
@@ -17,9 +20,11 @@ def process_message(controller, message: str) -> str:
       - Meta‑Persona rewrite
       - Emotional arc recording
       - Turn logging
+      - Episodic memory recording
+      - Semantic facts the user states about themselves
     """
 
-    log_error("🔥 ENTERED controller_process.process_message() 🔥", phase="controller")
+    log_debug("🔥 ENTERED controller_process.process_message() 🔥", phase="controller")
 
     # ---------------------------------------------------------
     # 0. Add user message to context
@@ -30,7 +35,12 @@ def process_message(controller, message: str) -> str:
     # 1. Emotion detection
     # ---------------------------------------------------------
     raw_state, dominant_emotion, intensity = controller.emotion_detector.detect(message)
-    log_debug(f"[PROCESS] Emotion detected: {dominant_emotion} ({intensity})", phase="emotion")
+    log_debug(
+        "[PROCESS] Emotion detected: %s (%s)",
+        dominant_emotion,
+        intensity,
+        phase="emotion",
+    )
 
     controller.emotional_memory.add_event(
         raw_state=raw_state,
@@ -47,7 +57,7 @@ def process_message(controller, message: str) -> str:
     # 2. Senate → Jury deliberation
     #    (Router-aware: routing info available on controller)
     # ---------------------------------------------------------
-    log_error("🔥 CALLING DELIBERATION ENGINE 🔥", phase="delib")
+    log_debug("🔥 CALLING DELIBERATION ENGINE 🔥", phase="delib")
 
     routing = controller.last_routing_decision or {}
     intent = routing.get("intent")
@@ -63,20 +73,21 @@ def process_message(controller, message: str) -> str:
         emotional_memory=controller.emotional_memory,
     )
 
-    log_debug(f"[PROCESS] Final proposal from Jury: {final_proposal}", phase="delib")
+    if debug_enabled():
+        log_debug("[PROCESS] Final proposal: %r", final_proposal, phase="delib")
 
     # ---------------------------------------------------------
     # 3. Fusion adjust
     # ---------------------------------------------------------
-    log_error("🔥 CALLING FUSION ADJUST 🔥", phase="fusion")
+    log_debug("🔥 CALLING FUSION ADJUST 🔥", phase="fusion")
 
     fusion_weights = controller.fusion_pipeline.adjust(final_proposal)
-    log_debug(f"[PROCESS] Fusion weights: {fusion_weights}", phase="fusion")
+    log_debug("[PROCESS] Fusion weights: %s", fusion_weights, phase="fusion")
 
     # ---------------------------------------------------------
     # 4. Fusion run
     # ---------------------------------------------------------
-    log_error("🔥 CALLING FUSION RUN 🔥", phase="fusion")
+    log_debug("🔥 CALLING FUSION RUN 🔥", phase="fusion")
 
     final_text = controller.fusion_pipeline.run(
         fusion_weights=fusion_weights,
@@ -85,7 +96,7 @@ def process_message(controller, message: str) -> str:
         routing=routing,            # ⭐ NEW: routing available to Fusion
     )
 
-    log_debug(f"[PROCESS] Final text before rewrite: {final_text}", phase="fusion")
+    log_debug("[PROCESS] Final text before rewrite: %s", final_text, phase="fusion")
 
     # Store the fused output as the final proposal
     controller.last_final_proposal = {
@@ -102,7 +113,7 @@ def process_message(controller, message: str) -> str:
     # ---------------------------------------------------------
     # 5. Meta‑Persona rewrite
     # ---------------------------------------------------------
-    log_error("🔥 CALLING META‑PERSONA REWRITE 🔥", phase="meta")
+    log_debug("🔥 CALLING META‑PERSONA REWRITE 🔥", phase="meta")
 
     rewritten = controller.meta_rewrite_llm(
         core_text=final_text,
@@ -110,7 +121,7 @@ def process_message(controller, message: str) -> str:
         routing=routing,            # ⭐ NEW: routing available to rewrite layer
     )
 
-    log_debug(f"[PROCESS] Rewritten output: {rewritten}", phase="meta")
+    log_debug("[PROCESS] Rewritten output: %s", rewritten, phase="meta")
     controller.context.add_assistant_message(rewritten)
 
     # ---------------------------------------------------------
@@ -126,11 +137,31 @@ def process_message(controller, message: str) -> str:
     # ---------------------------------------------------------
     # 7. Turn logging
     # ---------------------------------------------------------
-    controller.turn_logger.append({
-        "message": final_text,
-        "emotion": controller.emotional_state,
-        "proposals": ranked,
-        "routing": routing,         # ⭐ NEW: routing logged for UI/debug
-    })
+    turn_id = current_trace_id()
+    controller.turn_store.append(TurnRecord.from_turn(
+        turn_id=turn_id,
+        user_message=message,
+        assistant_output=rewritten,
+        dominant_emotion=dominant_emotion,
+        intensity=intensity,
+        final_proposal=final_proposal,
+        ranked=ranked,
+        routing=routing,
+    ))
+
+    # ---------------------------------------------------------
+    # 8. Episodic memory (recallable from the next turn on)
+    # ---------------------------------------------------------
+    controller.episodic_memory.record(controller.context, episode_id=turn_id)
+
+    # ---------------------------------------------------------
+    # 9. Semantic memory ("my name is ...", "I live in ...")
+    # ---------------------------------------------------------
+    semantic = controller.context.semantic_memory
+    if semantic is not None:
+        try:
+            remember_facts(semantic, message)
+        except Exception as e:
+            log_error("[MEMORY] Fact extraction failed: %s", e, phase="memory")
 
     return rewritten
\ No newline at end of file
@@ -34,9 +34,4 @@ class LegacyUIFields:
         # Reasoning panel compatibility
         # ---------------------------------------------------------
         self.last_ranked_proposals = []  # Senate/Jury ranked proposals
-        self.last_final_proposal = None  # Final fused output
-
-        # ---------------------------------------------------------
-        # Turn timeline compatibility
-        # ---------------------------------------------------------
-        self.turn_history = []       # UI expects a list of turn dicts
\ No newline at end of file
+        self.last_final_proposal = None  # Final fused output
\ No newline at end of file
@@ -1,7 +1,7 @@
 # continuum/orchestrator/deliberation_engine.py
 
 from typing import List, Dict, Tuple
-from continuum.core.logger import log_info, log_debug, log_error
+from continuum.core.logger import debug_enabled, log_info, log_debug, log_error
 
 from continuum.emotion.state_machine import EmotionalState
 from continuum.persona.emotional_memory import EmotionalMemory
@@ -26,7 +26,7 @@ class DeliberationEngine:
         self.last_ranked_proposals: List[dict] = []
         self.last_final_proposal: dict | None = None
 
-        log_error("🔥🔥🔥 DELIBERATION ENGINE INITIALIZED 🔥🔥🔥", phase="delib")
+        log_debug("🔥🔥🔥 DELIBERATION ENGINE INITIALIZED 🔥🔥🔥", phase="delib")
         log_debug("[DELIB] Senate + Jury wired into DeliberationEngine", phase="delib")
 
     # ---------------------------------------------------------
@@ -41,7 +41,7 @@ class DeliberationEngine:
         emotional_memory: EmotionalMemory,
     ) -> Tuple[List[Dict], Dict]:
 
-        log_error("🔥🔥🔥 ENTERED DeliberationEngine.run() 🔥🔥🔥", phase="delib")
+        log_debug("🔥🔥🔥 ENTERED DeliberationEngine.run() 🔥🔥🔥", phase="delib")
         log_info("[DELIB] Starting Senate → Jury pipeline", phase="delib")
 
         # ---------------------------------------------------------
@@ -52,10 +52,14 @@ class DeliberationEngine:
         metadata = {}
         telemetry = {}
 
+        # Recall once per turn: the actors' prompts (get_memory_summary in
+        # BaseLLMActor) and Aira hit the retriever's per-turn cache
+        memory_summary = context.get_memory_summary(message)
+
         # ---------------------------------------------------------
         # 2. Senate deliberation (Phase‑4 signature)
         # ---------------------------------------------------------
-        log_error("🔥🔥🔥 CALLING SENATE.deliberate() 🔥🔥🔥", phase="senate")
+        log_debug("🔥🔥🔥 CALLING SENATE.deliberate() 🔥🔥🔥", phase="senate")
 
         ranked_proposals = self.senate.deliberate(
             context=context,
@@ -71,8 +75,15 @@ class DeliberationEngine:
 
         self.last_ranked_proposals = ranked_proposals
 
-        log_debug(f"[DELIB] Senate produced {len(ranked_proposals)} proposals", phase="senate")
-        log_debug(f"[DELIB] Ranked proposals dump: {ranked_proposals}", phase="senate")
+        log_debug(
+            "[DELIB] Senate produced %d proposals",
+            len(ranked_proposals),
+            phase="senate",
+        )
+        if debug_enabled():
+            log_debug(
+                "[DELIB] Ranked proposals dump: %r", ranked_proposals, phase="senate"
+            )
 
         if not ranked_proposals:
             log_error("🔥🔥🔥 ERROR: Senate returned NO proposals 🔥🔥🔥", phase="senate")
@@ -81,19 +92,20 @@ class DeliberationEngine:
         # ---------------------------------------------------------
         # 3. Jury adjudication
         # ---------------------------------------------------------
-        log_error("🔥🔥🔥 CALLING JURY.adjudicate() 🔥🔥🔥", phase="jury")
+        log_debug("🔥🔥🔥 CALLING JURY.adjudicate() 🔥🔥🔥", phase="jury")
         log_info("[DELIB] Starting Jury adjudication", phase="jury")
 
         final_proposal = self.jury.adjudicate(
             ranked_proposals,
             message=message,
             user_emotion=emotional_memory.get_smoothed_state(),
-            memory_summary=context.get_memory_summary(),
+            memory_summary=memory_summary,
             emotional_state=EmotionalState.from_dict(emotional_state.as_dict()),
         )
 
         self.last_final_proposal = final_proposal
 
-        log_debug(f"[DELIB] Jury final proposal: {final_proposal}", phase="jury")
+        if debug_enabled():
+            log_debug("[DELIB] Jury final proposal: %r", final_proposal, phase="jury")
 
         return ranked_proposals, final_proposal
\ No newline at end of file
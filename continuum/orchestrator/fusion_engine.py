@@ -1,7 +1,8 @@
 # continuum/orchestrator/fusion_engine.py
 # Modernized Fusion Engine (Router-aware, model-agnostic)
 
-from continuum.core.logger import log_debug, log_error
+from continuum.core.logger import log_debug
+from continuum.core.tracing import traced
 
 
 class FusionEngine:
@@ -20,6 +21,7 @@ class FusionEngine:
     # ---------------------------------------------------------
     # Main fusion entry point
     # ---------------------------------------------------------
+    @traced("fusion.run")
     def run(self, fusion_weights, ranked_proposals, controller, routing=None):
         """
         Execute the fusion process.
@@ -36,7 +38,7 @@ class FusionEngine:
 
         routing = routing or controller.last_routing_decision
 
-        log_error("🔥 FUSION ENGINE START (Router-aware) 🔥", phase="fusion")
+        log_debug("🔥 FUSION ENGINE START (Router-aware) 🔥", phase="fusion")
 
         # ---------------------------------------------------------
         # 1. Extract proposal texts
@@ -48,8 +50,11 @@ class FusionEngine:
             weight = fusion_weights.get(actor, 1.0)
 
             log_debug(
-                f"[FUSION] Actor={actor} Weight={weight} ContentPreview={content[:60]}",
-                phase="fusion"
+                "[FUSION] Actor=%s Weight=%s ContentPreview=%s",
+                actor,
+                weight,
+                content[:60],
+                phase="fusion",
             )
 
             texts.append((actor, content, weight))
@@ -63,11 +68,10 @@ class FusionEngine:
         # 3. Attach routing metadata for downstream layers
         # ---------------------------------------------------------
         log_debug(
-            f"[FUSION] Routing metadata passed through: {routing}",
-            phase="fusion"
+            "[FUSION] Routing metadata passed through: %s", routing, phase="fusion"
         )
 
-        log_error("🔥 FUSION ENGINE COMPLETE 🔥", phase="fusion")
+        log_debug("🔥 FUSION ENGINE COMPLETE 🔥", phase="fusion")
         return fused
 
     # ---------------------------------------------------------
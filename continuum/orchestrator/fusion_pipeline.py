@@ -1,7 +1,7 @@
 # continuum/orchestrator/fusion_pipeline.py
 # Modernized Fusion pipeline (Router-aware)
 
-from continuum.core.logger import log_debug, log_error
+from continuum.core.logger import log_debug
 
 
 class FusionPipeline:
@@ -31,8 +31,9 @@ class FusionPipeline:
         routing = self.controller.last_routing_decision
 
         log_debug(
-            f"[FUSION] Adjusting fusion weights (intent={routing.get('intent') if routing else None})",
-            phase="fusion"
+            "[FUSION] Adjusting fusion weights (intent=%s)",
+            routing.get("intent") if routing else None,
+            phase="fusion",
         )
 
         # Existing logic unchanged
@@ -52,7 +53,7 @@ class FusionPipeline:
 
         routing = routing or controller.last_routing_decision
 
-        log_error("🔥 FUSION ENGINE RUN (Router-aware) 🔥", phase="fusion")
+        log_debug("🔥 FUSION ENGINE RUN (Router-aware) 🔥", phase="fusion")
 
         fused = self.fusion_engine.run(
             fusion_weights=fusion_weights,
@@ -61,6 +62,6 @@ class FusionPipeline:
             routing=routing,   # ⭐ NEW: routing passed into fusion engine
         )
 
-        log_debug(f"[FUSION] Fused output: {fused}", phase="fusion")
+        log_debug("[FUSION] Fused output: %s", fused, phase="fusion")
 
         return fused
\ No newline at end of file
@@ -1,6 +1,9 @@
 # continuum/orchestrator/jury.py
+import time
 from typing import List, Dict, Any, Optional
 
+from continuum.core.tracing import traced
+from continuum.monitoring.metrics import JURY_DURATION, JURY_PROPOSALS_TOTAL
 from continuum.orchestrator.jury_rubric import score_proposal
 from continuum.emotion.jury_adaptive_weights import compute_adaptive_weights
 
@@ -21,6 +24,7 @@ class Jury:
     # ---------------------------------------------------------
     # SCORE ALL PROPOSALS
     # ---------------------------------------------------------
+    @traced("jury.score_all")
     def score_all(
         self,
         message: str,
@@ -29,6 +33,7 @@ class Jury:
         memory_summary: str = "",
     ) -> Dict[str, Dict[str, float]]:
 
+        start = time.perf_counter()
         all_contents = [p.get("content", "") for p in proposals]
         scored: Dict[str, Dict[str, float]] = {}
 
@@ -61,6 +66,8 @@ class Jury:
                 embed_fn=self.embed_fn,
             )
 
+        JURY_PROPOSALS_TOTAL.inc(len(proposals))
+        JURY_DURATION.observe(time.perf_counter() - start)
         return scored
 
     # ---------------------------------------------------------
@@ -21,9 +21,6 @@ def apply_legacy_defaults(controller):
     # Reasoning panel (Senate/Jury ranked proposals)
     controller.last_ranked_proposals = []
 
-    # Turn timeline panel
-    controller.turn_history = []
-
     # Fusion debug output
     controller.last_raw_actor_output = ""
 
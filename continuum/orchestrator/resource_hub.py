@@ -0,0 +1,399 @@
+# continuum/orchestrator/resource_hub.py
+
+"""
+Process-wide resources shared by every conversation, and the sessions
+that use them.
+
+    hub = get_resource_hub()                  # built once per process
+    sessions = get_session_manager()
+    controller = sessions.get(session_id)     # live, restored, or new
+
+ResourceHub owns everything that is expensive to build or must be
+process-wide:
+    db, registry        scoped session proxy + ModelRegistry (one load);
+                        pending schema migrations are applied first
+    llm_client          pooled keep-alive HTTP client
+    router              intent classifier + model/node selectors
+    actors, senate      LLM actors, Senate wrappers, Jury
+    executor            thread pool the Senate runs actors on
+    emotion_detector    emotion model (loaded on first use)
+    meta_persona        Meta-Persona + pipeline
+    memory_compactor    one compaction thread for all sessions' tiers
+    health_monitor      node pings; flushes the per-node latency histograms
+    health_retention    node_health rollups + pruning
+    selector_refresher  reloads the hybrid model selector's snapshot
+    metrics_server      optional /metrics endpoint
+
+A ContinuumController is then a per-session object: it borrows the
+shared resources and holds only conversation state (context, memories,
+emotional state, arc history, turn store, UI fields). None of the shared
+objects keep per-conversation state; per-call data (endpoint, routing)
+is passed as arguments.
+
+SessionManager keeps the live controllers in LRU order. Sessions idle
+for longer than CONTINUUM_SESSION_IDLE_S, or beyond
+CONTINUUM_MAX_SESSIONS, are snapshotted (core.snapshot) and dropped; the
+next get() for that id restores them. See bench/bench_sessions.py for
+the per-session footprint.
+
+Environment:
+    CONTINUUM_HUB_WORKERS      Senate thread pool size (default 32)
+    CONTINUUM_MAX_SESSIONS     live sessions kept in memory (default 1000)
+    CONTINUUM_SESSION_IDLE_S   idle seconds before a session is parked (default 1800)
+    CONTINUUM_HEALTH_INTERVAL  seconds between node health sweeps (default 5, 0 = off)
+    CONTINUUM_HEALTH_RETENTION_INTERVAL
+                               seconds between retention cycles (default 300, 0 = off)
+    CONTINUUM_MODEL_STRATEGY   "hybrid" (default): rank models from an in-memory
+                               snapshot (router.hybrid_selector); "db": query
+                               model_nodes on every selection
+    CONTINUUM_SELECTOR_REFRESH_INTERVAL
+                               seconds between selector snapshot reloads (default 30)
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+
+from continuum.core.logger import log_debug, log_error, log_info
+from continuum.core.snapshot import ConversationSnapshotter
+from continuum.db.health_monitor import HEALTH_INTERVAL, HealthMonitor
+from continuum.db.health_retention import RETENTION_INTERVAL, HealthRetentionJob
+from continuum.db.migrations import apply_migrations
+from continuum.db.registry import ModelRegistry
+from continuum.db.sqlalchemy_connection import get_engine, get_scoped_session
+from continuum.llm.llm_client import LLMClient
+from continuum.memory.compaction import COMPACTION_INTERVAL, MemoryCompactor
+from continuum.monitoring.metrics import start_metrics_server
+from continuum.orchestrator.controller.controller_actors import (
+    initialize_actors_and_senate,
+)
+from continuum.orchestrator.controller.controller_pipelines import (
+    initialize_shared_pipelines,
+)
+from continuum.orchestrator.router.hybrid_selector import (
+    HybridSelectionStrategy,
+    SnapshotRefresher,
+)
+from continuum.orchestrator.router.router import Router
+
+HUB_WORKERS = int(os.getenv("CONTINUUM_HUB_WORKERS", 32))
+MAX_SESSIONS = int(os.getenv("CONTINUUM_MAX_SESSIONS", 1000))
+SESSION_IDLE_S = float(os.getenv("CONTINUUM_SESSION_IDLE_S", 1800))
+MODEL_STRATEGY = os.getenv("CONTINUUM_MODEL_STRATEGY", "hybrid")
+SELECTOR_REFRESH_S = float(os.getenv("CONTINUUM_SELECTOR_REFRESH_INTERVAL", 30))
+
+DEFAULT_REWRITE_MODEL = "gemma3:4b"
+
+
+# ---------------------------------------------------------
+# Shared resources
+# ---------------------------------------------------------
+class ResourceHub:
+    # Attributes every controller borrows from the hub
+    SHARED = (
+        "hub",
+        "logger",
+        "db",
+        "registry",
+        "rewrite_model",
+        "intent_classifier",
+        "router",
+        "llm_client",
+        "actors",
+        "senate_actors",
+        "senate_members",
+        "senate",
+        "jury",
+        "emotion_detector",
+        "state_manager",
+        "meta_persona",
+        "meta_pipeline",
+        "memory_compactor",
+    )
+
+    def __init__(self, workers: int = HUB_WORKERS):
+        from continuum.core.logger import logger as continuum_logger
+        from continuum.orchestrator.continuum_controller import BasicIntentClassifier
+
+        started = time.perf_counter()
+        self.hub = self
+        self.logger = continuum_logger
+
+        # Thread-scoped session proxy: each thread still gets its own session
+        self.db = get_scoped_session()
+        self._migrate()
+        self.registry = ModelRegistry(self.db)
+        self.rewrite_model = self._load_rewrite_model()
+
+        self.intent_classifier = BasicIntentClassifier()
+        self.router = Router(
+            intent_classifier=self.intent_classifier,
+            db_conn=self.db,
+            logger_instance=self.logger,
+            model_strategy=self._model_strategy(),
+        )
+        self.llm_client = LLMClient()
+
+        # Actors keep no per-conversation state; the controller is passed per call
+        initialize_actors_and_senate(self)
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="senate"
+        )
+        self.senate.executor = self.executor
+
+        initialize_shared_pipelines(self)
+
+        self.memory_compactor = None
+        if COMPACTION_INTERVAL > 0:
+            self.memory_compactor = MemoryCompactor([])
+            self.memory_compactor.start()
+
+        # Node pings + latency histogram flushes, and node_health retention
+        self.health_monitor = None
+        if HEALTH_INTERVAL > 0:
+            self.health_monitor = HealthMonitor(
+                self.db, self.registry, interval_seconds=HEALTH_INTERVAL
+            )
+            self.health_monitor.start()
+
+        self.health_retention = None
+        if RETENTION_INTERVAL > 0:
+            self.health_retention = HealthRetentionJob(
+                self.db, interval_seconds=RETENTION_INTERVAL
+            )
+            self.health_retention.start()
+
+        # Optional /metrics endpoint (set CONTINUUM_METRICS_PORT to enable)
+        self.metrics_server = (
+            start_metrics_server() if os.getenv("CONTINUUM_METRICS_PORT") else None
+        )
+
+        log_info(
+            "[HUB] Shared resources ready in %.0f ms",
+            (time.perf_counter() - started) * 1000,
+            phase="controller",
+        )
+
+    def _migrate(self) -> None:
+        # Idempotent; readers of the newer tables tolerate them missing
+        try:
+            apply_migrations(get_engine())
+        except Exception as e:
+            log_error("[HUB] Schema migrations failed: %s", e, phase="db")
+
+    def _model_strategy(self) -> Optional[HybridSelectionStrategy]:
+        """The hybrid selector, or None to select models from the DB."""
+        self.selector_refresher = None
+        if MODEL_STRATEGY != "hybrid":
+            return None
+        refresher = SnapshotRefresher(self.db, interval_seconds=SELECTOR_REFRESH_S)
+        if not refresher.refresh().loaded_at:
+            # Selector tables unreadable (refresh() logged why)
+            log_info(
+                "[HUB] No selector snapshot; selecting models from the DB", phase="db"
+            )
+            return None
+        refresher.start()
+        self.selector_refresher = refresher
+        return HybridSelectionStrategy(refresher)
+
+    def _load_rewrite_model(self) -> str:
+        try:
+            row = self.db.execute(
+                text("SELECT pinned_model FROM rewrite_config LIMIT 1")
+            ).fetchone()
+            return row[0] if row and row[0] else DEFAULT_REWRITE_MODEL
+        except Exception as e:
+            log_error(f"[REWRITE CONFIG] Failed to load rewrite model: {e}")
+            return "llama3.2:latest"
+
+    def share_with(self, controller) -> None:
+        for name in self.SHARED:
+            setattr(controller, name, getattr(self, name))
+
+    def shutdown(self) -> None:
+        for job in (
+            self.memory_compactor,
+            self.health_monitor,
+            self.health_retention,
+            self.selector_refresher,
+        ):
+            if job is not None:
+                job.stop()
+        self.executor.shutdown(wait=False)
+        self.llm_client.session.close()
+
+
+_hub: Optional[ResourceHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_resource_hub() -> ResourceHub:
+    """The process-wide hub, built on first use."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = ResourceHub()
+    return _hub
+
+
+# ---------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------
+class SessionEntry:
+    __slots__ = ("controller", "last_used")
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.last_used = time.monotonic()
+
+
+class SessionManager:
+    """
+    Live controllers by session id, least recently used first. Sessions
+    are parked (snapshotted, then dropped) when idle too long or when
+    there are more than max_sessions; get() brings them back.
+
+    The snapshot holds the whole session, episodic and semantic memory
+    and the rolling summary included (see core.snapshot), so a returning
+    user keeps them. Bringing a session back re-embeds its episodes and
+    facts to rebuild recall.
+    """
+
+    def __init__(
+        self,
+        hub: Optional[ResourceHub] = None,
+        max_sessions: int = MAX_SESSIONS,
+        idle_seconds: float = SESSION_IDLE_S,
+        snapshot_dir: Optional[str] = None,
+    ):
+        self._hub = hub
+        self.max_sessions = max(1, max_sessions)
+        self.idle_seconds = idle_seconds
+        self.snapshot_dir = snapshot_dir
+        self._sessions: "OrderedDict[str, SessionEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.opened = 0
+        self.restored = 0
+        self.parked = 0
+
+    @property
+    def hub(self) -> ResourceHub:
+        if self._hub is None:
+            self._hub = get_resource_hub()
+        return self._hub
+
+    def _build(self, session_id: str):
+        from continuum.orchestrator.continuum_controller import ContinuumController
+
+        controller = ContinuumController(hub=self.hub, conversation_id=session_id)
+        if controller.snapshotter is None:
+            # Parking needs snapshots even when per-turn autosave is off
+            controller.snapshotter = ConversationSnapshotter(
+                controller, directory=self.snapshot_dir
+            )
+        return controller
+
+    def get(self, session_id: Optional[str] = None):
+        """The session's controller: live, restored from its snapshot, or new."""
+        with self._lock:
+            self.park_idle()
+            if session_id is not None:
+                entry = self._sessions.get(session_id)
+                if entry is not None:
+                    entry.last_used = time.monotonic()
+                    self._sessions.move_to_end(session_id)
+                    return entry.controller
+
+            session_id = session_id or str(uuid.uuid4())
+            controller = self._build(session_id)
+            try:
+                restored = controller.snapshotter.restore(session_id)
+            except Exception as e:
+                log_error(
+                    "[SESSIONS] Could not restore %s, starting fresh: %s",
+                    session_id,
+                    e,
+                    phase="controller",
+                )
+                restored = False
+            if restored:
+                self.restored += 1
+                log_debug("[SESSIONS] Restored %s", session_id, phase="controller")
+            else:
+                self.opened += 1
+            self._sessions[session_id] = SessionEntry(controller)
+
+            while len(self._sessions) > self.max_sessions:
+                self._park(next(iter(self._sessions)))
+            return controller
+
+    def close(self, session_id: str, save: bool = True) -> bool:
+        """End a session; with save, its snapshot is kept for a later get()."""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        if save:
+            try:
+                entry.controller.snapshotter.save()
+            except Exception as e:
+                log_error(
+                    "[SESSIONS] Failed to save %s: %s",
+                    session_id,
+                    e,
+                    phase="controller",
+                )
+        entry.controller.close()
+        return True
+
+    def _park(self, session_id: str) -> None:
+        if self.close(session_id, save=True):
+            self.parked += 1
+            log_debug("[SESSIONS] Parked %s", session_id, phase="controller")
+
+    def park_idle(self, now: Optional[float] = None) -> int:
+        """Park sessions idle longer than idle_seconds; returns how many."""
+        now = time.monotonic() if now is None else now
+        parked = 0
+        with self._lock:
+            while self._sessions:
+                session_id, entry = next(iter(self._sessions.items()))
+                if now - entry.last_used < self.idle_seconds:
+                    break
+                self._park(session_id)
+                parked += 1
+        return parked
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "live": len(self._sessions),
+            "opened": self.opened,
+            "restored": self.restored,
+            "parked": self.parked,
+        }
+
+
+_sessions: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    global _sessions
+    if _sessions is None:
+        with _hub_lock:
+            if _sessions is None:
+                _sessions = SessionManager()
+    return _sessions
@@ -0,0 +1,232 @@
+# continuum/orchestrator/router/hybrid_selector.py
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from continuum.core.logger import log_debug, log_error
+
+DEFAULT_MODEL = "llama3.2:latest"
+
+
+def normalize_model_name(name: str) -> str:
+    """Ensure the Ollama-style ':latest' suffix (matches ModelSelectorV2)."""
+    return name if ":" in name else name + ":latest"
+
+
+# ---------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class SelectorSnapshot:
+    """
+    Immutable, in-memory copy of everything the hybrid selector reads.
+
+    Replaced wholesale by the refresher, so readers never see a
+    half-updated view and never need a lock.
+    """
+
+    models: Tuple[str, ...] = ()
+    # (model_name, actor_role or None) -> stats row
+    model_stats: Dict[Tuple[str, Optional[str]], dict] = field(default_factory=dict)
+    # actor_name -> {model_name: preference_weight}
+    actor_preferences: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    pinned_model: Optional[str] = None
+    forbidden_models: Tuple[str, ...] = ()
+    loaded_at: float = 0.0
+
+    def stats_for(self, model: str, role: Optional[str]) -> Optional[dict]:
+        return self.model_stats.get((model, role)) or self.model_stats.get(
+            (model, None)
+        )
+
+
+def _parse_forbidden(raw) -> Tuple[str, ...]:
+    if not raw:
+        return ()
+    if isinstance(raw, (list, tuple)):
+        return tuple(normalize_model_name(m) for m in raw)
+    try:
+        return tuple(normalize_model_name(m) for m in json.loads(raw))
+    except (TypeError, ValueError):
+        return ()
+
+
+def load_snapshot(db) -> SelectorSnapshot:
+    """Read model_nodes, model_stats, actor_model_preferences and rewrite_config."""
+    models = db.execute(
+        text("SELECT DISTINCT model_name FROM model_nodes")
+    ).scalars().all()
+
+    stats = {}
+    for r in db.execute(text(
+        "SELECT model_name, actor_role, success_rate, avg_latency_ms, "
+        "avg_cost_per_call, total_calls, total_failures FROM model_stats"
+    )).mappings():
+        stats[(normalize_model_name(r["model_name"]), r["actor_role"])] = dict(r)
+
+    prefs: Dict[str, Dict[str, float]] = {}
+    for r in db.execute(text(
+        "SELECT actor_name, model_name, preference_weight FROM actor_model_preferences"
+    )).mappings():
+        prefs.setdefault(r["actor_name"], {})[normalize_model_name(r["model_name"])] = (
+            float(r["preference_weight"] or 0.0)
+        )
+
+    rewrite = db.execute(
+        text("SELECT pinned_model, forbidden_models FROM rewrite_config LIMIT 1")
+    ).mappings().first()
+
+    return SelectorSnapshot(
+        models=tuple(sorted({normalize_model_name(m) for m in models})),
+        model_stats=stats,
+        actor_preferences=prefs,
+        pinned_model=(
+            normalize_model_name(rewrite["pinned_model"])
+            if rewrite and rewrite["pinned_model"]
+            else None
+        ),
+        forbidden_models=(
+            _parse_forbidden(rewrite["forbidden_models"]) if rewrite else ()
+        ),
+        loaded_at=time.time(),
+    )
+
+
+class SnapshotRefresher(threading.Thread):
+    """
+    Background thread that reloads the SelectorSnapshot every
+    interval_seconds. On failure the previous snapshot stays in place.
+
+    Give it its own DB session: it runs concurrently with the router.
+    """
+
+    def __init__(self, db_session, interval_seconds: int = 30):
+        super().__init__(daemon=True)
+        self.db = db_session
+        self.interval = interval_seconds
+        self.snapshot = SelectorSnapshot()
+        self.running = True
+
+    def refresh(self) -> SelectorSnapshot:
+        try:
+            self.snapshot = load_snapshot(self.db)
+            log_debug(
+                "[HybridSelector] Snapshot refreshed: %d models, %d stats rows",
+                len(self.snapshot.models),
+                len(self.snapshot.model_stats),
+                phase="selector",
+            )
+        except Exception as e:
+            self.db.rollback()
+            log_error(
+                f"[HybridSelector] Snapshot refresh failed: {e}", phase="selector"
+            )
+        return self.snapshot
+
+    def run(self):
+        while self.running:
+            time.sleep(self.interval)
+            self.refresh()
+
+    def stop(self):
+        self.running = False
+
+
+# ---------------------------------------------------------
+# Strategy
+# ---------------------------------------------------------
+class HybridSelectionStrategy:
+    """
+    Python port of ts/src/selector/hybridSelector.ts.
+
+    - rewriter role → rewrite_config.pinned_model
+    - otherwise every known model not in rewrite_config.forbidden_models
+      is scored by
+        actor preference weight × stats score
+      where the stats score rewards success rate and penalises latency.
+      Models without enough calls get a neutral stats score.
+
+    All reads go through the current snapshot; no I/O per selection.
+    """
+
+    def __init__(
+        self,
+        refresher: SnapshotRefresher,
+        min_calls: int = 5,
+        latency_scale_ms: float = 2000.0,
+    ):
+        self.refresher = refresher
+        self.min_calls = min_calls
+        self.latency_scale_ms = latency_scale_ms
+
+    @classmethod
+    def from_db(
+        cls, db_session, interval_seconds: int = 30, **kwargs
+    ) -> "HybridSelectionStrategy":
+        """Load the first snapshot synchronously, then refresh it in the background."""
+        refresher = SnapshotRefresher(db_session, interval_seconds=interval_seconds)
+        refresher.refresh()
+        refresher.start()
+        return cls(refresher, **kwargs)
+
+    @property
+    def snapshot(self) -> SelectorSnapshot:
+        return self.refresher.snapshot
+
+    def _stats_score(self, stats: Optional[dict]) -> float:
+        if not stats or (stats.get("total_calls") or 0) < self.min_calls:
+            return 1.0
+        success = float(stats.get("success_rate") or 0.0)
+        latency = float(stats.get("avg_latency_ms") or 0.0)
+        return (0.5 + 0.5 * success) / (1.0 + latency / self.latency_scale_ms)
+
+    def rank(
+        self,
+        actor: Optional[str],
+        role: Optional[str] = None,
+        default_model: Optional[str] = None,
+    ) -> List[dict]:
+        snap = self.snapshot
+
+        if role == "rewriter":
+            pinned = snap.pinned_model or default_model
+            return [{"model": pinned, "weight": 1.0}] if pinned else []
+
+        prefs = snap.actor_preferences.get(actor, {}) if actor else {}
+        forbidden = set(snap.forbidden_models)
+        models = [m for m in snap.models if m not in forbidden]
+        if default_model:
+            default_model = normalize_model_name(default_model)
+            if default_model not in models and default_model not in forbidden:
+                models.append(default_model)
+        if not models:
+            models = [DEFAULT_MODEL]
+
+        candidates = [
+            {
+                "model": m,
+                "weight": prefs.get(m, 1.0)
+                * self._stats_score(snap.stats_for(m, role)),
+            }
+            for m in models
+        ]
+
+        # Highest weight first; ties keep the default model on top
+        candidates.sort(key=lambda c: (-c["weight"], c["model"] != default_model))
+        return candidates
+
+    def select_model(
+        self, actor: str, role: str, default_model: str, tags=None, complexity=None
+    ) -> str:
+        """Same signature as ts_bridge.selector_client.select_model."""
+        candidates = self.rank(actor, role, default_model)
+        return (
+            candidates[0]["model"]
+            if candidates and candidates[0]["weight"] > 0
+            else default_model
+        )
@@ -11,13 +11,19 @@ class ModelSelectorV2:
       - Pull available models from DB (model_nodes table)
       - Normalize model names (ensure :latest suffix)
       - Return weighted candidates for routing
+
+    With a strategy (e.g. HybridSelectionStrategy) candidates are ranked
+    from the strategy's in-memory snapshot and the DB is not touched.
     """
 
-    def __init__(self, db, logger=None):
+    def __init__(self, db, logger=None, strategy=None):
         self.db = db
         self.logger = logger or (lambda *args, **kwargs: None)
+        self.strategy = strategy
 
-    def select_models(self, intent_name: str, actor_name: str = None):
+    def select_models(
+        self, intent_name: str, actor_name: str = None, actor_role: str = None
+    ):
         """
         Returns:
             {
@@ -29,6 +35,14 @@ class ModelSelectorV2:
             }
         """
 
+        if self.strategy is not None:
+            candidates = self.strategy.rank(actor_name, actor_role)
+            self.logger(
+                "info", f"[ModelSelectorV2] intent={intent_name}, actor={actor_name}"
+            )
+            self.logger("info", f"[ModelSelectorV2] candidates={candidates}")
+            return {"candidates": candidates}
+
         # ---------------------------------------------------------
         # 1. Pull all distinct model names from model_nodes
         # ---------------------------------------------------------
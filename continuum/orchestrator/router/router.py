@@ -1,8 +1,11 @@
 # continuum/orchestrator/router/router.py
 
+import time
 from typing import Optional, Dict, Any
 
 from continuum.core.logger import logger, log_debug, log_error, log_info
+from continuum.core.tracing import current_span, traced
+from continuum.monitoring.metrics import ROUTER_DECISIONS_TOTAL, ROUTER_DURATION
 
 from continuum.orchestrator.router.intent_classifier_contract import (
     IntentClassifierContract,
@@ -30,6 +33,7 @@ class Router:
         intent_classifier: IntentClassifierContract,
         db_conn=None,
         logger_instance=None,
+        model_strategy=None,
     ):
         # DB + logger wiring
         self.db = db_conn
@@ -37,7 +41,9 @@ class Router:
 
         # Core components
         self.intent_classifier = intent_classifier
-        self.model_selector = ModelSelectorV2(self.db, logger=self._log)
+        self.model_selector = ModelSelectorV2(
+            self.db, logger=self._log, strategy=model_strategy
+        )
         self.node_selector = NodeSelectorV2(self.db, logger=self._log)
 
     # -------------------------
@@ -60,13 +66,16 @@ class Router:
     # -------------------------
     # Public routing API
     # -------------------------
+    @traced("router.route")
     def route(
         self,
         user_text: str,
         actor_name: Optional[str] = None,
         extra_context: Optional[Dict[str, Any]] = None,
+        actor_role: Optional[str] = None,
     ) -> Dict[str, Any]:
 
+        start = time.perf_counter()
         extra_context = extra_context or {}
 
         # 1. Classify intent
@@ -77,6 +86,7 @@ class Router:
         model_selection = self.model_selector.select_models(
             intent_name=intent_result.intent,
             actor_name=actor_name,
+            actor_role=actor_role,
         )
 
         if not model_selection["candidates"]:
@@ -94,10 +104,22 @@ class Router:
             "matched_alias": intent_result.matched_alias,
             "raw_text": intent_result.raw_text or user_text,
             "actor_name": actor_name,
+            "actor_role": actor_role,
             "model_selection": model_selection,
             "node_selection": node_selection,
             "extra_context": extra_context,
         }
 
+        current_span().set(
+            intent=intent_result.intent,
+            model=top_model,
+            node=(node_selection.get("selected_node") or {}).get("name"),
+        )
+
+        ROUTER_DECISIONS_TOTAL.labels(
+            intent=intent_result.intent, model=top_model
+        ).inc()
+        ROUTER_DURATION.observe(time.perf_counter() - start)
+
         self._log("info", f"[Router] Final routing decision: {result}")
         return result
\ No newline at end of file
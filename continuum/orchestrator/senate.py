@@ -1,9 +1,13 @@
 #continuum/orchestrator/senate.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sklearn.feature_extraction.text import TfidfVectorizer
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from contextvars import copy_context
 from continuum.persona.topics import detect_topic, TOPIC_ACTOR_WEIGHTS
-from continuum.core.logger import log_info, log_debug, log_error
+from continuum.core.logger import debug_enabled, log_info, log_debug, log_error
+from continuum.core.tracing import span
+from continuum.db.sqlalchemy_connection import releases_session
 
 
 class Senate:
@@ -12,10 +16,22 @@ class Senate:
     computes similarity, and returns ranked proposals.
     """
 
-    def __init__(self, actors: List[Any]):
+    def __init__(self, actors: List[Any], executor: Optional[Executor] = None):
         self.actors = actors
-        log_error("🔥🔥🔥 SENATE.__init__() CALLED 🔥🔥🔥", phase="senate")
-        log_debug(f"[SENATE] Initialized with actors: {[a.name for a in actors]}", phase="senate")
+        # Shared pool (orchestrator.resource_hub); without one, each turn
+        # starts and joins its own
+        self.executor = executor
+        log_debug("🔥🔥🔥 SENATE.__init__() CALLED 🔥🔥🔥", phase="senate")
+        log_debug(
+            "[SENATE] Initialized with actors: %s",
+            [a.name for a in actors],
+            phase="senate",
+        )
+
+    def _turn_executor(self):
+        if self.executor is not None:
+            return nullcontext(self.executor)
+        return ThreadPoolExecutor(max_workers=len(self.actors))
 
     # ---------------------------------------------------------
     # COLLECT PROPOSALS (Phase‑4)
@@ -37,13 +53,13 @@ class Senate:
 
         proposals: List[Dict[str, Any]] = []
 
-        log_error("🔥🔥🔥 ENTERED gather_proposals() 🔥🔥🔥", phase="senate")
+        log_debug("🔥🔥🔥 ENTERED gather_proposals() 🔥🔥🔥", phase="senate")
         log_info("[SENATE] Gathering proposals from actors (parallel mode)", phase="senate")
 
         # ---------------------------------------------------------
         # PARALLEL EXECUTION OF ACTORS
         # ---------------------------------------------------------
-        with ThreadPoolExecutor(max_workers=len(self.actors)) as executor:
+        with self._turn_executor() as executor:
 
             future_map = {}
 
@@ -51,13 +67,23 @@ class Senate:
 
                 # Skip disabled actors
                 if not controller.actor_settings.get(actor.name, {}).get("enabled", True):
-                    log_debug(f"[SENATE] Actor {actor.name} is disabled — skipping", phase="senate")
+                    log_debug(
+                        "[SENATE] Actor %s is disabled — skipping",
+                        actor.name,
+                        phase="senate",
+                    )
                     continue
 
-                log_debug(f"[SENATE] Submitting {actor.name} to executor", phase="senate")
+                log_debug(
+                    "[SENATE] Submitting %s to executor", actor.name, phase="senate"
+                )
 
+                # Each worker runs in a copy of the caller's context so its
+                # spans nest under the current turn trace
                 future = executor.submit(
-                    actor.propose,
+                    copy_context().run,
+                    releases_session(self._traced_propose),
+                    actor,
                     context=context,
                     message=message,
                     controller=controller,
@@ -94,8 +120,13 @@ class Senate:
                             f"Proposal from {actor.name} is not a dict or str: {type(proposal)}"
                         )
 
-                    log_debug(f"[SENATE] Raw proposal from {actor.name}: {proposal}", phase="senate")
-                    log_error(f"[FORENSICS] Senate received proposal type={type(proposal)} value={repr(proposal)}", phase="senate")
+                    if debug_enabled():
+                        log_debug(
+                            "[SENATE] Raw proposal from %s: %r",
+                            actor.name,
+                            proposal,
+                            phase="senate",
+                        )
 
                     # Ensure metadata exists
                     metadata_obj = proposal.get("metadata") or {}
@@ -131,7 +162,11 @@ class Senate:
                         },
                     })
 
-        log_error(f"🔥🔥🔥 gather_proposals() COMPLETE — {len(proposals)} proposals 🔥🔥🔥", phase="senate")
+        log_debug(
+            "🔥🔥🔥 gather_proposals() COMPLETE — %d proposals 🔥🔥🔥",
+            len(proposals),
+            phase="senate",
+        )
         return proposals
     # ---------------------------------------------------------
     # FILTER PROPOSALS
@@ -142,15 +177,26 @@ class Senate:
             if p.get("content") and p.get("confidence", 0) > 0
         ]
 
-        log_debug(f"[SENATE] Filtered proposals: kept {len(filtered)} of {len(proposals)}", phase="senate")
+        log_debug(
+            "[SENATE] Filtered proposals: kept %d of %d",
+            len(filtered),
+            len(proposals),
+            phase="senate",
+        )
         return filtered
 
+    @staticmethod
+    def _traced_propose(actor, **kwargs):
+        with span("actor.propose", actor=actor.name):
+            return actor.propose(**kwargs)
+
     # ---------------------------------------------------------
     # RANK PROPOSALS
     # ---------------------------------------------------------
     def rank_proposals(self, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         ranked = sorted(proposals, key=lambda p: p.get("confidence", 0), reverse=True)
-        log_debug(f"[SENATE] Ranked proposals (top first): {ranked}", phase="senate")
+        if debug_enabled():
+            log_debug("[SENATE] Ranked (top first): %r", ranked, phase="senate")
         return ranked
 
     # ---------------------------------------------------------
@@ -169,7 +215,7 @@ class Senate:
 
         sim_matrix = (tfidf * tfidf.T).toarray()
 
-        log_debug(f"[SENATE] Similarity matrix computed: {sim_matrix}", phase="senate")
+        log_debug("[SENATE] Similarity matrix computed: %s", sim_matrix, phase="senate")
 
         return {
             "actors": actors,
@@ -192,7 +238,7 @@ class Senate:
         telemetry,
     ) -> List[Dict[str, Any]]:
 
-        log_error("🔥🔥🔥 ENTERED Senate.deliberate() 🔥🔥🔥", phase="senate")
+        log_debug("🔥🔥🔥 ENTERED Senate.deliberate() 🔥🔥🔥", phase="senate")
         log_info("[SENATE] Starting Senate.deliberate()", phase="senate")
 
         # ---------------------------------------------------------
@@ -218,7 +264,11 @@ class Senate:
         filtered = self.filter_proposals(proposals)
         controller.context.debug_flags["filtered_proposals"] = filtered
 
-        log_error(f"🔥🔥🔥 FILTERED PROPOSALS COUNT = {len(filtered)} 🔥🔥🔥", phase="senate")
+        log_debug(
+            "🔥🔥🔥 FILTERED PROPOSALS COUNT = %d 🔥🔥🔥",
+            len(filtered),
+            phase="senate",
+        )
 
         # ---------------------------------------------------------
         # 3. Topic detection + topic-aware confidence shaping
@@ -226,8 +276,8 @@ class Senate:
         topic = detect_topic(message)
         topic_weights = TOPIC_ACTOR_WEIGHTS.get(topic, {})
 
-        log_debug(f"[SENATE] Detected topic: {topic}", phase="senate")
-        log_debug(f"[SENATE] Topic weights: {topic_weights}", phase="senate")
+        log_debug("[SENATE] Detected topic: %s", topic, phase="senate")
+        log_debug("[SENATE] Topic weights: %s", topic_weights, phase="senate")
 
         for p in filtered:
             actor = p.get("actor")
@@ -248,7 +298,12 @@ class Senate:
         similarity = self.compute_similarity_matrix(ranked)
         controller.context.debug_flags["similarity_matrix"] = similarity
 
-        log_error(f"🔥🔥🔥 SENATE RETURNING {len(ranked)} RANKED PROPOSALS 🔥🔥🔥", phase="senate")
-        log_debug(f"[SENATE] Final ranked list: {ranked}", phase="senate")
+        log_debug(
+            "🔥🔥🔥 SENATE RETURNING %d RANKED PROPOSALS 🔥🔥🔥",
+            len(ranked),
+            phase="senate",
+        )
+        if debug_enabled():
+            log_debug("[SENATE] Final ranked list: %r", ranked, phase="senate")
 
         return ranked
\ No newline at end of file
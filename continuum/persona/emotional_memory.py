@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional, Any
 from math import sqrt
 from continuum.emotion.emotional_memory_decay import update_emotional_memory
+from continuum.memory.ring_buffer import RingBuffer
 import datetime
 
 
@@ -13,7 +14,7 @@ import datetime
 # EI‑2.0 Emotional Event
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalEvent:
     """
     EI‑2.0 emotional memory event.
@@ -43,7 +44,7 @@ class EmotionalMemory:
     - smoothed_state: exponentially smoothed EI‑2.0 dimensions
     - volatility: magnitude of recent emotional change
     - confidence: inverse of volatility, normalized
-    - events: rolling list of EmotionalEvent objects
+    - events: RingBuffer of the last max_events EmotionalEvent objects
     """
 
     def __init__(
@@ -61,7 +62,7 @@ class EmotionalMemory:
         self.max_confidence = max_confidence
         self.volatility_normalization = volatility_normalization
 
-        self.events: List[EmotionalEvent] = []
+        self.events: RingBuffer[EmotionalEvent] = RingBuffer(max_events)
         self.smoothed_state: Dict[str, float] = {}
         self.previous_smoothed_state: Optional[Dict[str, float]] = None
 
@@ -96,8 +97,6 @@ class EmotionalMemory:
         )
 
         self.events.append(event)
-        if len(self.events) > self.max_events:
-            self.events.pop(0)
 
         self.short_term_emotion = dominant_emotion
 
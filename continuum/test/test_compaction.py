@@ -0,0 +1,57 @@
+# continuum/test/test_compaction.py
+
+import sys
+import threading
+import time
+
+from continuum.memory.compaction import CompactionPolicy, KeyValueTier
+from continuum.memory.continuum_memory import ContinuumMemory
+
+
+def test_key_value_tier_evicts_down_to_max_count():
+    memory = ContinuumMemory()
+    for i in range(20):
+        memory.add(f"note-{i}", f"the user mentioned topic {i}")
+    stats = KeyValueTier(memory, CompactionPolicy(max_count=5)).compact(time.time())
+    assert stats.evicted == 15
+    assert len(memory) == 5
+    assert len(memory.search("topic")) == 5
+
+
+def test_compaction_runs_alongside_search():
+    memory = ContinuumMemory()
+    tier = KeyValueTier(memory, CompactionPolicy(max_count=10))
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            memory.add(f"note-{i}", f"the user mentioned topic {i}")
+            i += 1
+
+    def compactor():
+        while not stop.is_set():
+            try:
+                tier.compact(time.time())
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=compactor)]
+    # Switch threads often so a removal lands mid-search
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    for thread in threads:
+        thread.start()
+    try:
+        deadline = time.time() + 1.0
+        while time.time() < deadline:
+            for query in ("topic", "user mentioned", "?!"):
+                for record in memory.search(query, limit=50):
+                    assert record.key.startswith("note-")
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(interval)
+    assert errors == []
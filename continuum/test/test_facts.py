@@ -0,0 +1,53 @@
+# continuum/test/test_facts.py
+
+import pytest
+
+from continuum.memory.facts import MAX_LIST_ITEMS, extract_facts, remember_facts
+from continuum.memory.memory_store import MemoryStore
+from continuum.memory.semantic import SemanticMemory
+
+
+@pytest.mark.parametrize(
+    "text, facts",
+    [
+        ("My name is Ada.", [("name", "Ada")]),
+        ("I'm 34. I live in Leeds", [("lives in", "Leeds")]),
+        (
+            "I'm 34 years old and I live in Leeds",
+            [("age", "34"), ("lives in", "Leeds")],
+        ),
+        ("I live in Leeds, near the river", [("lives in", "Leeds")]),
+        ("I work as a nurse", [("occupation", "nurse")]),
+        ("My favorite food is green curry", [("favorite food", "green curry")]),
+        ("My dog is named Rex", [("dog's name", "Rex")]),
+        ("I love hiking but hate rain", [("likes", "hiking")]),
+        ("I also really enjoy green tea", [("likes", "green tea")]),
+        ("I don't like mornings", [("dislikes", "mornings")]),
+        ("Do you know where I live in Leeds?", []),
+        ("I like it.", []),
+    ],
+)
+def test_extract_facts(text, facts):
+    assert extract_facts(text) == facts
+
+
+def _memory():
+    return SemanticMemory(store=MemoryStore(), embed_fn=lambda text: [1.0])
+
+
+def test_newer_statement_replaces_the_fact():
+    memory = _memory()
+    remember_facts(memory, "I live in Leeds")
+    assert remember_facts(memory, "I live in Leeds") == []
+    remember_facts(memory, "I live in York now")
+    assert memory.get("lives in") == "York now"
+
+
+def test_likes_accumulate():
+    memory = _memory()
+    remember_facts(memory, "I like tea. I love hiking. I enjoy Tea")
+    assert memory.get("likes") == "tea, hiking"
+
+    for i in range(MAX_LIST_ITEMS):
+        remember_facts(memory, f"I like thing{i}")
+    assert memory.get("likes").split(", ")[0] == "thing0"
@@ -0,0 +1,274 @@
+# continuum/test/test_snapshot.py
+
+import copy
+import zlib
+from types import SimpleNamespace
+
+import pytest
+
+from continuum.core import snapshot
+from continuum.core.context import ContinuumContext
+from continuum.core.snapshot import (
+    CODEC_JSON,
+    CODEC_MSGPACK,
+    HEADER,
+    KIND_DELTA,
+    KIND_FULL,
+    MAGIC,
+    SCHEMA_VERSION,
+    ConversationSnapshotter,
+    SnapshotError,
+    apply,
+    diff,
+    encode_frame,
+    iter_frames,
+    load_state,
+)
+from continuum.memory.episodic import EpisodicMemory
+from continuum.memory.memory_store import MemoryStore
+from continuum.memory.retrieval import MemoryRetriever
+from continuum.memory.semantic import SemanticMemory
+from continuum.memory.summarizer import MemorySummarizer
+from continuum.memory.vector_index import VectorIndex
+
+CODECS = [
+    CODEC_JSON,
+    pytest.param(
+        CODEC_MSGPACK,
+        marks=pytest.mark.skipif(snapshot.msgpack is None, reason="no msgpack"),
+    ),
+]
+
+STATES = [
+    {"a": 1, "b": [1, 2, 3], "c": {"x": "y"}},
+    {"a": 2, "b": [2, 3, 4, 5], "c": {"x": "y", "z": None}},
+    {"a": 2, "b": [5], "c": {"z": [1]}, "d": True},
+    {"b": [], "c": {}},
+    {"b": [[1, {"k": "v"}], [2, {}]], "c": {"z": [1, 2]}},
+    {"b": [[2, {}], [3, {"k": "w"}]], "c": "now a string"},
+]
+
+
+# ---------------------------------------------------------
+# diff / apply / frames
+# ---------------------------------------------------------
+@pytest.mark.parametrize("old", STATES)
+@pytest.mark.parametrize("new", STATES)
+def test_diff_apply_round_trip(old, new):
+    op = diff(old, new)
+    if old == new:
+        assert op is None
+    else:
+        assert apply(copy.deepcopy(old), op) == new
+
+
+def test_diff_sends_only_the_new_tail():
+    old = {"messages": [[i] for i in range(10)]}
+    new = {"messages": [[i] for i in range(3, 12)]}
+    assert diff(old, new) == ["p", {"messages": ["a", 3, [[10], [11]]]}, []]
+
+
+def _log(states, codec):
+    """A snapshot log: the first state in full, then one delta per state."""
+    frames = [encode_frame(KIND_FULL, 0, 0, states[0], codec)]
+    for seq in range(1, len(states)):
+        op = diff(states[seq - 1], states[seq])
+        frames.append(encode_frame(KIND_DELTA, seq, seq - 1, op, codec))
+    return frames
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_full_frame_and_deltas_replay(codec):
+    frames = _log(STATES, codec)
+    kinds = [frame.kind for frame in iter_frames(b"".join(frames))]
+    assert kinds == [KIND_FULL] + [KIND_DELTA] * (len(STATES) - 1)
+
+    state, seq = load_state(b"".join(frames))
+    assert state == STATES[-1]
+    assert seq == len(STATES) - 1
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_torn_tail_is_ignored(codec):
+    frames = _log(STATES, codec)
+    data = b"".join(frames)
+    for cut in (1, HEADER.size - 1, len(frames[-1]) - 1):
+        state, seq = load_state(data[: len(data) - cut])
+        assert seq == len(STATES) - 2
+        assert state == STATES[-2]
+
+
+def test_newer_schema_is_rejected():
+    body = b"{}"
+    frame = HEADER.pack(
+        MAGIC, SCHEMA_VERSION + 1, CODEC_JSON, KIND_FULL, 0, 0, len(body)
+    )
+    with pytest.raises(SnapshotError, match="newer"):
+        list(iter_frames(frame + body))
+
+
+def test_delta_without_its_base_is_rejected():
+    frames = _log(STATES[:3], CODEC_JSON)
+    with pytest.raises(SnapshotError):
+        load_state(frames[0] + frames[2])
+
+
+# ---------------------------------------------------------
+# Snapshotter
+# ---------------------------------------------------------
+def _embed(text):
+    vector = [0.0] * 32
+    for word in text.lower().split():
+        vector[zlib.crc32(word.encode()) % 32] += 1.0
+    return vector
+
+
+def _controller(conversation_id="conv-1"):
+    store = MemoryStore()
+    retriever = MemoryRetriever(embed_fn=_embed)
+    context = ContinuumContext(conversation_id=conversation_id)
+    context.semantic_memory = SemanticMemory(
+        store=store, embed_fn=_embed, retriever=retriever
+    )
+    context.memory_retriever = retriever
+    context.memory_summarizer = MemorySummarizer(store)
+    return SimpleNamespace(
+        context=context,
+        memory_store=store,
+        memory_retriever=retriever,
+        episodic_memory=EpisodicMemory(store=store, retriever=retriever),
+    )
+
+
+def _say(controller, text):
+    controller.context.add("user", text, source="test")
+    controller.episodic_memory.record(controller.context)
+    controller.context.add("assistant", f"noted: {text}")
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_in_place_edit_is_saved(tmp_path, codec):
+    controller = _controller()
+    _say(controller, "hello there")
+    snapshotter = ConversationSnapshotter(
+        controller, directory=str(tmp_path), codec=codec
+    )
+    snapshotter.save()
+
+    controller.context.messages[-1].metadata["edited"] = True
+    assert snapshotter.save() > 0
+
+    restored = _controller()
+    assert ConversationSnapshotter(
+        restored, directory=str(tmp_path), codec=codec
+    ).restore("conv-1")
+    assert restored.context.messages[-1].metadata == {"edited": True}
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_memories_survive_restore(tmp_path, codec):
+    controller = _controller()
+    snapshotter = ConversationSnapshotter(
+        controller, directory=str(tmp_path), codec=codec
+    )
+    for text in ("I adopted a dog named Rex", "the garden needs watering"):
+        _say(controller, text)
+        snapshotter.save()
+    controller.context.semantic_memory.set("pet", "dog named Rex")
+    summary = controller.context.memory_summarizer.summary()
+    snapshotter.save()
+
+    restored = _controller()
+    ConversationSnapshotter(restored, directory=str(tmp_path), codec=codec).restore(
+        "conv-1"
+    )
+    store = restored.memory_store
+    assert [e.content for e in store.episodic] == [
+        e.content for e in controller.memory_store.episodic
+    ]
+    assert store.episodes_added == 2
+    assert store.get_semantic("pet") == "dog named Rex"
+
+    # Recall works without anything being re-recorded
+    hits = restored.memory_retriever.retrieve("how is my dog Rex", k=3)
+    assert {hit.doc_id for hit in hits} >= {"episode:0", "fact:pet"}
+    assert restored.context.semantic_memory.search("dog", k=1)[0][0] == "pet"
+
+    # The summary carries on from where it was, not from scratch
+    summarizer = restored.context.memory_summarizer
+    assert summarizer.summary() == summary
+    _say(restored, "Rex chewed the garden hose")
+    assert "Rex chewed" in summarizer.summary()
+    assert "I adopted a dog" in summarizer.summary()
+
+
+def test_facts_restore_without_an_embedding_model(tmp_path):
+    controller = _controller()
+    controller.context.semantic_memory.set("pet", "dog named Rex")
+    ConversationSnapshotter(controller, directory=str(tmp_path)).save()
+
+    def broken(text):
+        raise RuntimeError("model not available")
+
+    restored = _controller()
+    restored.context.semantic_memory.embed_fn = broken
+    restored.memory_retriever.embed_fn = broken
+    assert ConversationSnapshotter(restored, directory=str(tmp_path)).restore("conv-1")
+    assert restored.memory_store.get_semantic("pet") == "dog named Rex"
+    hits = restored.memory_retriever.retrieve("dog Rex", k=1)
+    assert hits[0].doc_id == "fact:pet"
+
+
+def test_on_disk_vectors_are_reused(tmp_path):
+    def controller():
+        built = _controller()
+        built.memory_retriever.vectors = VectorIndex.open(str(tmp_path / "recall"), 32)
+        return built
+
+    original = controller()
+    _say(original, "I adopted a dog named Rex")
+    ConversationSnapshotter(original, directory=str(tmp_path)).save()
+    # Recorded after the snapshot, so lost with the process
+    _say(original, "the garden needs watering")
+    original.memory_retriever.vectors.close()
+
+    embedded = []
+
+    def counting(text):
+        embedded.append(text)
+        return _embed(text)
+
+    restored = controller()
+    restored.memory_retriever.embed_fn = counting
+    assert ConversationSnapshotter(restored, directory=str(tmp_path)).restore("conv-1")
+    assert embedded == []
+    assert restored.memory_retriever.vectors.ids() == ["episode:0"]
+    hit = restored.memory_retriever.retrieve("dog named Rex", k=1)[0]
+    assert hit.doc_id == "episode:0" and hit.vector_rank == 1
+
+
+def test_conversation_id_with_a_slash(tmp_path):
+    controller = _controller("alice/1")
+    _say(controller, "hello there")
+    snapshotter = ConversationSnapshotter(controller, directory=str(tmp_path))
+    assert snapshotter.save() > 0
+    assert [p.name for p in tmp_path.iterdir()] == ["alice%2F1.snap"]
+    assert ConversationSnapshotter(_controller(), directory=str(tmp_path)).restore(
+        "alice/1"
+    )
+
+
+def test_per_turn_debug_dumps_are_not_saved(tmp_path):
+    controller = _controller()
+    flags = controller.context.debug_flags
+    flags["show_prompts"] = True
+    flags["raw_proposals"] = [{"actor": "a", "text": "x" * 1000}]
+    flags["similarity_matrix"] = [[1.0]]
+
+    state = snapshot.capture(controller)
+    assert state["context"]["debug_flags"] == {"show_prompts": True}
+
+    snapshotter = ConversationSnapshotter(controller, directory=str(tmp_path))
+    snapshotter.save()
+    flags["raw_proposals"] = [{"actor": "b", "text": "y" * 1000}]
+    assert snapshotter.save() == 0
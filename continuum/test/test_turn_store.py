@@ -0,0 +1,24 @@
+# continuum/test/test_turn_store.py
+
+from continuum.core.turn_store import TurnRecord, TurnStore
+
+
+def _fill(store, n):
+    for i in range(n):
+        store.append(TurnRecord(turn_id=f"t{i}", user=f"q{i}", assistant=f"a{i}"))
+
+
+def test_spill_log_stays_in_its_directory(tmp_path):
+    directory = tmp_path / "turns"
+    store = TurnStore("../alice/1", capacity=1, directory=str(directory))
+    _fill(store, 3)
+
+    assert store.spilled == 2
+    assert [p.name for p in directory.iterdir()] == ["..%2Falice%2F1.jsonl"]
+    assert list(tmp_path.iterdir()) == [directory]
+    assert store.get("t0").user == "q0"
+
+    restored = TurnStore("other", directory=str(directory))
+    restored.load_state(store.export_state())
+    assert restored.path == store.path
+    assert restored.get("t1").assistant == "a1"
@@ -1,6 +1,6 @@
 // selector/hybridSelector.ts
 
-Weimport { db } from "../db/client";
+import { db } from "../db/client";
 import { getModelStats } from "../db/modelStats";
 import { getActorPreferences } from "../db/actorPreferences";
 import { getRewriteConfig } from "../db/rewriteConfig";
@@ -0,0 +1,73 @@
+// selector/selectorDaemon.ts
+//
+// Long-running selector process. Speaks newline-delimited JSON over
+// stdin/stdout so the Python side can keep one process (and one warm
+// MySQL pool) alive instead of spawning `node` per selection.
+//
+// Request  (one per line): {"id": 7, "actor": "...", "role": "...",
+//                           "default_model": "...", "tags": [], "complexity": "medium"}
+//                          {"id": 8, "op": "ping"}
+// Response (one per line): {"id": 7, "model": "..."} | {"id": 7, "error": "..."}
+//
+// Requests are handled concurrently; responses may arrive out of order
+// and are matched to requests by id.
+
+import * as readline from "readline";
+import { db } from "../db/client";
+import { selectModel } from "./hybridSelector";
+
+interface SelectorRequest {
+  id: number | string;
+  op?: "select" | "ping";
+  actor: string;
+  role: string;
+  default_model: string;
+  tags?: string[];
+  complexity?: "low" | "medium" | "high";
+}
+
+function reply(payload: object) {
+  process.stdout.write(JSON.stringify(payload) + "\n");
+}
+
+async function handle(req: SelectorRequest) {
+  if (req.op === "ping") {
+    reply({ id: req.id, ok: true });
+    return;
+  }
+
+  try {
+    const model = await selectModel({
+      actor: req.actor,
+      role: req.role,
+      defaultModel: req.default_model,
+      tags: req.tags,
+      complexity: req.complexity
+    });
+    reply({ id: req.id, model });
+  } catch (err: any) {
+    reply({ id: req.id, error: String(err?.message ?? err) });
+  }
+}
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on("line", line => {
+  if (!line.trim()) return;
+
+  let req: SelectorRequest;
+  try {
+    req = JSON.parse(line);
+  } catch (err: any) {
+    reply({ id: null, error: `invalid JSON: ${err?.message ?? err}` });
+    return;
+  }
+
+  void handle(req);
+});
+
+// stdin closed → the Python supervisor is gone or asked us to stop
+rl.on("close", async () => {
+  await db.end();
+  process.exit(0);
+});
@@ -4,16 +4,42 @@ import json
 import subprocess
 from pathlib import Path
 
+from continuum.core.logger import log_error
+from continuum.ts_bridge.selector_daemon import get_selector_daemon
+
 TS_SELECTOR_SCRIPT = (
     Path(__file__).parent
     / ".."
     / "ts"
     / "dist"
     / "selector"
-    / "hybridSelector.cjs"
+    / "hybridSelector.js"
 ).resolve()
 
+
 def select_model(actor: str, role: str, default_model: str, tags=None, complexity=None):
+    """
+    Ask the TypeScript selector which model to use.
+
+    Goes through the long-running selector daemon (one node process,
+    one warm MySQL pool). Falls back to default_model on any failure.
+    """
+    return get_selector_daemon().select_model(
+        actor=actor,
+        role=role,
+        default_model=default_model,
+        tags=tags,
+        complexity=complexity,
+    )
+
+
+def select_model_oneshot(
+    actor: str, role: str, default_model: str, tags=None, complexity=None
+):
+    """
+    Spawn a one-off `node hybridSelector.js` for a single selection.
+    Kept for debugging the selector outside the daemon.
+    """
     payload = json.dumps({
         "actor": actor,
         "role": role,
@@ -22,10 +48,7 @@ def select_model(actor: str, role: str, default_model: str, tags=None, complexit
         "complexity": complexity or "medium"
     })
 
-    script_path = str(TS_SELECTOR_SCRIPT).replace("/", "\\")
-    cmd = ["node", script_path]
-
-    print("RUNNING:", cmd)
+    cmd = ["node", str(TS_SELECTOR_SCRIPT)]
 
     result = subprocess.run(
         cmd,
@@ -36,27 +59,24 @@ def select_model(actor: str, role: str, default_model: str, tags=None, complexit
     )
 
     if result.returncode != 0:
-        print(
-            "Selector error: process failed",
-            {
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-            },
+        log_error(
+            "[SELECTOR] Process failed (rc=%s): %s",
+            result.returncode,
+            result.stderr.strip(),
+            phase="selector",
         )
         return default_model
 
     if not result.stdout.strip():
-        print("Selector error: empty stdout", {"stderr": result.stderr})
+        log_error(f"[SELECTOR] Empty stdout: {result.stderr.strip()}", phase="selector")
         return default_model
 
     try:
         data = json.loads(result.stdout)
     except json.JSONDecodeError as e:
-        print(
-            "Selector error: invalid JSON",
-            {"error": str(e), "stdout": result.stdout, "stderr": result.stderr},
+        log_error(
+            f"[SELECTOR] Invalid JSON: {e} (stdout={result.stdout!r})", phase="selector"
         )
         return default_model
 
-    return data.get("model", default_model)
\ No newline at end of file
+    return data.get("model", default_model)
@@ -0,0 +1,242 @@
+# continuum/ts_bridge/selector_daemon.py
+
+import itertools
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from continuum.core.logger import log_debug, log_error
+
+TS_SELECTOR_DAEMON_SCRIPT = (
+    Path(__file__).parent
+    / ".."
+    / "ts"
+    / "dist"
+    / "selector"
+    / "selectorDaemon.js"
+).resolve()
+
+
+class SelectorDaemonError(RuntimeError):
+    """Raised when the selector daemon cannot answer a request."""
+
+
+class SelectorDaemon:
+    """
+    Supervisor + client for the long-running TypeScript selector.
+
+    - Spawns `node selectorDaemon.js` once and keeps it alive
+    - Speaks newline-delimited JSON over stdin/stdout
+    - Tags every request with an id so many selections can be in
+      flight at once (responses are matched by id, not by order)
+    - Restarts the process with exponential backoff if it exits
+    """
+
+    def __init__(
+        self,
+        script_path: Path = TS_SELECTOR_DAEMON_SCRIPT,
+        node_bin: str = "node",
+        request_timeout: float = 2.0,
+        restart_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.cmd = [node_bin, str(script_path)]
+        self.request_timeout = request_timeout
+        self.restart_backoff = restart_backoff
+        self.max_backoff = max_backoff
+
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()          # guards process lifecycle + stdin
+        self._pending: Dict[int, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        self._stopping = False
+        self._restarts = 0
+        self._next_start_at = 0.0
+
+    # ---------------------------------------------------------
+    # PROCESS LIFECYCLE
+    # ---------------------------------------------------------
+    def start(self) -> None:
+        with self._lock:
+            self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        """Caller must hold self._lock."""
+        if self._proc and self._proc.poll() is None:
+            return
+
+        if self._stopping:
+            raise SelectorDaemonError("selector daemon is stopped")
+
+        now = time.monotonic()
+        if now < self._next_start_at:
+            raise SelectorDaemonError(
+                f"selector daemon restarting in {self._next_start_at - now:.1f}s"
+            )
+
+        try:
+            proc = subprocess.Popen(
+                self.cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as e:
+            self._schedule_restart()
+            raise SelectorDaemonError(f"failed to spawn selector daemon: {e}") from e
+
+        self._proc = proc
+        log_debug(f"[SELECTOR] Daemon started (pid={proc.pid})", phase="selector")
+
+        threading.Thread(target=self._read_stdout, args=(proc,), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(proc,), daemon=True).start()
+
+    def _schedule_restart(self) -> None:
+        delay = min(self.max_backoff, self.restart_backoff * (2 ** self._restarts))
+        self._restarts += 1
+        self._next_start_at = time.monotonic() + delay
+
+    def _on_exit(self, proc: subprocess.Popen) -> None:
+        code = proc.wait()
+
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+                if not self._stopping:
+                    self._schedule_restart()
+
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(
+                    SelectorDaemonError(f"selector daemon exited ({code})")
+                )
+
+        if not self._stopping:
+            log_error(
+                f"[SELECTOR] Daemon exited with code {code}; will restart",
+                phase="selector",
+            )
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopping = True
+            proc, self._proc = self._proc, None
+
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.close()        # daemon closes its DB pool and exits
+                proc.wait(timeout=2.0)
+            except Exception:
+                proc.kill()
+
+    # ---------------------------------------------------------
+    # READERS
+    # ---------------------------------------------------------
+    def _read_stdout(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                msg = json.loads(line)
+            except json.JSONDecodeError:
+                log_error(
+                    f"[SELECTOR] Invalid JSON from daemon: {line!r}", phase="selector"
+                )
+                continue
+
+            with self._pending_lock:
+                fut = self._pending.pop(msg.get("id"), None)
+            if fut is not None and not fut.done():
+                fut.set_result(msg)
+
+        self._on_exit(proc)
+
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for line in proc.stderr:
+            log_debug(f"[SELECTOR] daemon stderr: {line.rstrip()}", phase="selector")
+
+    # ---------------------------------------------------------
+    # REQUESTS
+    # ---------------------------------------------------------
+    def request(
+        self, payload: Dict[str, Any], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        req_id = next(self._ids)
+        fut: Future = Future()
+
+        with self._pending_lock:
+            self._pending[req_id] = fut
+
+        try:
+            with self._lock:
+                self._ensure_running()
+                self._proc.stdin.write(json.dumps({"id": req_id, **payload}) + "\n")
+                self._proc.stdin.flush()
+        except (OSError, ValueError, SelectorDaemonError) as e:
+            with self._pending_lock:
+                self._pending.pop(req_id, None)
+            raise SelectorDaemonError(str(e)) from e
+
+        try:
+            msg = fut.result(timeout=timeout or self.request_timeout)
+        except FutureTimeout:
+            with self._pending_lock:
+                self._pending.pop(req_id, None)
+            raise SelectorDaemonError(f"selector request {req_id} timed out")
+
+        # A healthy round-trip resets the restart backoff
+        self._restarts = 0
+
+        if "error" in msg:
+            raise SelectorDaemonError(msg["error"])
+        return msg
+
+    def ping(self, timeout: Optional[float] = None) -> bool:
+        try:
+            return bool(self.request({"op": "ping"}, timeout=timeout).get("ok"))
+        except SelectorDaemonError:
+            return False
+
+    def select_model(
+        self, actor: str, role: str, default_model: str, tags=None, complexity=None
+    ) -> str:
+        try:
+            msg = self.request({
+                "actor": actor,
+                "role": role,
+                "default_model": default_model,
+                "tags": tags or [],
+                "complexity": complexity or "medium",
+            })
+        except SelectorDaemonError as e:
+            log_error(f"[SELECTOR] Selector error: {e}", phase="selector")
+            return default_model
+
+        return msg.get("model") or default_model
+
+
+# ---------------------------------------------------------
+# Shared daemon (one per process)
+# ---------------------------------------------------------
+_daemon: Optional[SelectorDaemon] = None
+_daemon_lock = threading.Lock()
+
+
+def get_selector_daemon() -> SelectorDaemon:
+    global _daemon
+    with _daemon_lock:
+        if _daemon is None:
+            _daemon = SelectorDaemon()
+        return _daemon
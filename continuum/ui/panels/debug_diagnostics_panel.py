@@ -125,30 +125,74 @@ def render_debug_diagnostics(controller):
     # Turn Timeline
     # ----------------------------------------------------------------------
     with st.expander("Turn Timeline", expanded=False):
-        history = getattr(controller, "turn_history", []) or []
+        store = getattr(controller, "turn_store", None)
 
-        if not history:
+        if store is None or len(store) == 0:
             st.info("No turns recorded yet.")
         else:
-            rows = []
-            for idx, turn in enumerate(history, start=1):
-                emotion = turn.get("emotion", {}) or {}
-                final_proposal = turn.get("final_proposal", {}) or {}
+            page_size = 25
+            pages = store.page_count(page_size)
+            page = 0
+            if pages > 1:
+                page = st.number_input(
+                    f"Page (1–{pages}, newest first)",
+                    min_value=1,
+                    max_value=pages,
+                    value=1,
+                    step=1,
+                    key="diagnostics_turn_page",
+                ) - 1
 
+            rows = []
+            for turn in store.page(page, page_size):
                 rows.append(
                     {
-                        "Turn": idx,
-                        "User": turn.get("user", ""),
-                        "Emotion Label": emotion.get("label", ""),
-                        "Emotion Intensity": emotion.get("intensity", 0.0),
-                        "Winning Actor": final_proposal.get("actor", "unknown"),
-                        "Assistant (Meta‑Persona)": turn.get("assistant", ""),
+                        "Turn": turn.seq + 1,
+                        "User": turn.user,
+                        "Emotion Label": turn.emotion or "",
+                        "Emotion Intensity": turn.intensity,
+                        "Winning Actor": turn.winner or "unknown",
+                        "Model": turn.model or "",
+                        "Assistant (Meta‑Persona)": turn.assistant,
                     }
                 )
 
             df = pd.DataFrame(rows)
             st.dataframe(df, width="stretch")
 
+    # ----------------------------------------------------------------------
+    # Turn Profile (debug_flags["profile_turn"])
+    # ----------------------------------------------------------------------
+    with st.expander("Turn Profile", expanded=False):
+        context = getattr(controller, "context", None)
+
+        if context is not None:
+            pending = context.debug_flags.get("profile_turn", False)
+            if st.button("Profile next turn", disabled=pending):
+                context.debug_flags["profile_turn"] = True
+                pending = True
+            if pending:
+                st.caption("The next message will be profiled.")
+
+        profile = getattr(controller, "last_profile", None)
+
+        if profile is None:
+            st.info("No turn has been profiled yet.")
+        else:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Turn", profile.turn_id[:12])
+            col2.metric("Duration", f"{profile.duration_ms:.0f} ms")
+            col3.metric("Mode", profile.mode)
+
+            for kind, path in profile.files.items():
+                st.write(f"**{kind}:** `{path}`")
+
+            if profile.top_self:
+                st.subheader("Top Self-Time Functions")
+                df = pd.DataFrame(profile.top_self)
+                df.columns = ["Function", "Self (ms)", "Share (%)"]
+                st.dataframe(df, width="stretch")
+
     # ----------------------------------------------------------------------
     # Controller Flow / Tool Logs
     # ----------------------------------------------------------------------
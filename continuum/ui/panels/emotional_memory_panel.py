@@ -1,6 +1,8 @@
 # continuum/ui/panels/emotional_memory_panel.py
 # version EI‑2.0
 
+from dataclasses import asdict
+
 import streamlit as st
 
 def render_emotional_memory(controller):
@@ -40,7 +42,7 @@ def render_emotional_memory(controller):
 
     # Raw events
     with st.expander("Raw Emotional Events (debug)"):
-        st.json([e.__dict__ for e in memory.events])
+        st.json([asdict(e) for e in memory.events])
 
     # Reset button
     if st.button("Reset Emotional Memory"):
@@ -31,8 +31,13 @@ def render_memory(controller):
     # Memory search
     st.subheader("Search Memory")
     query = st.text_input("Search for…", key="memory_search_sidebar")
+    stats = memory.index_stats()
+    st.caption(
+        f"Index: {stats['documents']} memories, {stats['terms']} terms, "
+        f"{stats['postings']} postings (~{stats['bytes'] / 1024:.0f} KiB)"
+    )
     if query:
-        results = memory.search(query)
+        results = memory.search(query, limit=25)
         if results:
             for r in results:
                 with st.expander(f"Match: {r.key}"):
@@ -1,40 +1,58 @@
 import streamlit as st
 
+PAGE_SIZE = 10
+
+
 def render_turn_timeline(controller):
-    turns = controller.turn_history
+    store = getattr(controller, "turn_store", None)
 
-    if not turns:
+    if store is None or len(store) == 0:
         st.info("No turns recorded yet.")
         return
 
-    for i, turn in enumerate(turns, start=1):
-        st.markdown(f"### Turn {i}")
+    # Page lazily through the store (newest first); only the visible
+    # page is materialized, older pages are read from the spill log
+    pages = store.page_count(PAGE_SIZE)
+    page = 0
+    if pages > 1:
+        page = st.number_input(
+            f"Page (1–{pages}, newest first)",
+            min_value=1,
+            max_value=pages,
+            value=1,
+            step=1,
+            key="turn_timeline_page",
+        ) - 1
+    st.caption(f"{len(store)} turns ({store.spilled} on disk)")
+
+    for turn in store.page(page, PAGE_SIZE):
+        st.markdown(f"### Turn {turn.seq + 1}")
         st.markdown("---")
 
         # User message
         st.write("**User Message:**")
-        st.info(turn["user"])
+        st.info(turn.user)
 
-        # Emotion (safe display)
+        # Emotion
         st.write("**Detected Emotion:**")
-        emotion = turn.get("emotion", {})
-        if isinstance(emotion, dict):
-            st.write(f"- Label: `{emotion.get('label', 'N/A')}`")
-            st.write(f"- Intensity: `{emotion.get('intensity', 0):.3f}`")
-        else:
-            st.write(emotion)
+        st.write(f"- Label: `{turn.emotion or 'N/A'}`")
+        st.write(f"- Intensity: `{turn.intensity:.3f}`")
 
         # Winning actor
-        final = turn.get("final_proposal", {})
-        actor = final.get("actor", "Unknown")
-        st.write(f"**Winning Actor:** `{actor}`")
+        st.write(f"**Winning Actor:** `{turn.winner or 'Unknown'}`")
 
         # Jury score
-        if "confidence" in final:
-            st.write(f"**Jury Score:** {final['confidence']:.3f}")
+        if turn.confidence is not None:
+            st.write(f"**Jury Score:** {turn.confidence:.3f}")
+
+        # Routing
+        if turn.model:
+            st.write(
+                f"**Routing:** intent `{turn.intent}` → `{turn.model}` on `{turn.node}`"
+            )
 
         # Assistant response
         st.write("**Assistant Response:**")
-        st.success(turn.get("assistant", ""))
+        st.success(turn.assistant)
 
-        st.markdown("---")
\ No newline at end of file
+        st.markdown("---")
@@ -1,7 +1,7 @@
 # continuum/ui/streamlit_app.py
 
 import streamlit as st
-from continuum.orchestrator.continuum_controller import ContinuumController
+from continuum.orchestrator.resource_hub import get_session_manager
 
 # Panels
 from continuum.ui.panels.chat_panel import render_chat
@@ -31,8 +31,13 @@ from continuum.ui.panels.emotioinal_arc_panel import render_emotional_arc_panel
 # ---------------------------------------------------------
 # Controller Builder
 # ---------------------------------------------------------
-def build_controller():
-    return ContinuumController()
+def build_controller(session_id=None):
+    """
+    This browser session's controller. Heavy resources (models, registry,
+    HTTP pool) are shared process-wide; sessions idle for a while are
+    snapshotted and restored here on their next rerun.
+    """
+    return get_session_manager().get(session_id)
 
 
 # ---------------------------------------------------------
@@ -45,11 +50,9 @@ def main():
         layout="wide",
     )
 
-    # Session state initialization
-    if "controller" not in st.session_state:
-        st.session_state.controller = build_controller()
-
-    controller = st.session_state.controller
+    # Session state initialization (only the id is kept per browser session)
+    controller = build_controller(st.session_state.get("session_id"))
+    st.session_state.session_id = controller.context.conversation_id
 
     apply_theme(controller)
 
@@ -83,6 +86,7 @@ def main():
         # Clear Conversation Button
         if st.button("Clear Conversation"):
             controller.context.messages = []
+            controller.turn_store.clear()
             controller.emotional_memory.reset()
             st.rerun()
 